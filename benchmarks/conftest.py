@@ -0,0 +1,89 @@
+"""Synthetic payloads and regression thresholds for the rendering benchmarks"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# Multiplier applied to every threshold, for slower CI runners
+THRESHOLD_SCALE = float(os.environ.get("BENCH_THRESHOLD_SCALE", "1.0"))
+
+# Mixed-script content so UTF-8 encoding and slicing costs show up
+UNICODE_SENTENCE = "Sekha keeps 記憶 across sessions — мемори, ذاكرة, and 🧠 context. "
+
+CONVERSATION_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def make_messages(count: int, content_chars: int = 400) -> list[dict]:
+    """Alternating user/assistant messages with timestamps and unicode content"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    content = (UNICODE_SENTENCE * (content_chars // len(UNICODE_SENTENCE) + 1))[:content_chars]
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"{i}: {content}",
+            "timestamp": (base + timedelta(seconds=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def make_conversation(message_count: int, content_chars: int = 400) -> dict:
+    """A controller get_context payload"""
+    return {
+        "conversation_id": CONVERSATION_ID,
+        "label": "Benchmark conversation",
+        "folder": "/bench",
+        "status": "active",
+        "importance_score": 7,
+        "created_at": "2025-01-01T00:00:00Z",
+        "word_count": message_count * content_chars // 6,
+        "session_count": 1,
+        "messages": make_messages(message_count, content_chars),
+    }
+
+
+def make_hits(count: int, content_chars: int = 2000) -> list[dict]:
+    """Search results with long unicode content"""
+    content = (UNICODE_SENTENCE * (content_chars // len(UNICODE_SENTENCE) + 1))[:content_chars]
+    return [
+        {
+            "conversation_id": f"{i:08x}-0000-0000-0000-000000000000",
+            "label": f"Hit {i} — 検索結果",
+            "folder": "/bench/search",
+            "similarity": 1.0 - i / (count + 1),
+            "importance_score": i % 10,
+            "created_at": f"2025-01-{i % 28 + 1:02d}T00:00:00Z",
+            "content": content,
+        }
+        for i in range(count)
+    ]
+
+
+def make_suggestions(count: int) -> list[dict]:
+    """Prune suggestions"""
+    return [
+        {
+            "conversation_id": f"{i:08x}-0000-0000-0000-000000000000",
+            "label": f"Old conversation {i} — 古い",
+            "age_days": 30 + i,
+            "importance_score": i % 4,
+            "reason": "Old and rarely accessed; importance below threshold",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def within():
+    """Assert a benchmark's mean time stays under a threshold in seconds"""
+
+    def check(benchmark, seconds: float) -> None:
+        stats = getattr(benchmark, "stats", None)
+        if stats is None:  # --benchmark-disable
+            return
+        limit = seconds * THRESHOLD_SCALE
+        mean = stats.stats.mean
+        assert mean <= limit, f"mean {mean * 1000:.3f}ms exceeds threshold {limit * 1000:.3f}ms"
+
+    return check
@@ -0,0 +1,303 @@
+"""Load generator driving the Sekha MCP server over stdio
+
+Starts a fake controller (``python -m sekha_mcp.testing``) on a local port,
+spawns ``python -m sekha_mcp.server`` as an MCP stdio server pointed at it,
+and replays a weighted mix of tool calls from concurrent workers. Reports
+throughput, per-tool p50/p95/p99 latency and the server process's CPU time
+and RSS, and writes the results as JSON for comparison across commits.
+
+Usage:
+    python benchmarks/loadgen.py --requests 2000 --concurrency 8 \\
+        --mix memory_store=1,memory_search=3,memory_get_context=2 \\
+        --output bench-results.json
+
+The server only implements the stdio transport, so that is the only one
+exercised here.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from mcp import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+
+from sekha_mcp.testing import FakeController
+
+DEFAULT_MIX = "memory_store=1,memory_search=3,memory_get_context=2"
+SEARCH_TERMS = ["memory", "rust", "python", "vector", "search", "agent", "context", "folder"]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (0 for an empty list)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse 'tool=weight,...' into a weight mapping"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def proc_usage(pid: int) -> dict[str, float]:
+    """CPU seconds and RSS of a process from /proc (Linux only; empty elsewhere)"""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        status = Path(f"/proc/{pid}/status").read_text().splitlines()
+    except OSError:
+        return {}
+
+    ticks = os.sysconf("SC_CLK_TCK")
+    usage = {"cpu_seconds": (int(stat[11]) + int(stat[12])) / ticks}
+    for line in status:
+        key, _, value = line.partition(":")
+        if key in ("VmRSS", "VmHWM"):
+            usage[f"{key.lower()}_mb"] = int(value.split()[0]) / 1024
+    return usage
+
+
+def find_server_pid() -> int | None:
+    """Locate the MCP server child process spawned by stdio_client"""
+    me = os.getpid()
+    for entry in Path("/proc").glob("[0-9]*"):
+        try:
+            ppid = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+            cmdline = (entry / "cmdline").read_bytes()
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == me and b"sekha_mcp.server" in cmdline:
+            return int(entry.name)
+    return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_dataset(path: Path, count: int, messages: int, seed: int) -> list[str]:
+    """Write a synthetic NDJSON dataset and return its conversation ids"""
+    controller = FakeController(seed=seed)
+    ids = controller.generate_dataset(count, messages_per_conversation=messages)
+    with path.open("w", encoding="utf-8") as f:
+        for conv in controller.conversations.values():
+            f.write(json.dumps(conv) + "\n")
+    return ids
+
+
+def start_controller(args: argparse.Namespace, dataset: Path, port: int) -> subprocess.Popen:
+    """Start the fake controller and wait until /health answers"""
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "sekha_mcp.testing",
+            "--port",
+            str(port),
+            "--dataset",
+            str(dataset),
+            "--latency",
+            args.latency,
+            "--latency-ms",
+            str(args.latency_ms),
+            "--jitter-ms",
+            str(args.jitter_ms),
+            "--error-rate",
+            str(args.error_rate),
+            "--seed",
+            str(args.seed),
+        ]
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("Fake controller did not start")
+
+
+def make_arguments(tool: str, rng: random.Random, ids: list[str], args) -> dict[str, Any]:
+    """Build arguments for one call of the given tool"""
+    if tool == "memory_store":
+        return {
+            "label": f"Load test {rng.randrange(1_000_000)}",
+            "folder": "/bench/load",
+            "messages": [
+                {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+                for i in range(args.store_messages)
+            ],
+        }
+    if tool == "memory_search":
+        return {"query": " ".join(rng.sample(SEARCH_TERMS, 2)), "limit": 10}
+    if tool == "memory_get_context":
+        return {"conversation_id": rng.choice(ids)}
+    if tool == "memory_stats":
+        return {}
+    raise ValueError(f"Unsupported tool in mix: {tool}")
+
+
+async def run_load(args: argparse.Namespace, ids: list[str], port: int) -> dict[str, Any]:
+    """Replay the configured mix against a stdio server and collect measurements"""
+    mix = parse_mix(args.mix)
+    tools, weights = list(mix), list(mix.values())
+    server = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "sekha_mcp.server"],
+        env={"CONTROLLER_URL": f"http://127.0.0.1:{port}", "LOG_LEVEL": "WARNING"},
+    )
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    remaining = args.requests
+
+    async with stdio_client(server) as (read, write), ClientSession(read, write) as session:
+        await session.initialize()
+        pid = find_server_pid()
+
+        for _ in range(args.warmup):
+            await session.call_tool("memory_search", {"query": "warmup"})
+
+        before = proc_usage(pid) if pid else {}
+
+        async def worker(worker_id: int) -> None:
+            nonlocal remaining
+            rng = random.Random(args.seed + worker_id)
+            while remaining > 0:
+                remaining -= 1
+                tool = rng.choices(tools, weights)[0]
+                arguments = make_arguments(tool, rng, ids, args)
+                started = time.perf_counter()
+                result = await session.call_tool(tool, arguments)
+                latencies[tool].append((time.perf_counter() - started) * 1000)
+                text = result.content[0].text if result.content else ""
+                if result.isError or text.startswith("❌"):
+                    errors[tool] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        after = proc_usage(pid) if pid else {}
+
+    total = sum(len(samples) for samples in latencies.values())
+    server_usage: dict[str, float] = {}
+    if before and after:
+        cpu = after["cpu_seconds"] - before["cpu_seconds"]
+        server_usage = {
+            "cpu_seconds": round(cpu, 3),
+            "cpu_percent": round(100 * cpu / elapsed, 1),
+            "rss_mb": round(after.get("vmrss_mb", 0.0), 1),
+            "rss_peak_mb": round(after.get("vmhwm_mb", 0.0), 1),
+        }
+
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "total_requests": total,
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "tools": {
+            tool: {
+                "count": len(samples),
+                "errors": errors[tool],
+                "mean_ms": round(sum(samples) / len(samples), 3),
+                "p50_ms": round(percentile(samples, 50), 3),
+                "p95_ms": round(percentile(samples, 95), 3),
+                "p99_ms": round(percentile(samples, 99), 3),
+            }
+            for tool, samples in sorted(latencies.items())
+        },
+        "server": server_usage,
+    }
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000, help="Total tool calls")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed warmup calls")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted tool mix")
+    parser.add_argument("--conversations", type=int, default=200, help="Dataset size")
+    parser.add_argument("--messages", type=int, default=20, help="Messages per conversation")
+    parser.add_argument("--store-messages", type=int, default=10, help="Messages per store")
+    parser.add_argument("--latency", default="constant", help="Controller latency model")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench-results.json", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset = Path(tmp) / "dataset.ndjson"
+        ids = write_dataset(dataset, args.conversations, args.messages, args.seed)
+        controller = start_controller(args, dataset, port)
+        try:
+            measurements = asyncio.run(run_load(args, ids, port))
+        finally:
+            controller.terminate()
+            controller.wait(timeout=10)
+
+    report = {
+        "benchmark": "stdio_load",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        **measurements,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(
+        f"{report['total_requests']} calls in {report['elapsed_seconds']}s "
+        f"({report['throughput_rps']} req/s)"
+    )
+    for tool, stats in report["tools"].items():
+        print(
+            f"  {tool:<20} n={stats['count']:<6} p50={stats['p50_ms']:.2f}ms "
+            f"p95={stats['p95_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms errors={stats['errors']}"
+        )
+    if report["server"]:
+        print(
+            f"  server cpu={report['server']['cpu_percent']}% "
+            f"rss_peak={report['server']['rss_peak_mb']}MB"
+        )
+    print(f"Results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
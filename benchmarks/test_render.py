@@ -0,0 +1,97 @@
+"""Micro-benchmarks for the tool output renderers
+
+Run with:
+    pytest benchmarks --no-cov -p no:cacheprovider
+
+Each case fails if its mean time exceeds the threshold next to it; scale all
+thresholds with BENCH_THRESHOLD_SCALE on slower machines.
+"""
+
+import pytest
+from conftest import make_conversation, make_hits, make_suggestions
+
+from sekha_mcp.models import ContextInput
+from sekha_mcp.tools.memory_export import _export_to_json, _export_to_markdown
+from sekha_mcp.tools.memory_get_context import render_context
+from sekha_mcp.tools.memory_prune import render_prune
+from sekha_mcp.tools.memory_search import render_hits
+
+CONVERSATION_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+# (message count, threshold in seconds)
+CONTEXT_SIZES = [(10, 0.0005), (1_000, 0.01), (100_000, 1.5)]
+
+# (hit count, threshold in seconds)
+HIT_SIZES = [(1, 0.0002), (10, 0.001), (100, 0.01)]
+
+
+@pytest.mark.parametrize("count,threshold", CONTEXT_SIZES)
+def test_render_context(benchmark, within, count, threshold):
+    data = make_conversation(count)
+    context_input = ContextInput(conversation_id=CONVERSATION_ID)
+
+    text = benchmark(render_context, data, context_input)
+
+    assert f"Messages: {count}" in text
+    within(benchmark, threshold)
+
+
+@pytest.mark.parametrize("count,threshold", CONTEXT_SIZES)
+def test_render_context_with_budget(benchmark, within, count, threshold):
+    data = make_conversation(count)
+    context_input = ContextInput(conversation_id=CONVERSATION_ID, max_tokens=4000)
+
+    text = benchmark(render_context, data, context_input)
+
+    assert "Benchmark conversation" in text
+    within(benchmark, threshold * 2)
+
+
+@pytest.mark.parametrize("count,threshold", HIT_SIZES)
+def test_render_hits(benchmark, within, count, threshold):
+    results = make_hits(count)
+
+    blocks = benchmark(render_hits, results)
+
+    assert len(blocks) == count
+    within(benchmark, threshold)
+
+
+@pytest.mark.parametrize("count,threshold", HIT_SIZES)
+def test_render_hits_with_budget(benchmark, within, count, threshold):
+    results = make_hits(count)
+
+    blocks = benchmark(render_hits, results, 0, 2000)
+
+    assert blocks
+    within(benchmark, threshold * 3)
+
+
+@pytest.mark.parametrize("count,threshold", [(1, 0.0001), (100, 0.002), (10_000, 0.2)])
+def test_render_prune(benchmark, within, count, threshold):
+    suggestions = make_suggestions(count)
+
+    text = benchmark(render_prune, suggestions)
+
+    assert f"Found {count} conversation" in text
+    within(benchmark, threshold)
+
+
+@pytest.mark.parametrize("count,threshold", CONTEXT_SIZES)
+def test_export_markdown(benchmark, within, count, threshold):
+    data = make_conversation(count)
+
+    text = benchmark(_export_to_markdown, data, True)
+
+    assert text.startswith("# Benchmark conversation")
+    within(benchmark, threshold)
+
+
+@pytest.mark.parametrize("count,threshold", CONTEXT_SIZES)
+def test_export_json(benchmark, within, count, threshold):
+    data = make_conversation(count)
+
+    text = benchmark(_export_to_json, data, True)
+
+    assert CONVERSATION_ID in text
+    within(benchmark, threshold * 4)
@@ -15,6 +15,16 @@ case $TEST_TYPE in
     echo "Running unit tests..."
     pytest tests/ -v
     ;;
+  "perf")
+    echo "⏱️  Running performance gate..."
+    python scripts/perf_gate.py "${@:2}"
+    ;;
+  "bench")
+    echo "📈 Running rendering benchmarks..."
+    pytest benchmarks --no-cov -p no:cacheprovider
+    echo "📈 Running stdio load benchmark..."
+    python benchmarks/loadgen.py "${@:2}"
+    ;;
   "all"|*)
     echo "Running linting and all tests..."
     ruff check .
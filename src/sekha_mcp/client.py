@@ -1,19 +1,45 @@
 """HTTP client for Sekha Controller API"""
 
+import asyncio
+import hashlib
+import json
 import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from typing import Any, cast
 
 import httpx
 
+from . import compression
+from .cache import TTLCache
+from .cold_storage import ColdStore, archive_record, open_cold_store, window_context
+from .concurrency import gather_bounded
 from .config import settings
+from .disk_cache import DiskCache, open_disk_cache
+from .known_ids import KnownIds
+from .lexical import LexicalIndex, open_lexical_index
+from .prefetch import Prefetcher
+from .stats_cache import StatsCache
+from .timing import record_cache, record_request, record_retry
 
 logger = logging.getLogger(__name__)
 
+# Disk cache generation bumped by every write, since any write can change search results
+SEARCH_GENERATION = "search"
+
 
 class SekhaClient:
     """Client for interacting with Sekha Controller (Rust core)"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: DiskCache | None = None,
+        index: LexicalIndex | None = None,
+        cold: ColdStore | None = None,
+    ) -> None:
         self.base_url = settings.controller_url
         self.api_key = settings.controller_api_key
         self.timeout = settings.request_timeout
@@ -21,45 +47,388 @@ class SekhaClient:
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": compression.ACCEPT_ENCODING,
         }
         self.controller_url = settings.controller_url
+        # Custom transport (e.g. httpx.ASGITransport over a fake controller)
+        self.transport = transport
+        # Long-lived connection pool shared by every controller request (see http())
+        self._pool: httpx.AsyncClient | None = None
+        self._pool_owner: tuple[asyncio.AbstractEventLoop, Any] | None = None
+        # Optional persistent read-through cache for contexts and search results
+        self.cache = cache
+        # Optional local lexical index fed by stored and fetched conversations
+        self.index = index
+        # Optional local tier holding conversations offloaded from the controller
+        self.cold = cold
+        # Content hash -> store response data for recently stored conversations, plus the
+        # reverse mapping so deleting a conversation also forgets its hash
+        self.stored_hashes = TTLCache(
+            maxsize=settings.store_dedup_max_entries, ttl=settings.store_dedup_ttl
+        )
+        self._stored_keys = TTLCache(
+            maxsize=settings.store_dedup_max_entries, ttl=settings.store_dedup_ttl
+        )
+        # Append-mode sessions: key -> {conversation_id, count, digest} of persisted messages
+        self.sessions = TTLCache(maxsize=settings.append_sessions_max_entries)
+        # Cleared when the controller turns out to have no append endpoint
+        self.append_supported = True
+        # Background fetches of the contexts behind top search hits (off when top_n is 0)
+        self.prefetch = Prefetcher(
+            self._fetch_context,
+            top_n=settings.prefetch_top_n,
+            min_similarity=settings.prefetch_min_similarity,
+            max_inflight=settings.prefetch_max_inflight,
+            ttl=settings.prefetch_ttl,
+            maxsize=settings.prefetch_max_entries,
+        )
+        # Ids answered "not found" locally: a negative cache and an optional Bloom filter
+        self.known = KnownIds(
+            self.iter_conversation_ids if settings.known_ids_filter_enabled else None,
+            not_found_ttl=settings.not_found_cache_ttl,
+            max_entries=settings.not_found_cache_max_entries,
+            error_rate=settings.known_ids_false_positive_rate,
+            refresh_interval=settings.known_ids_refresh_interval,
+        )
+        # Stale-while-revalidate cache in front of /api/v1/stats
+        self.stats = StatsCache(
+            self._fetch_stats, settings.stats_cache_ttl, settings.stats_cache_max_stale
+        )
+
+    def http(self) -> httpx.AsyncClient:
+        """
+        The connection pool shared by controller requests and health probes.
+
+        A pool is bound to the event loop and transport it was opened with, so a
+        new one is opened when either changes (each asyncio.run, or a test
+        swapping the transport); the old one is dropped without a close, since
+        its loop may already be gone.
+        """
+        owner = (asyncio.get_running_loop(), self.transport)
+        if self._pool is None or self._pool.is_closed or self._pool_owner != owner:
+            self._pool = httpx.AsyncClient(timeout=self.timeout, transport=self.transport)
+            self._pool_owner = owner
+        return self._pool
+
+    async def aclose(self) -> None:
+        """Close the connection pool (a later request opens a new one)"""
+        if self._pool is not None:
+            await self._pool.aclose()
+            self._pool = self._pool_owner = None
+
+    async def _post(
+        self, path: str, payload: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """POST a JSON payload to the controller and return the decoded response"""
+        headers = {**self.headers, **headers} if headers else self.headers
+        url = f"{self.base_url}{path}"
+        encoded = compression.encode_body(payload)
+
+        started = time.perf_counter()
+        try:
+            if encoded is None:
+                response = await self.http().post(url, headers=headers, json=payload)
+            else:
+                body, encoding = encoded
+                response = await self.http().post(
+                    url, headers={**headers, "Content-Encoding": encoding}, content=body
+                )
+                if response.status_code == 415:
+                    # The controller cannot decode this encoding; resend as plain JSON
+                    compression.reject(encoding)
+                    record_retry()
+                    response = await self.http().post(url, headers=headers, json=payload)
+            compression.record_response(response)
+            response.raise_for_status()
+            return cast(dict[str, Any], response.json())
+        finally:
+            record_request(path, time.perf_counter() - started)
 
-    async def store_conversation(self, conversation: dict[str, Any]) -> dict[str, Any]:
-        """Store a new conversation"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/mcp/tools/memory_store", json=conversation, headers=self.headers
+    async def _get(self, path: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+        """GET a controller endpoint and return the decoded response"""
+        started = time.perf_counter()
+        try:
+            response = await self.http().get(
+                f"{self.controller_url}{path}", headers=self.headers, params=params
             )
+            compression.record_response(response)
             response.raise_for_status()
             return cast(dict[str, Any], response.json())
+        finally:
+            record_request(path, time.perf_counter() - started)
+
+    async def _delete(self, path: str) -> dict[str, Any]:
+        """DELETE a controller resource and return the decoded response"""
+        started = time.perf_counter()
+        try:
+            response = await self.http().delete(f"{self.base_url}{path}", headers=self.headers)
+            compression.record_response(response)
+            response.raise_for_status()
+            return cast(dict[str, Any], response.json())
+        finally:
+            record_request(path, time.perf_counter() - started)
+
+    async def _cached_post(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        ttl: float,
+        tag: str | None = None,
+        versioned: bool = False,
+    ) -> dict[str, Any]:
+        """POST through the disk cache, storing successful responses for `ttl` seconds"""
+        if self.cache is None:
+            return await self._post(path, payload)
+
+        key = self._cache_namespace() + path
+        key += json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        generation = 0
+        try:
+            generation = self.cache.generation(SEARCH_GENERATION) if versioned else 0
+            cached = self.cache.get(key, generation)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            record_cache("hit")
+            return cast(dict[str, Any], cached)
+
+        record_cache("miss")
+        result = await self._post(path, payload)
+        if result.get("success"):
+            try:
+                self.cache.set(key, result, ttl, tag=tag, generation=generation)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache write failed: {e}")
+        return result
+
+    def _cache_namespace(self) -> str:
+        """Disk cache key prefix separating controllers and API keys sharing the database"""
+        key_digest = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+        return f"{self.base_url}#{key_digest}:"
+
+    def _invalidate(self, conversation_id: str | None = None, stats: bool = True) -> None:
+        """Drop cached data a successful write may have made stale"""
+        if stats:
+            self.stats.invalidate()
+        self.prefetch.invalidate(conversation_id)
+        if self.cache is None:
+            return
+        try:
+            self.cache.bump(SEARCH_GENERATION)
+            if conversation_id:
+                self.cache.invalidate_tag(conversation_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache invalidation failed: {e}")
+
+    def _check_known(self, conversation_id: str, method: str, path: str) -> None:
+        """Raise the controller's 404 locally for ids known not to exist upstream"""
+        if self.known.rejects(conversation_id):
+            record_cache("negative")
+            request = httpx.Request(method, f"{self.base_url}{path}")
+            response = httpx.Response(
+                404, json={"success": False, "error": "Conversation not found"}, request=request
+            )
+            raise httpx.HTTPStatusError(
+                f"Client error '404 Not Found' for url '{request.url}'",
+                request=request,
+                response=response,
+            )
+
+    @contextmanager
+    def _tracking_missing(self, conversation_id: str) -> Iterator[None]:
+        """Remember ids the controller answers 404 for"""
+        try:
+            yield
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self.known.not_found(conversation_id)
+                self.forget_stored(conversation_id)
+            raise
+
+    def remember_stored(self, key: str, data: dict[str, Any]) -> None:
+        """Record the store response for a content hash so identical stores are answered locally"""
+        self.stored_hashes.set(key, data)
+        self._stored_keys.set(data["conversation_id"], key)
+
+    def forget_stored(self, conversation_id: str) -> None:
+        """Drop the content hash of a conversation that no longer exists upstream"""
+        key = self._stored_keys.pop(conversation_id)
+        if key is not None:
+            self.stored_hashes.pop(key)
+
+    async def store_conversation(
+        self, conversation: dict[str, Any], idempotency_key: str | None = None
+    ) -> dict[str, Any]:
+        """Store a new conversation, letting the controller collapse retries by key"""
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        result = await self._post("/mcp/tools/memory_store", conversation, headers)
+        if result.get("success"):
+            self._invalidate(stats=False)
+            self.stats.record_store(conversation.get("folder"))
+            if result.get("data", {}).get("conversation_id"):
+                self.known.add(result["data"]["conversation_id"])
+            if self.index is not None and result.get("data", {}).get("conversation_id"):
+                self._index_conversation(
+                    {**conversation, "conversation_id": result["data"]["conversation_id"]}
+                )
+        return result
+
+    async def append_messages(
+        self, conversation_id: str, messages: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Append messages to an existing conversation
+
+        A 404 may mean the conversation or the endpoint is missing, so it is
+        not recorded as a missing id here; see `_conversation_exists`.
+        """
+        path = "/mcp/tools/memory_append"
+        self._check_known(conversation_id, "POST", path)
+        result = await self._post(path, {"conversation_id": conversation_id, "messages": messages})
+        if result.get("success"):
+            self._invalidate(conversation_id)
+        return result
+
+    async def store_incremental(
+        self,
+        conversation: dict[str, Any],
+        session_key: str | None = None,
+        conversation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Persist a growing transcript, sending only messages the controller lacks.
+
+        `conversation["messages"]` is the full transcript so far. When the
+        session (or conversation) is known and its persisted messages are an
+        unchanged prefix of the transcript, only the rest is appended.
+        Otherwise the whole conversation is stored as new. The response data
+        gains `mode` ('append', 'unchanged' or 'full') and `appended`.
+
+        On a controller without the append endpoint, append mode is switched
+        off for this client: a grown transcript is stored in full and the copy
+        it supersedes is deleted (reported as `replaced`), so checkpoints do
+        not pile up copies of the conversation.
+        """
+        messages = conversation["messages"]
+        key = session_key or conversation_id
+        state = self.sessions.get(key)
+        if state is None and conversation_id:
+            state = await self._session_from_controller(conversation_id)
+
+        replaced = None
+        if state is not None:
+            count = state["count"]
+            if len(messages) >= count and _messages_digest(messages[:count]) == state["digest"]:
+                new = messages[count:]
+                if not new:
+                    return _incremental_result(state["conversation_id"], count, 0, "unchanged")
+                if self.append_supported:
+                    try:
+                        result = await self.append_messages(state["conversation_id"], new)
+                    except httpx.HTTPStatusError as e:
+                        if e.response.status_code != 404:
+                            raise
+                        await self._append_target_missing(state["conversation_id"])
+                    else:
+                        if not result.get("success"):
+                            return result
+                        self._remember(key, state["conversation_id"], messages)
+                        if self.index is not None:
+                            self._index_conversation(
+                                {**conversation, "conversation_id": state["conversation_id"]}
+                            )
+                        return _incremental_result(
+                            state["conversation_id"], len(messages), len(new), "append"
+                        )
+                if not self.append_supported:
+                    replaced = state["conversation_id"]
+
+        result = await self.store_conversation(conversation)
+        data = result.get("data") or {}
+        if result.get("success") and data.get("conversation_id"):
+            self._remember(key, data["conversation_id"], messages)
+            result["data"] = {**data, "mode": "full", "appended": len(messages)}
+            if replaced is not None and replaced != data["conversation_id"]:
+                await self._drop_superseded(replaced)
+                # Checkpoints naming the old id carry on from the new copy
+                self.sessions.set(replaced, self.sessions.get(data["conversation_id"]))
+                result["data"]["replaced"] = replaced
+        return result
+
+    async def _append_target_missing(self, conversation_id: str) -> None:
+        """Tell an append 404 for a missing conversation from a missing endpoint"""
+        try:
+            await self._post("/mcp/tools/memory_get_context", {"conversation_id": conversation_id})
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            logger.info(f"Append target {conversation_id} gone, storing in full")
+            self.known.not_found(conversation_id)
+            self.forget_stored(conversation_id)
+            return
+        logger.warning("Controller has no append endpoint; storing transcripts in full")
+        self.append_supported = False
+
+    async def _drop_superseded(self, conversation_id: str) -> None:
+        """Delete the copy a full store of its grown transcript replaced"""
+        try:
+            await self.delete_conversation(conversation_id)
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not delete superseded copy {conversation_id}: {e}")
+
+    async def _session_from_controller(self, conversation_id: str) -> dict[str, Any] | None:
+        """Rebuild append state for a conversation this process has not tracked"""
+        try:
+            result = await self.get_context(conversation_id)
+        except httpx.HTTPError:
+            return None
+        if not result.get("success") or "data" not in result:
+            return None
+        stored = result["data"].get("messages", [])
+        return {
+            "conversation_id": conversation_id,
+            "count": len(stored),
+            "digest": _messages_digest(stored),
+        }
+
+    def _remember(self, key: str | None, conversation_id: str, messages: list[dict]) -> None:
+        state = {
+            "conversation_id": conversation_id,
+            "count": len(messages),
+            "digest": _messages_digest(messages),
+        }
+        self.sessions.set(conversation_id, state)
+        if key and key != conversation_id:
+            self.sessions.set(key, state)
 
     async def search_memory(
-        self, query: str, limit: int = 10, filter_labels: list[str] | None = None
+        self,
+        query: str,
+        limit: int = 10,
+        filter_labels: list[str] | None = None,
+        offset: int = 0,
     ) -> dict[str, Any]:
-        """Search conversations semantically"""
+        """Search conversations semantically, starting `offset` results in"""
         payload: dict[str, Any] = {"query": query, "limit": limit}
         if filter_labels:
             payload["filter_labels"] = filter_labels
+        if offset:
+            payload["offset"] = offset
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/mcp/tools/memory_search", json=payload, headers=self.headers
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        return await self._cached_post(
+            "/mcp/tools/memory_search", payload, settings.search_cache_ttl, versioned=True
+        )
 
     async def get_stats(self, folder: str | None = None) -> dict[str, Any]:
-        """Get memory statistics"""
+        """Get memory statistics, served from the stats cache when recent enough"""
+        return await self.stats.get(folder)
+
+    async def _fetch_stats(self, folder: str | None = None) -> dict[str, Any]:
         params: dict[str, str] = {}
         if folder:
             params["folder"] = folder
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.controller_url}/api/v1/stats", headers=self.headers, params=params
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        return await self._get("/api/v1/stats", params)
 
     async def update_conversation(
         self,
@@ -67,6 +436,7 @@ class SekhaClient:
         label: str | None = None,
         folder: str | None = None,
         importance_score: float | None = None,
+        status: str | None = None,
     ) -> dict[str, Any]:
         """Update conversation metadata"""
         payload: dict[str, Any] = {"conversation_id": conversation_id}
@@ -77,45 +447,282 @@ class SekhaClient:
             payload["folder"] = folder
         if importance_score is not None:
             payload["importance_score"] = importance_score
+        if status is not None:
+            payload["status"] = status
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/mcp/tools/memory_update", json=payload, headers=self.headers
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        path = "/mcp/tools/memory_update"
+        self._check_known(conversation_id, "POST", path)
+        with self._tracking_missing(conversation_id):
+            result = await self._post(path, payload)
+        if result.get("success"):
+            self._invalidate(conversation_id)
+            if self.index is not None:
+                self.index.update_metadata(conversation_id, label=label, folder=folder)
+        return result
+
+    def folder_of(self, conversation_id: str) -> str | None:
+        """A conversation's folder from local copies (index, prefetch, archive), if any"""
+        if self.index is not None:
+            folder = self.index.folder_of(conversation_id)
+            if folder is not None:
+                return folder
+        entry = self.prefetch.cache.get(conversation_id)
+        if entry is not None:
+            return entry["data"].get("folder")
+        if self.cold is not None:
+            archived = self.cold.get(conversation_id)
+            if archived is not None:
+                return archived.get("folder")
+        return None
+
+    async def get_context(
+        self,
+        conversation_id: str,
+        offset: int | None = None,
+        limit: int | None = None,
+        tail: int | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> dict[str, Any]:
+        """Get conversation context, optionally restricted to a window of messages"""
+        if self.cold is not None:
+            archived = self.cold.get(conversation_id)
+            if archived is not None:
+                window = window_context(archived, offset, limit, tail, since, until)
+                return {"success": True, "data": {**window, "storage_tier": "cold"}}
+
+        self._check_known(conversation_id, "POST", "/mcp/tools/memory_get_context")
+
+        if self.prefetch.enabled:
+            prefetched = await self.prefetch.take(conversation_id)
+            if prefetched is not None:
+                record_cache("prefetch")
+                window = window_context(prefetched, offset, limit, tail, since, until)
+                return {"success": True, "data": window}
+
+        return await self._fetch_context(conversation_id, offset, limit, tail, since, until)
+
+    async def _fetch_context(
+        self,
+        conversation_id: str,
+        offset: int | None = None,
+        limit: int | None = None,
+        tail: int | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a context from the controller (through the disk cache, if enabled)"""
+        payload: dict[str, Any] = {"conversation_id": conversation_id}
 
-    async def get_context(self, conversation_id: str) -> dict[str, Any]:
-        """Get full conversation context"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/mcp/tools/memory_get_context",
-                json={"conversation_id": conversation_id},
-                headers=self.headers,
+        if offset is not None:
+            payload["offset"] = offset
+        if limit is not None:
+            payload["limit"] = limit
+        if tail is not None:
+            payload["tail"] = tail
+        if since is not None:
+            payload["since"] = since
+        if until is not None:
+            payload["until"] = until
+
+        with self._tracking_missing(conversation_id):
+            result = await self._cached_post(
+                "/mcp/tools/memory_get_context",
+                payload,
+                settings.context_cache_ttl,
+                tag=conversation_id,
             )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        # Only a full, unwindowed context describes the whole conversation
+        if self.index is not None and len(payload) == 1 and result.get("success"):
+            self._index_conversation(result.get("data") or {})
+        return result
+
+    def _index_conversation(self, data: dict[str, Any]) -> None:
+        """Add a conversation body to the lexical index and persist it when due"""
+        assert self.index is not None
+        if not data.get("conversation_id"):
+            return
+        self.index.add(
+            data["conversation_id"],
+            label=data.get("label") or "",
+            folder=data.get("folder") or "/",
+            texts=[m.get("content", "") for m in data.get("messages", [])],
+            importance_score=data.get("importance_score"),
+            created_at=data.get("created_at"),
+        )
+        self.index.maybe_save()
+
+    async def delete_conversation(self, conversation_id: str) -> dict[str, Any]:
+        """Permanently delete a conversation, from cold storage if it was offloaded"""
+        if self.cold is not None and self.cold.remove(conversation_id):
+            result = {"success": True, "data": {"deleted": conversation_id, "storage_tier": "cold"}}
+        else:
+            path = f"/api/v1/conversations/{conversation_id}"
+            self._check_known(conversation_id, "DELETE", path)
+            with self._tracking_missing(conversation_id):
+                result = await self._delete(path)
+        if result.get("success"):
+            self._invalidate(conversation_id)
+            self.known.not_found(conversation_id)
+            self.forget_stored(conversation_id)
+            if self.index is not None:
+                self.index.remove(conversation_id)
+        return result
+
+    async def offload_conversations(self, conversation_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Move conversations from the controller into the local cold storage tier.
+
+        Full contexts are fetched from the controller, bypassing every local
+        cache, written together as one segment and only then deleted
+        upstream. A conversation whose upstream delete fails is dropped from
+        cold storage again, so each one lives in exactly one tier. Returns one
+        outcome record per id, in input order.
+        """
+        if self.cold is None:
+            raise RuntimeError("Cold storage is disabled; set COLD_STORAGE_ENABLED=true")
+
+        outcomes: dict[str, dict[str, Any]] = {}
+        pending = []
+        for conv_id in conversation_ids:
+            if conv_id in self.cold:
+                outcomes[conv_id] = {"conversation_id": conv_id, "success": True}
+            else:
+                pending.append(conv_id)
+
+        async def fetch_current(conv_id: str) -> dict[str, Any]:
+            # The upstream copy is deleted next, so archive what the controller holds
+            # now: a prefetched or disk-cached copy may predate writes by other hosts
+            with self._tracking_missing(conv_id):
+                return await self._post(
+                    "/mcp/tools/memory_get_context", {"conversation_id": conv_id}
+                )
+
+        contexts = await gather_bounded(fetch_current, pending, settings.max_concurrency)
+        archived = []
+        for conv_id, context in zip(pending, contexts, strict=True):
+            if isinstance(context, BaseException):
+                error = f"Error: {context}"
+            elif not context.get("success") or "data" not in context:
+                error = context.get("error", "Conversation not found")
+            else:
+                archived.append(archive_record(context["data"]))
+                continue
+            outcomes[conv_id] = {"conversation_id": conv_id, "success": False, "error": error}
+
+        self.cold.offload(archived)
+        archived_ids = [conv["conversation_id"] for conv in archived]
+        deletes = await gather_bounded(
+            lambda conv_id: self._delete(f"/api/v1/conversations/{conv_id}"),
+            archived_ids,
+            settings.max_concurrency,
+        )
+        for conv_id, deleted in zip(archived_ids, deletes, strict=True):
+            outcome: dict[str, Any] = {"conversation_id": conv_id, "success": True}
+            if isinstance(deleted, BaseException) or not deleted.get("success"):
+                self.cold.remove(conv_id)
+                error = deleted if isinstance(deleted, BaseException) else deleted.get("error")
+                outcome = outcome | {"success": False, "error": f"Error: {error}"}
+            else:
+                # Cached hot-tier reads are stale; the lexical index keeps serving it
+                self._invalidate(conv_id)
+                self.forget_stored(conv_id)
+            outcomes[conv_id] = outcome
+        return [outcomes[conv_id] for conv_id in conversation_ids]
 
     async def prune_memory(
-        self, threshold_days: int = 30, importance_threshold: float | None = None
+        self,
+        threshold_days: int = 30,
+        importance_threshold: float | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> dict[str, Any]:
-        """Get pruning suggestions"""
+        """Get pruning suggestions, optionally one page of `limit` starting at `offset`"""
         payload: dict[str, Any] = {"threshold_days": threshold_days}
 
         if importance_threshold is not None:
             payload["importance_threshold"] = importance_threshold
+        if offset:
+            payload["offset"] = offset
+        if limit is not None:
+            payload["limit"] = limit
+
+        result = await self._post("/mcp/tools/memory_prune", payload)
+        data = result.get("data")
+        paginated = isinstance(data, dict) and "has_more" in data
+        if limit is not None and result.get("success") and isinstance(data, dict) and not paginated:
+            # Controllers without pagination ignore offset/limit and return every
+            # suggestion, even when that happens to be exactly `limit`; page locally
+            suggestions = data.get("suggestions", [])
+            data["suggestions"] = suggestions[offset : offset + limit]
+            data["has_more"] = offset + limit < len(suggestions)
+        return result
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/mcp/tools/memory_prune", json=payload, headers=self.headers
+    async def iter_prune_pages(
+        self,
+        threshold_days: int = 30,
+        importance_threshold: float | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pruning suggestions one page at a time until the controller runs out"""
+        offset = 0
+        while True:
+            result = await self.prune_memory(
+                threshold_days, importance_threshold, offset=offset, limit=page_size
             )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+            if not result.get("success") or "data" not in result:
+                raise RuntimeError(result.get("error", "Prune check failed"))
+            page = result["data"].get("suggestions", [])
+            if page:
+                yield page
+            if not page or not result["data"].get("has_more", len(page) >= page_size):
+                return
+            offset += len(page)
+
+    async def iter_conversation_ids(self, page_size: int = 1000) -> AsyncIterator[list[str]]:
+        """Yield every conversation id the controller holds, one page at a time"""
+        offset = 0
+        while True:
+            result = await self._get(
+                "/api/v1/conversations/ids", {"offset": str(offset), "limit": str(page_size)}
+            )
+            if not result.get("success") or "data" not in result:
+                raise RuntimeError(result.get("error", "Conversation id listing failed"))
+            page = result["data"].get("conversation_ids", [])
+            if page:
+                yield page
+            if not page or not result["data"].get("has_more", len(page) >= page_size):
+                return
+            offset += len(page)
 
     async def query_memory(self, query: str, limit: int = 10) -> dict[str, Any]:
         """Legacy query endpoint (deprecated, use memory_search)"""
         return await self.search_memory(query, limit)
 
 
+def _messages_digest(messages: list[dict[str, Any]]) -> str:
+    """Fingerprint messages by role and content (timestamps may be normalised upstream)"""
+    digest = hashlib.sha256()
+    for message in messages:
+        digest.update(json.dumps([message.get("role"), message.get("content")]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _incremental_result(
+    conversation_id: str, message_count: int, appended: int, mode: str
+) -> dict[str, Any]:
+    return {
+        "success": True,
+        "data": {
+            "conversation_id": conversation_id,
+            "message_count": message_count,
+            "appended": appended,
+            "mode": mode,
+        },
+    }
+
+
 # Global client instance
-sekha_client = SekhaClient()
+sekha_client = SekhaClient(
+    cache=open_disk_cache(), index=open_lexical_index(), cold=open_cold_store()
+)
@@ -0,0 +1,228 @@
+"""Local cold storage tier for conversations offloaded from the controller
+
+``memory_prune_apply`` with ``action="offload"`` moves old conversations out
+of the controller's hot dataset instead of deleting them. Each offload batch
+is written as one immutable segment file: independently zlib-compressed JSON
+records laid back to back, named by the SHA-256 of the segment's bytes, so
+writing the same batch twice stores it once.
+
+A SQLite index maps each conversation id to its segment, byte offset and
+length, so reading one conversation decompresses only its own record.
+``SekhaClient.get_context`` consults the index before the controller, which
+makes offloaded conversations readable through ``memory_get_context`` and
+``memory_export`` as before. A segment file is removed once none of its
+records are referenced.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index schema or record format changes
+SCHEMA_VERSION = 1
+
+SEGMENT_SUFFIX = ".seg"
+
+# Keys that describe a controller response window rather than the conversation
+_WINDOW_KEYS = ("offset", "total_messages")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    conversation_id TEXT PRIMARY KEY,
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    archived_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_segment ON records (segment);
+"""
+
+
+class ColdStore:
+    """Content-addressed segment files with an id -> (segment, offset) index"""
+
+    def __init__(self, path: str | Path, clock=time.time) -> None:
+        self.path = Path(path).expanduser()
+        self.segments = self.path / "segments"
+        self.segments.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+
+        self._db = sqlite3.connect(self.path / "index.sqlite3", timeout=5.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Unlike a cache, archived data cannot be rebuilt; refuse to guess
+            raise ValueError(f"unsupported cold storage index version {version}")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def __contains__(self, conversation_id: object) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM records WHERE conversation_id = ?", (conversation_id,)
+        ).fetchone()
+        return row is not None
+
+    def offload(self, conversations: list[dict[str, Any]]) -> str | None:
+        """Write conversations to one durable segment and index them; returns its name"""
+        records = [
+            (conv["conversation_id"], zlib.compress(_dumps(conv)))
+            for conv in conversations
+            if conv.get("conversation_id")
+        ]
+        if not records:
+            return None
+
+        blob = b"".join(record for _, record in records)
+        segment = hashlib.sha256(blob).hexdigest()
+        target = self.segments / f"{segment}{SEGMENT_SUFFIX}"
+        if not target.exists():
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(blob)
+                f.flush()
+                # The controller copy is deleted next, so the segment must be on disk
+                os.fsync(f.fileno())
+            os.replace(tmp, target)
+
+        now = self._clock()
+        rows, offset = [], 0
+        for conv_id, record in records:
+            rows.append((conv_id, segment, offset, len(record), now))
+            offset += len(record)
+
+        replaced = self._segments_of([conv_id for conv_id, _ in records])
+        self._db.execute("BEGIN")
+        self._db.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows)
+        self._db.execute("COMMIT")
+        self._collect(replaced - {segment})
+        return segment
+
+    def get(self, conversation_id: str) -> dict[str, Any] | None:
+        """Read one archived conversation, or None if it is not in cold storage"""
+        row = self._db.execute(
+            "SELECT segment, offset, length FROM records WHERE conversation_id = ?",
+            (conversation_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        segment, offset, length = row
+        try:
+            with open(self.segments / f"{segment}{SEGMENT_SUFFIX}", "rb") as f:
+                f.seek(offset)
+                record = f.read(length)
+            return json.loads(zlib.decompress(record))
+        except (OSError, ValueError, zlib.error) as e:
+            logger.error(f"Cold storage record for {conversation_id} is unreadable: {e}")
+            return None
+
+    def remove(self, conversation_id: str) -> bool:
+        """Drop a conversation from the index, deleting its segment once unreferenced"""
+        segments = self._segments_of([conversation_id])
+        if not segments:
+            return False
+        self._db.execute("DELETE FROM records WHERE conversation_id = ?", (conversation_id,))
+        self._collect(segments)
+        return True
+
+    def _segments_of(self, conversation_ids: list[str]) -> set[str]:
+        placeholders = ",".join("?" * len(conversation_ids))
+        rows = self._db.execute(
+            f"SELECT DISTINCT segment FROM records WHERE conversation_id IN ({placeholders})",
+            conversation_ids,
+        )
+        return {segment for (segment,) in rows}
+
+    def _collect(self, segments: set[str]) -> None:
+        """Delete segment files that no index record points into"""
+        for segment in segments:
+            referenced = self._db.execute(
+                "SELECT 1 FROM records WHERE segment = ? LIMIT 1", (segment,)
+            ).fetchone()
+            if referenced is None:
+                (self.segments / f"{segment}{SEGMENT_SUFFIX}").unlink(missing_ok=True)
+
+
+def archive_record(data: dict[str, Any]) -> dict[str, Any]:
+    """Strip response-window fields from full controller context data"""
+    return {k: v for k, v in data.items() if k not in _WINDOW_KEYS}
+
+
+def window_context(
+    record: dict[str, Any],
+    offset: int | None = None,
+    limit: int | None = None,
+    tail: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> dict[str, Any]:
+    """Shape a full conversation record like a windowed controller context response"""
+    all_messages = record.get("messages", [])
+    messages = all_messages
+    if since or until:
+        lower, upper = _parse_timestamp(since), _parse_timestamp(until)
+        messages = [
+            m
+            for m in messages
+            if (stamp := _parse_timestamp(m.get("timestamp"))) is not None
+            and (lower is None or stamp >= lower)
+            and (upper is None or stamp <= upper)
+        ]
+
+    total = len(messages)
+    if tail is not None:
+        start, end = max(total - tail, 0), total
+    else:
+        start = min(offset or 0, total)
+        end = total if limit is None else start + limit
+
+    return {
+        **record,
+        "messages": messages[start:end],
+        "total_messages": total,
+        "offset": start,
+        "word_count": record.get("word_count")
+        or sum(len(m.get("content", "").split()) for m in all_messages),
+    }
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not value:
+        return None
+    try:
+        stamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return stamp if stamp.tzinfo else stamp.replace(tzinfo=timezone.utc)
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def open_cold_store() -> ColdStore | None:
+    """Open the configured cold storage tier, or None when disabled or unavailable"""
+    if not settings.cold_storage_enabled:
+        return None
+    try:
+        return ColdStore(settings.cold_storage_path)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.warning(f"Cold storage unavailable at {settings.cold_storage_path}: {e}")
+        return None
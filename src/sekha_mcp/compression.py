@@ -0,0 +1,139 @@
+"""Compression of controller request bodies, with byte-savings counters
+
+Request bodies of at least ``COMPRESSION_MIN_BYTES`` are compressed and sent
+with ``Content-Encoding`` when ``COMPRESSION_ENABLED`` is set. zstd and brotli
+are used when their optional packages (``zstandard``, ``brotli``) are
+installed, gzip otherwise. A controller that answers 415 Unsupported Media
+Type gets the request again as plain JSON, and the rejected encoding is not
+used again by this process (``auto`` moves on to the next preference).
+Every request advertises the encodings httpx can
+decode, so the controller may compress its responses regardless of the
+switch. ``stats`` counts raw and on-the-wire bytes in both directions.
+"""
+
+import gzip
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {"gzip": lambda b: gzip.compress(b, 6)}
+if zstandard is not None:  # pragma: no cover - optional dependency
+    ENCODERS["zstd"] = zstandard.ZstdCompressor(level=3).compress
+if brotli is not None:  # pragma: no cover - optional dependency
+    ENCODERS["br"] = lambda b: brotli.compress(b, quality=5)
+
+# Preferred order for COMPRESSION_ENCODING=auto: fastest good ratio first
+PREFERENCE = ("zstd", "br", "gzip")
+
+# httpx decodes the same optional encodings it can import
+ACCEPT_ENCODING = ", ".join([e for e in PREFERENCE if e in ENCODERS] + ["deflate"])
+
+
+@dataclass
+class CompressionStats:
+    """Byte counters for compressed requests and all responses"""
+
+    requests_compressed: int = 0
+    request_bytes: int = 0
+    request_wire_bytes: int = 0
+    responses: int = 0
+    response_bytes: int = 0
+    response_wire_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        return (
+            self.request_bytes
+            - self.request_wire_bytes
+            + self.response_bytes
+            - self.response_wire_bytes
+        )
+
+    def describe(self) -> str:
+        """One-line human summary of the bytes saved so far"""
+        raw = self.request_bytes + self.response_bytes
+        percent = 100 * self.saved_bytes / raw if raw else 0.0
+        return (
+            f"saved {self.saved_bytes / 1024:.1f} KiB of {raw / 1024:.1f} KiB ({percent:.0f}%) "
+            f"over {self.requests_compressed} compressed requests and {self.responses} responses"
+        )
+
+    def summary(self) -> dict[str, Any]:
+        return {**asdict(self), "saved_bytes": self.saved_bytes}
+
+    def reset(self) -> None:
+        for name, value in asdict(CompressionStats()).items():
+            setattr(self, name, value)
+
+
+stats = CompressionStats()
+
+# Encodings the controller answered 415 for
+rejected: set[str] = set()
+
+
+def choose_encoding(preferred: str) -> str | None:
+    """Resolve COMPRESSION_ENCODING to an available encoder the controller accepts
+
+    Unknown encodings fall back to gzip; None means every candidate was rejected.
+    """
+    if preferred == "auto":
+        candidates = [e for e in PREFERENCE if e in ENCODERS]
+    else:
+        candidates = [preferred if preferred in ENCODERS else "gzip"]
+    return next((e for e in candidates if e not in rejected), None)
+
+
+def reject(encoding: str) -> None:
+    """Stop compressing with an encoding the controller cannot decode"""
+    if encoding not in rejected:
+        logger.warning(f"Controller rejected {encoding} request bodies; not using it again")
+        rejected.add(encoding)
+
+
+def encode_body(payload: dict[str, Any]) -> tuple[bytes, str] | None:
+    """
+    Serialize and compress a request body when enabled and large enough.
+
+    Returns the compressed body and its encoding, or None to send the
+    payload as plain JSON.
+    """
+    if not settings.compression_enabled:
+        return None
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) < settings.compression_min_bytes:
+        return None
+
+    encoding = choose_encoding(settings.compression_encoding)
+    if encoding is None:
+        return None
+    body = ENCODERS[encoding](raw)
+    stats.requests_compressed += 1
+    stats.request_bytes += len(raw)
+    stats.request_wire_bytes += len(body)
+    return body, encoding
+
+
+def record_response(response: httpx.Response) -> None:
+    """Count a response's decoded size against the bytes actually received"""
+    stats.responses += 1
+    stats.response_bytes += len(response.content)
+    stats.response_wire_bytes += response.num_bytes_downloaded
@@ -0,0 +1,25 @@
+"""Bounded-concurrency helpers for fanning out controller requests"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[Any]], items: Iterable[T], limit: int
+) -> list[Any]:
+    """
+    Run func over items with at most `limit` calls in flight.
+
+    Results are returned in input order. Exceptions are returned in place of
+    results rather than raised, so one failed item does not cancel the rest.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
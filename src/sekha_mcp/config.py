@@ -17,6 +17,77 @@ class Settings(BaseSettings):
     # Timeouts
     request_timeout: int = 30
 
+    # Controller /health probes: background monitor interval (0 disables) and probe timeout
+    health_check_interval: float = 30.0
+    health_check_timeout: float = 5.0
+
+    # Maximum concurrent controller requests per fan-out tool call
+    max_concurrency: int = 8
+
+    # Compress request bodies of at least compression_min_bytes (auto, zstd, br or gzip)
+    compression_enabled: bool = False
+    compression_min_bytes: int = 8192
+    compression_encoding: str = "auto"
+
+    # Server-side search pagination cursors
+    search_cursor_ttl: int = 600
+    search_cursor_max_entries: int = 256
+
+    # Sessions tracked for memory_store append mode
+    append_sessions_max_entries: int = 1024
+
+    # memory_stats: serve cached stats for stats_cache_ttl seconds, then serve and refresh
+    # in the background until stats_cache_max_stale (0 ttl disables caching)
+    stats_cache_ttl: float = 30.0
+    stats_cache_max_stale: float = 300.0
+
+    # Prefetch contexts of the top search hits in the background (0 disables)
+    prefetch_top_n: int = 0
+    prefetch_min_similarity: float = 0.5
+    prefetch_max_inflight: int = 2
+    prefetch_ttl: float = 120.0
+    prefetch_max_entries: int = 32
+
+    # Conversation ids the controller reported missing, answered locally (0 ttl disables)
+    not_found_cache_ttl: float = 30.0
+    not_found_cache_max_entries: int = 1024
+
+    # Bloom filter of known conversation ids, rebuilt from the controller's id listing
+    known_ids_filter_enabled: bool = False
+    known_ids_false_positive_rate: float = 0.01
+    known_ids_refresh_interval: float = 300.0
+
+    # Recently stored content hashes answered locally by memory_store
+    store_dedup_ttl: int = 3600
+    store_dedup_max_entries: int = 1024
+
+    # Sampling profiler (SIGUSR1 and the memory_profile tool)
+    profiling_enabled: bool = False
+    profile_dir: str = "profiles"
+    profile_interval_ms: float = 5.0
+    profile_max_seconds: int = 60
+
+    # Expose admin-only tools: memory_import and memory_profile
+    admin_tools_enabled: bool = False
+
+    # Log a phase breakdown for tool calls slower than this (0 disables)
+    slow_call_threshold_ms: int = 1000
+
+    # Persistent read-through cache shared by local server processes
+    disk_cache_enabled: bool = False
+    disk_cache_path: str = "~/.cache/sekha-mcp/cache.sqlite3"
+    disk_cache_max_mb: int = 256
+    context_cache_ttl: int = 3600
+    search_cache_ttl: int = 120
+
+    # Local BM25 index for mode="lexical" search and controller-down fallback
+    lexical_index_enabled: bool = False
+    lexical_index_path: str = "~/.cache/sekha-mcp/lexical-index.json.z"
+
+    # Local cold storage tier for conversations offloaded by memory_prune_apply
+    cold_storage_enabled: bool = False
+    cold_storage_path: str = "~/.local/share/sekha-mcp/cold"
+
     # Logging
     log_level: str = "INFO"
 
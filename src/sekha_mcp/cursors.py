@@ -0,0 +1,55 @@
+"""Opaque continuation cursors for paginated tool results"""
+
+import base64
+import binascii
+import json
+import secrets
+from typing import Any
+
+from .cache import TTLCache
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """Encode pagination state as an opaque, URL-safe token"""
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    """Decode a token produced by encode_cursor, raising ValueError if malformed"""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(state, dict):
+        raise ValueError("Invalid cursor")
+    return state
+
+
+class CursorStore:
+    """Server-side pagination state keyed by short random tokens
+
+    Unlike encode_cursor, the state never leaves the process; tokens expire
+    after `ttl` seconds and the oldest are evicted beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._states = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def put(self, state: dict[str, Any]) -> str:
+        """Store state and return the token that refers to it"""
+        token = secrets.token_urlsafe(12)
+        self._states.set(token, state)
+        return token
+
+    def get(self, token: str) -> dict[str, Any]:
+        """Return the state for token, raising ValueError if unknown or expired"""
+        state = self._states.get(token)
+        if state is None:
+            raise ValueError("Unknown or expired cursor")
+        return dict(state)
+
+    def __len__(self) -> int:
+        return len(self._states)
@@ -0,0 +1,166 @@
+"""Persistent read-through cache shared by local server processes
+
+Each stdio session starts a fresh server process, so in-memory caches are
+lost between agent sessions. This cache keeps controller responses in a
+SQLite database (WAL mode, so several processes can read while one writes)
+with zlib-compressed JSON values.
+
+Entries expire after their TTL, the least recently used are evicted once the
+database grows past ``max_bytes``, and two kinds of invalidation apply:
+
+* Entries tagged with a conversation id are deleted when that conversation
+  is written through this host.
+* Entries in a versioned namespace (search results) record the namespace
+  generation when written; bumping the generation after any store or update
+  makes every older entry a miss without scanning the table.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored value format changes; older databases are cleared
+SCHEMA_VERSION = 1
+
+# Only refresh an entry's access time when it is older than this, so that
+# most hits are pure reads
+ACCESS_RESOLUTION = 60.0
+
+# Check the total size every this many writes
+EVICT_EVERY = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    tag TEXT,
+    generation INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_tag ON entries (tag);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS generations (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+class DiskCache:
+    """SQLite-backed cache of JSON values with TTLs, LRU eviction and invalidation"""
+
+    def __init__(self, path: str | Path, max_bytes: int, clock=time.time) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._writes = 0
+
+        self._db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._db.executescript(
+                "DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS generations;"
+            )
+            self._db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def generation(self, name: str) -> int:
+        row = self._db.execute("SELECT value FROM generations WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def bump(self, name: str) -> None:
+        """Invalidate every entry written under the current generation of `name`"""
+        self._db.execute(
+            "INSERT INTO generations (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, key: str, generation: int = 0) -> Any | None:
+        """Return the cached value, or None if missing, expired or from an old generation"""
+        row = self._db.execute(
+            "SELECT value, generation, expires, accessed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, entry_generation, expires, accessed = row
+        now = self._clock()
+        if expires <= now or entry_generation != generation:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+        if now - accessed > ACCESS_RESOLUTION:
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(value))
+
+    def set(
+        self, key: str, value: Any, ttl: float, tag: str | None = None, generation: int = 0
+    ) -> None:
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        now = self._clock()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(key, tag, generation, value, size, expires, accessed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, tag, generation, blob, len(blob) + len(key), now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % EVICT_EVERY == 0:
+            self.evict()
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every entry tagged with `tag`, returning how many were removed"""
+        return self._db.execute("DELETE FROM entries WHERE tag = ?", (tag,)).rowcount
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones down to 90% of max_bytes"""
+        removed = self._db.execute(
+            "DELETE FROM entries WHERE expires <= ?", (self._clock(),)
+        ).rowcount
+
+        total = self.size()
+        if total <= self.max_bytes:
+            return removed
+
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return removed + len(victims)
+
+    def size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def open_disk_cache() -> DiskCache | None:
+    """Open the configured disk cache, or None when disabled or unavailable"""
+    if not settings.disk_cache_enabled:
+        return None
+    try:
+        return DiskCache(settings.disk_cache_path, settings.disk_cache_max_mb * 1024 * 1024)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Disk cache unavailable at {settings.disk_cache_path}: {e}")
+        return None
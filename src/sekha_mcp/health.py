@@ -1,10 +1,36 @@
-"""Health check utilities for Sekha MCP Server"""
+"""Health check utilities for Sekha MCP Server
+
+``check_controller_health()`` probes the controller's ``/health`` endpoint.
+When the background ``HealthMonitor`` is running it returns the monitor's
+cached status instead, so health checks cost nothing. The monitor probes on
+a fixed interval over the client's shared connection pool and keeps a ring buffer
+of recent probe latencies and outcomes, from which it publishes latency
+percentiles, consecutive failures and the last success time. Other
+subsystems use ``health_monitor.unavailable`` to fail fast while the
+controller is down.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime, timezone
 
 import httpx
 from pydantic import BaseModel
 
+from sekha_mcp.client import sekha_client
 from sekha_mcp.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Probe outcomes kept for latency percentiles
+HISTORY_SIZE = 128
+
+# Consecutive failed probes after which the controller is treated as down
+FAIL_FAST_AFTER = 3
+
 
 class HealthStatus(BaseModel):
     """Health status response"""
@@ -13,26 +39,143 @@ class HealthStatus(BaseModel):
     controller_reachable: bool
     controller_url: str
     error: str | None = None
+    latency_ms: float | None = None
+    p50_latency_ms: float | None = None
+    p99_latency_ms: float | None = None
+    consecutive_failures: int = 0
+    last_success: datetime | None = None
+    checked_at: datetime | None = None
 
 
 async def check_controller_health() -> HealthStatus:
     """Check if Sekha Controller (Rust core) is reachable"""
+    if health_monitor.running and health_monitor.status is not None:
+        return health_monitor.status
+    status, _ = await _probe(sekha_client.http(), settings.health_check_timeout)
+    return status
+
+
+async def _probe(client: httpx.AsyncClient, timeout: float) -> tuple[HealthStatus, float]:
+    """Probe /health once, returning the status and the probe latency in seconds"""
+    started = time.perf_counter()
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                f"{settings.controller_url}/health",
-                headers={"Authorization": f"Bearer {settings.controller_api_key}"},
-            )
-        return HealthStatus(
+        response = await client.get(
+            f"{settings.controller_url}/health",
+            headers={"Authorization": f"Bearer {settings.controller_api_key}"},
+            timeout=timeout,
+        )
+        status = HealthStatus(
             status="healthy" if response.status_code == 200 else "degraded",
             controller_reachable=response.status_code == 200,
             controller_url=settings.controller_url,
             error=None,
         )
     except Exception as e:
-        return HealthStatus(
+        status = HealthStatus(
             status="unhealthy",
             controller_reachable=False,
             controller_url=settings.controller_url,
             error=str(e),
         )
+    return status, time.perf_counter() - started
+
+
+class HealthMonitor:
+    """Background /health prober publishing a cached status with latency history"""
+
+    def __init__(
+        self,
+        interval: float,
+        timeout: float,
+        transport: httpx.AsyncBaseTransport | None = None,
+        history: int = HISTORY_SIZE,
+    ) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        # Probes use the client's shared pool unless a transport is given (tests)
+        self.transport = transport
+        # (latency seconds, reachable) per probe, oldest first
+        self.samples: deque[tuple[float, bool]] = deque(maxlen=history)
+        self.status: HealthStatus | None = None
+        self.consecutive_failures = 0
+        self.last_success: datetime | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def unavailable(self) -> bool:
+        """True while the monitor has seen FAIL_FAST_AFTER failed probes in a row"""
+        return self.running and self.consecutive_failures >= FAIL_FAST_AFTER
+
+    async def probe(self) -> HealthStatus:
+        """Probe once over the shared connection pool and publish the result"""
+        if self.transport is None:
+            client = sekha_client.http()
+        else:
+            if self._client is None:
+                self._client = httpx.AsyncClient(transport=self.transport)
+            client = self._client
+        status, latency = await _probe(client, self.timeout)
+
+        now = datetime.now(timezone.utc)
+        self.samples.append((latency, status.controller_reachable))
+        if status.controller_reachable:
+            self.consecutive_failures = 0
+            self.last_success = now
+        else:
+            self.consecutive_failures += 1
+
+        latencies = sorted(seconds for seconds, reachable in self.samples if reachable)
+        self.status = status.model_copy(
+            update={
+                "latency_ms": round(latency * 1000, 2),
+                "p50_latency_ms": _percentile_ms(latencies, 50),
+                "p99_latency_ms": _percentile_ms(latencies, 99),
+                "consecutive_failures": self.consecutive_failures,
+                "last_success": self.last_success,
+                "checked_at": now,
+            }
+        )
+        return self.status
+
+    def start(self) -> None:
+        """Start probing in the background (requires a running event loop)"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the probe loop and close its own pool, if it has one"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        while True:
+            previous = self.status.status if self.status else None
+            status = await self.probe()
+            if previous is not None and status.status != previous:
+                logger.warning(f"Controller health changed: {previous} -> {status.status}")
+            await asyncio.sleep(self.interval)
+
+
+def _percentile_ms(sorted_seconds: list[float], percentile: int) -> float | None:
+    """Nearest-rank percentile of sorted latencies, in milliseconds"""
+    if not sorted_seconds:
+        return None
+    rank = max(math.ceil(percentile / 100 * len(sorted_seconds)), 1)
+    return round(sorted_seconds[rank - 1] * 1000, 2)
+
+
+# Global monitor, started by the server when health_check_interval > 0
+health_monitor = HealthMonitor(settings.health_check_interval, settings.health_check_timeout)
@@ -0,0 +1,168 @@
+"""Local answers for conversation ids the controller does not have
+
+Agents often pass hallucinated or deleted conversation ids, and each one
+costs a controller round-trip to learn it does not exist. Ids the controller
+answered 404 for (or that were deleted here) are held in a bounded negative
+cache for ``not_found_ttl`` seconds and rejected locally meanwhile.
+
+When the controller can list its conversation ids, a Bloom filter of every
+known id can also be kept: ids it has never seen are rejected without a
+request. A Bloom filter has no false negatives, so an id is only rejected if
+it was not in the listing and has not been stored through this client since;
+false positives merely cost the round-trip they would have cost anyway. The
+filter is rebuilt in the background every ``refresh_interval`` seconds so ids
+created by other clients are picked up, and is dropped for good when the
+controller has no listing endpoint.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+
+from .cache import TTLCache
+from .timing import detach_timer
+
+logger = logging.getLogger(__name__)
+
+IdLister = Callable[[], AsyncIterator[list[str]]]
+
+# Size rebuilt filters for this many times the listed ids, leaving room for local stores
+HEADROOM = 2
+MIN_CAPACITY = 1024
+
+# Listing responses meaning the controller has no id listing at all
+UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+class BloomFilter:
+    """Fixed-size set of strings with no false negatives"""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class KnownIds:
+    """Negative cache of missing ids plus an optional Bloom filter of existing ones"""
+
+    def __init__(
+        self,
+        list_ids: IdLister | None,
+        not_found_ttl: float,
+        max_entries: int,
+        error_rate: float,
+        refresh_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.list_ids = list_ids
+        self.not_found_ttl = not_found_ttl
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self.missing = TTLCache(maxsize=max_entries, ttl=not_found_ttl, clock=clock)
+        self.filter: BloomFilter | None = None
+        self.built_at: float | None = None
+        self.unsupported = False
+        self._refresh: asyncio.Task | None = None
+        # Ids stored while a rebuild is listing, added to the new filter on swap
+        self._added: set[str] | None = None
+        self.rejected = 0
+
+    def rejects(self, conv_id: str) -> bool:
+        """Whether conv_id is known not to exist upstream (counted when it is)"""
+        self._maybe_refresh()
+        known_missing = self.not_found_ttl > 0 and conv_id in self.missing
+        if not known_missing and (self.filter is None or conv_id in self.filter):
+            return False
+        self.rejected += 1
+        return True
+
+    def not_found(self, conv_id: str) -> None:
+        """Remember an id the controller reported missing or that was deleted"""
+        if self.not_found_ttl > 0:
+            self.missing.set(conv_id, True)
+
+    def add(self, conv_id: str) -> None:
+        """Record an id that now exists upstream"""
+        self.missing.pop(conv_id)
+        if self.filter is not None:
+            self.filter.add(conv_id)
+        if self._added is not None:
+            self._added.add(conv_id)
+
+    def _maybe_refresh(self) -> None:
+        if self.list_ids is None or self.unsupported or self._refresh is not None:
+            return
+        if self.built_at is None or self._clock() - self.built_at >= self.refresh_interval:
+            self._refresh = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        detach_timer()
+        await self.refresh()
+
+    async def refresh(self) -> bool:
+        """Rebuild the filter from the controller's id listing; False if it failed"""
+        assert self.list_ids is not None
+        self._added = added = set()
+        ids: list[str] = []
+        try:
+            async for page in self.list_ids():
+                ids.extend(page)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in UNSUPPORTED_STATUSES:
+                logger.info("Controller cannot list conversation ids; Bloom filter disabled")
+                self.unsupported = True
+                self.filter = None
+                return False
+            logger.warning(f"Conversation id listing failed: {e}")
+            return False
+        except Exception as e:
+            # Keep the previous filter; local stores are still added to it
+            logger.warning(f"Conversation id listing failed: {e}")
+            return False
+        finally:
+            self.built_at = self._clock()
+            self._refresh = self._added = None
+
+        bloom = BloomFilter(max(len(ids) * HEADROOM, MIN_CAPACITY), self.error_rate)
+        for conv_id in [*ids, *added]:
+            bloom.add(conv_id)
+        self.filter = bloom
+        logger.debug(f"Known-id filter rebuilt with {len(bloom)} ids")
+        return True
+
+    def describe(self) -> str:
+        text = f"{self.rejected} unknown conversation ids rejected locally"
+        if self.filter is not None:
+            text += f" ({len(self.filter)} ids in filter)"
+        return text
+
+    def reset(self) -> None:
+        self.missing.clear()
+        self.rejected = 0
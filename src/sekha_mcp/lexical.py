@@ -0,0 +1,300 @@
+"""Local BM25 index over conversations seen by this host
+
+Conversations are indexed as they pass through the client: stored via
+``memory_store`` or fetched in full via ``get_context``. ``memory_search``
+queries the index directly with ``mode="lexical"`` and falls back to it when
+the controller cannot be reached.
+
+Postings are kept as parallel integer arrays (document numbers and term
+frequencies) per term. Re-indexing a conversation tombstones its old document
+number; tombstones are dropped by ``compact()``, which also runs before every
+save. Label tokens count three times and folder tokens twice, so matches in
+metadata outrank matches buried in message content.
+"""
+
+import base64
+import json
+import logging
+import math
+import os
+import re
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+LABEL_WEIGHT = 3
+FOLDER_WEIGHT = 2
+
+# Characters of content kept per document for result excerpts
+EXCERPT_CHARS = 1000
+
+# Minimum seconds between automatic saves
+SAVE_INTERVAL = 5.0
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_FREQ = 0xFFFF
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class LexicalIndex:
+    """Incremental inverted index with BM25 ranking and on-disk persistence"""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        # Document records by document number; None marks a tombstone
+        self.docs: list[dict[str, Any] | None] = []
+        self.doc_numbers: dict[str, int] = {}
+        self.postings: dict[str, tuple[array, array]] = {}
+        self.total_length = 0
+        self.dirty = False
+        self._saved_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.doc_numbers)
+
+    def add(
+        self,
+        conversation_id: str,
+        label: str,
+        folder: str,
+        texts: list[str],
+        importance_score: float | None = None,
+        created_at: str | None = None,
+    ) -> bool:
+        """Index a conversation, replacing any earlier version; False if unchanged"""
+        content = "\n".join(texts)
+        digest = zlib.crc32(f"{label}\0{folder}\0{content}".encode())
+        previous = self.doc_numbers.get(conversation_id)
+        if previous is not None:
+            doc = self.docs[previous]
+            if doc is not None and doc["digest"] == digest:
+                return False
+            self._remove(previous)
+
+        counts: dict[str, int] = {}
+        for weight, text in (
+            (LABEL_WEIGHT, label),
+            (FOLDER_WEIGHT, folder.replace("/", " ")),
+            (1, content),
+        ):
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + weight
+
+        number = len(self.docs)
+        length = sum(counts.values())
+        self.docs.append(
+            {
+                "conversation_id": conversation_id,
+                "label": label,
+                "folder": folder,
+                "content": content[:EXCERPT_CHARS],
+                "importance_score": importance_score,
+                "created_at": created_at,
+                "length": length,
+                "digest": digest,
+            }
+        )
+        self.doc_numbers[conversation_id] = number
+        self.total_length += length
+        for token, count in counts.items():
+            numbers, freqs = self.postings.setdefault(token, (array("I"), array("H")))
+            numbers.append(number)
+            freqs.append(min(count, _MAX_FREQ))
+        self.dirty = True
+        return True
+
+    def update_metadata(
+        self, conversation_id: str, label: str | None = None, folder: str | None = None
+    ) -> None:
+        """Refresh the displayed label/folder; postings catch up on the next full add"""
+        number = self.doc_numbers.get(conversation_id)
+        doc = self.docs[number] if number is not None else None
+        if doc is None:
+            return
+        if label is not None:
+            doc["label"] = label
+        if folder is not None:
+            doc["folder"] = folder
+        # Force the next add() for this conversation to re-index it
+        doc["digest"] = -1
+        self.dirty = True
+
+    def folder_of(self, conversation_id: str) -> str | None:
+        """The indexed folder of a conversation, or None if it is not indexed"""
+        number = self.doc_numbers.get(conversation_id)
+        doc = self.docs[number] if number is not None else None
+        return doc["folder"] if doc is not None else None
+
+    def remove(self, conversation_id: str) -> None:
+        """Drop a deleted conversation from search results"""
+        number = self.doc_numbers.get(conversation_id)
+        if number is not None:
+            self._remove(number)
+            self.dirty = True
+
+    def _remove(self, number: int) -> None:
+        doc = self.docs[number]
+        if doc is not None:
+            self.total_length -= doc["length"]
+            self.docs[number] = None
+            del self.doc_numbers[doc["conversation_id"]]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        filter_labels: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Rank documents by BM25, returning one page of hits and whether more exist"""
+        live = len(self.doc_numbers)
+        if not live:
+            return [], False
+        average_length = self.total_length / live
+        labels = set(filter_labels or [])
+
+        scores: dict[int, float] = {}
+        for token in set(tokenize(query)):
+            entry = self.postings.get(token)
+            if entry is None:
+                continue
+            numbers, freqs = entry
+            idf = math.log(1 + (live - len(numbers) + 0.5) / (len(numbers) + 0.5))
+            for number, freq in zip(numbers, freqs, strict=True):
+                doc = self.docs[number]
+                if doc is None or (labels and doc["label"] not in labels):
+                    continue
+                norm = K1 * (1 - B + B * doc["length"] / average_length)
+                scores[number] = scores.get(number, 0.0) + idf * freq * (K1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        hits = []
+        for number, score in ranked[offset : offset + limit]:
+            doc = self.docs[number]
+            assert doc is not None
+            hits.append(
+                {
+                    "conversation_id": doc["conversation_id"],
+                    "label": doc["label"],
+                    "folder": doc["folder"],
+                    "content": doc["content"],
+                    # Squash the unbounded BM25 score into 0-1 like controller similarity
+                    "similarity": round(score / (score + 1.0), 4),
+                    "importance_score": doc["importance_score"],
+                    "created_at": doc["created_at"],
+                }
+            )
+        return hits, offset + limit < len(ranked)
+
+    def compact(self) -> None:
+        """Drop tombstones and renumber documents and postings densely"""
+        if len(self.docs) == len(self.doc_numbers):
+            return
+        renumber: dict[int, int] = {}
+        docs: list[dict[str, Any] | None] = []
+        for number, doc in enumerate(self.docs):
+            if doc is not None:
+                renumber[number] = len(docs)
+                docs.append(doc)
+
+        postings: dict[str, tuple[array, array]] = {}
+        for token, (numbers, freqs) in self.postings.items():
+            kept_numbers, kept_freqs = array("I"), array("H")
+            for number, freq in zip(numbers, freqs, strict=True):
+                if number in renumber:
+                    kept_numbers.append(renumber[number])
+                    kept_freqs.append(freq)
+            if kept_numbers:
+                postings[token] = (kept_numbers, kept_freqs)
+
+        self.docs = docs
+        self.postings = postings
+        self.doc_numbers = {doc["conversation_id"]: i for i, doc in enumerate(docs) if doc}
+
+    def save(self) -> None:
+        """Write the index atomically to its path (compacting first)"""
+        if self.path is None:
+            return
+        self.compact()
+        state = {
+            "version": FORMAT_VERSION,
+            "docs": self.docs,
+            "postings": {
+                token: [_encode(numbers), _encode(freqs)]
+                for token, (numbers, freqs) in self.postings.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8")))
+        os.replace(tmp, self.path)
+        self.dirty = False
+        self._saved_at = time.monotonic()
+
+    def maybe_save(self) -> None:
+        """Save if there are unsaved changes and the last save is SAVE_INTERVAL old"""
+        if not self.dirty or time.monotonic() - self._saved_at < SAVE_INTERVAL:
+            return
+        try:
+            self.save()
+        except OSError as e:
+            logger.warning(f"Could not save lexical index to {self.path}: {e}")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LexicalIndex":
+        """Load an index from path, starting empty if it is missing or unreadable"""
+        index = cls(path)
+        assert index.path is not None
+        if not index.path.exists():
+            return index
+        try:
+            state = json.loads(zlib.decompress(index.path.read_bytes()))
+            if state.get("version") != FORMAT_VERSION:
+                raise ValueError(f"unsupported format version {state.get('version')}")
+            index.docs = state["docs"]
+            index.postings = {
+                token: (_decode("I", numbers), _decode("H", freqs))
+                for token, (numbers, freqs) in state["postings"].items()
+            }
+        except (OSError, ValueError, KeyError, zlib.error) as e:
+            logger.warning(f"Ignoring unreadable lexical index {index.path}: {e}")
+            return cls(path)
+
+        index.doc_numbers = {
+            doc["conversation_id"]: i for i, doc in enumerate(index.docs) if doc is not None
+        }
+        index.total_length = sum(doc["length"] for doc in index.docs if doc is not None)
+        index._saved_at = time.monotonic()
+        return index
+
+
+def _encode(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(typecode: str, data: str) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    return values
+
+
+def open_lexical_index() -> LexicalIndex | None:
+    """Load the configured lexical index, or None when disabled"""
+    if not settings.lexical_index_enabled:
+        return None
+    return LexicalIndex.load(settings.lexical_index_path)
@@ -1,16 +1,77 @@
-"""Entry point for Sekha MCP Server CLI"""
+"""Entry point for Sekha MCP Server CLI
 
+sekha-mcp                  # serve MCP over stdio
+sekha-mcp import FILE ...  # bulk import a memory_export file
+
+``python -m sekha_mcp.main`` takes the same arguments.
+"""
+
+import argparse
 import asyncio
 import sys
 
+from .client import sekha_client
 from .server import main
+from .tools.memory_import import ImportSummary, import_conversations, render_import
+
+
+def run_import(argv: list[str]) -> int:
+    """Import an export file from the command line, returning the exit status"""
+    parser = argparse.ArgumentParser(
+        prog="sekha-mcp import", description="Restore conversations exported by memory_export"
+    )
+    parser.add_argument("path", help="NDJSON or JSON export file")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint.json)")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--concurrency", type=int, help="Parallel stores")
+    args = parser.parse_args(argv)
+
+    async def progress(summary: ImportSummary) -> None:
+        print(
+            f"{summary.resumed_from + summary.completed} records: {summary.stored} stored, "
+            f"{summary.invalid} invalid, {summary.failed} failed",
+            file=sys.stderr,
+        )
+
+    async def run() -> ImportSummary:
+        try:
+            return await import_conversations(
+                args.path,
+                checkpoint=args.checkpoint,
+                resume=not args.no_resume,
+                concurrency=args.concurrency,
+                progress=progress,
+            )
+        finally:
+            await sekha_client.aclose()
 
-if __name__ == "__main__":
+    try:
+        summary = asyncio.run(run())
+    except ValueError as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 2
+    print(render_import(summary), end="")
+    return 1 if summary.failed else 0
+
+
+def cli(argv: list[str] | None = None) -> int:
+    """Console script: dispatch a subcommand or serve, returning the exit status"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["import"]:
+        try:
+            return run_import(argv[1:])
+        except KeyboardInterrupt:
+            print("\nImport interrupted; run again to resume from the checkpoint", file=sys.stderr)
+            return 130
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\nShutting down Sekha MCP Server...")
-        sys.exit(0)
     except Exception as e:
         print(f"Fatal error: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
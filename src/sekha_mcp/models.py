@@ -1,10 +1,10 @@
 """Pydantic models for MCP tools and API interactions"""
 
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class MessageRole(str, enum.Enum):
@@ -15,6 +15,20 @@ class MessageRole(str, enum.Enum):
     SYSTEM = "system"
 
 
+class OutputFormat(str, enum.Enum):
+    """Tool response formats"""
+
+    TEXT = "text"
+    JSON = "json"
+
+
+class SearchMode(str, enum.Enum):
+    """Search backends for memory_search"""
+
+    SEMANTIC = "semantic"
+    LEXICAL = "lexical"
+
+
 class Message(BaseModel):
     """Single message in a conversation"""
 
@@ -43,6 +57,9 @@ class ConversationInput(BaseModel):
     folder: str = Field(..., pattern=r"^\/[a-zA-Z0-9_\-\/]*$")
     messages: list[Message] = Field(..., min_length=1)
     importance_score: float | None = Field(None, ge=0.0, le=10.0)
+    append: bool = False
+    conversation_id: str | None = Field(None, min_length=1)
+    session_key: str | None = Field(None, min_length=1, max_length=200)
 
     @field_validator("messages")
     @classmethod
@@ -52,6 +69,13 @@ class ConversationInput(BaseModel):
             raise ValueError("At least one message is required")
         return v
 
+    @model_validator(mode="after")
+    def validate_append_target(self):
+        """Append mode needs a conversation id or session key to track"""
+        if self.append and self.conversation_id is None and self.session_key is None:
+            raise ValueError("append requires conversation_id or session_key")
+        return self
+
 
 # -- Classes expected by the Tools --
 # These are the missing classes causing ImportError
@@ -63,8 +87,11 @@ class SearchInput(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     query: str = Field(..., min_length=1)
-    limit: int = Field(default=10, ge=1, le=100)
+    limit: int = Field(default=10, ge=1, le=50)
     filter_labels: list[str] | None = None
+    max_tokens: int | None = Field(None, ge=50, le=200_000)
+    cursor: str | None = None
+    mode: SearchMode = SearchMode.SEMANTIC
 
 
 class UpdateInput(BaseModel):
@@ -77,6 +104,15 @@ class UpdateInput(BaseModel):
     folder: str | None = Field(None, pattern=r"^\/[a-zA-Z0-9_\-\/]*$")
     importance_score: float | None = Field(None, ge=0.0, le=10.0)
 
+    @model_validator(mode="after")
+    def validate_has_changes(self):
+        """Ensure at least one field is being updated"""
+        if self.label is None and self.folder is None and self.importance_score is None:
+            raise ValueError(
+                "At least one field (label, folder, or importance_score) must be provided"
+            )
+        return self
+
 
 class ContextInput(BaseModel):
     """Input for getting context (used by memory_get_context tool)"""
@@ -84,6 +120,106 @@ class ContextInput(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     conversation_id: str = Field(..., min_length=1)
+    offset: int | None = Field(None, ge=0)
+    limit: int | None = Field(None, ge=1, le=1000)
+    tail: int | None = Field(None, ge=1, le=1000)
+    since: datetime | None = None
+    until: datetime | None = None
+    cursor: str | None = None
+    max_tokens: int | None = Field(None, ge=50, le=200_000)
+
+    @field_validator("since", "until")
+    @classmethod
+    def validate_timezone(cls, v):
+        """Treat naive timestamps as UTC so time ranges compare consistently"""
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        return v
+
+    @model_validator(mode="after")
+    def validate_window(self):
+        """Reject contradictory window parameters"""
+        if self.tail is not None and (self.offset is not None or self.cursor is not None):
+            raise ValueError("tail cannot be combined with offset or cursor")
+        if self.since and self.until and self.since > self.until:
+            raise ValueError("since must not be later than until")
+        return self
+
+
+class UpdateBatchInput(BaseModel):
+    """Input for updating many conversations (used by memory_update_batch tool)
+
+    Either pass per-conversation ``updates`` or apply the same ``label``,
+    ``folder`` and ``importance_score`` to every id in ``conversation_ids``.
+    Each item is validated individually as an UpdateInput.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    updates: list[dict[str, Any]] = Field(default_factory=list, max_length=100)
+    conversation_ids: list[str] = Field(default_factory=list, max_length=100)
+    label: str | None = Field(None, min_length=1, max_length=500)
+    folder: str | None = Field(None, pattern=r"^\/[a-zA-Z0-9_\-\/]*$")
+    importance_score: float | None = Field(None, ge=0.0, le=10.0)
+
+    @model_validator(mode="after")
+    def validate_items(self):
+        """Ensure the batch is not empty and not oversized"""
+        if not self.updates and not self.conversation_ids:
+            raise ValueError("Provide updates or conversation_ids")
+        if len(self.updates) + len(self.conversation_ids) > 100:
+            raise ValueError("A batch may contain at most 100 updates")
+        return self
+
+    def items(self) -> list[dict[str, Any]]:
+        """Expand the batch into one UpdateInput-shaped dict per conversation"""
+        shared = {
+            k: v
+            for k, v in {
+                "label": self.label,
+                "folder": self.folder,
+                "importance_score": self.importance_score,
+            }.items()
+            if v is not None
+        }
+        return list(self.updates) + [
+            {"conversation_id": conv_id, **shared} for conv_id in self.conversation_ids
+        ]
+
+
+class ContextBatchInput(BaseModel):
+    """Input for retrieving many conversations (used by memory_get_context_batch tool)
+
+    The window parameters apply to every conversation and each item is
+    validated individually as a ContextInput.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    conversation_ids: list[str] = Field(..., min_length=1, max_length=50)
+    offset: int | None = None
+    limit: int | None = None
+    tail: int | None = None
+    since: str | None = None
+    until: str | None = None
+    max_tokens: int | None = None
+
+    def items(self) -> list[dict[str, Any]]:
+        """Expand the batch into one ContextInput-shaped dict per conversation"""
+        window = self.model_dump(exclude={"conversation_ids"}, exclude_none=True)
+        return [{"conversation_id": conv_id, **window} for conv_id in self.conversation_ids]
+
+
+class RecallInput(BaseModel):
+    """Input for search plus context retrieval (used by memory_recall tool)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    query: str = Field(..., min_length=1)
+    top_k: int = Field(default=3, ge=1, le=10)
+    filter_labels: list[str] | None = None
+    tail: int | None = Field(None, ge=1, le=1000)
+    max_tokens: int | None = Field(None, ge=50, le=200_000)
 
 
 class PruneInput(BaseModel):
@@ -93,6 +229,63 @@ class PruneInput(BaseModel):
 
     threshold_days: int = Field(default=30, ge=1)
     importance_threshold: float | None = Field(None, ge=0.0, le=10.0)
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: str | None = None
+
+
+class PruneAction(str, enum.Enum):
+    """What memory_prune_apply does with each selected conversation"""
+
+    ARCHIVE = "archive"
+    DELETE = "delete"
+    OFFLOAD = "offload"
+
+
+class PruneApplyInput(BaseModel):
+    """Input for applying pruning (used by memory_prune_apply tool)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    action: PruneAction
+    conversation_ids: list[str] | None = Field(None, min_length=1, max_length=1000)
+    threshold_days: int | None = Field(None, ge=1)
+    importance_threshold: float | None = Field(None, ge=0.0, le=10.0)
+    max_items: int = Field(default=1000, ge=1, le=10_000)
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        """Select conversations either by id or by prune criteria, not both"""
+        if (self.conversation_ids is None) == (self.threshold_days is None):
+            raise ValueError("Provide either conversation_ids or threshold_days")
+        return self
+
+
+class ImportInput(BaseModel):
+    """Input for bulk importing exported conversations (used by memory_import tool)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    path: str = Field(..., min_length=1)
+    checkpoint: str | None = Field(None, min_length=1)
+    resume: bool = True
+    concurrency: int | None = Field(None, ge=1, le=64)
+
+
+class ProfileAction(str, enum.Enum):
+    """Sampling profiler actions"""
+
+    START = "start"
+    STOP = "stop"
+    STATUS = "status"
+
+
+class ProfileInput(BaseModel):
+    """Input for controlling the sampling profiler (used by memory_profile tool)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    action: ProfileAction = ProfileAction.STATUS
+    duration_seconds: float | None = Field(None, gt=0, le=3600)
 
 
 # -- Alternative naming convention (API-level models) --
@@ -0,0 +1,47 @@
+"""Machine-readable tool responses
+
+Every tool accepts ``output_format``. The default, ``text``, keeps the
+formatted prose meant for chat clients; ``json`` returns the controller data
+with minimal transformation as a single compact JSON text block, skipping
+per-message string building.
+"""
+
+import json
+from typing import Any
+
+from mcp.types import TextContent
+
+from .models import OutputFormat
+
+# Shared inputSchema property added to every tool
+OUTPUT_FORMAT_PROPERTY = {
+    "type": "string",
+    "description": "Response format: 'text' for formatted prose, 'json' for raw data",
+    "enum": [f.value for f in OutputFormat],
+    "default": OutputFormat.TEXT.value,
+}
+
+
+def requested_format(arguments: dict) -> OutputFormat:
+    """
+    Read the requested output format from raw tool arguments.
+
+    The MCP layer validates the value against the inputSchema enum; anything
+    other than 'json' falls back to text for direct callers.
+    """
+    if arguments.get("output_format") == OutputFormat.JSON.value:
+        return OutputFormat.JSON
+    return OutputFormat.TEXT
+
+
+def json_content(payload: Any) -> list[TextContent]:
+    """Serialize a payload as one compact JSON text block"""
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+    return [TextContent(type="text", text=text)]
+
+
+def error_content(output_format: OutputFormat, message: str) -> list[TextContent]:
+    """An error response: '❌ message' as text, or {"success": false, "error": message}"""
+    if output_format == OutputFormat.JSON:
+        return json_content({"success": False, "error": message})
+    return [TextContent(type="text", text=f"❌ {message}")]
@@ -0,0 +1,137 @@
+"""Token-budgeted packing of rendered messages and search hits"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+# Rough UTF-8 bytes per token for BPE tokenizers. Counting bytes rather than
+# characters keeps the estimate conservative for non-Latin scripts.
+BYTES_PER_TOKEN = 4
+
+# Blocks are only cut to fit when at least this much budget is left for them
+MIN_PARTIAL_TOKENS = 16
+
+TRUNCATION_MARKER = " … [truncated]"
+
+# Relative weight of each ranking signal (all signals are normalized to 0-1)
+SIMILARITY_WEIGHT = 0.6
+RECENCY_WEIGHT = 0.2
+IMPORTANCE_WEIGHT = 0.2
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a string without running a tokenizer"""
+    if not text:
+        return 0
+    if text.isascii():
+        return (len(text) + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+    return (len(text.encode("utf-8")) + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def relevance_score(
+    similarity: float | None = None,
+    importance: float | None = None,
+    recency: float | None = None,
+) -> float:
+    """
+    Combine ranking signals into a single score.
+
+    Args:
+        similarity: Semantic similarity (0.0-1.0)
+        importance: Importance score (0.0-10.0)
+        recency: Relative recency (0.0 = oldest, 1.0 = newest)
+    """
+    score = 0.0
+    if similarity is not None:
+        score += SIMILARITY_WEIGHT * max(0.0, min(float(similarity), 1.0))
+    if importance is not None:
+        score += IMPORTANCE_WEIGHT * max(0.0, min(float(importance) / 10.0, 1.0))
+    if recency is not None:
+        score += RECENCY_WEIGHT * recency
+    return score
+
+
+def recency_ranks(count: int) -> list[float]:
+    """Relative recency for items ordered oldest first"""
+    if count <= 1:
+        return [1.0] * count
+    return [i / (count - 1) for i in range(count)]
+
+
+@dataclass
+class PackResult:
+    """Outcome of packing blocks into a token budget"""
+
+    chunks: list[str] = field(default_factory=list)
+    kept: int = 0
+    truncated: int = 0
+    elided: int = 0
+    tokens: int = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+
+def elision_marker(count: int, noun: str) -> str:
+    """Marker rendered in place of blocks dropped to fit the budget"""
+    return f"\n… [{count} {noun}{'s' if count != 1 else ''} omitted to fit token budget] …\n"
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text so that it plus the truncation marker fits within max_tokens"""
+    suffix = TRUNCATION_MARKER + ("\n" if text.endswith("\n") else "")
+    budget = max_tokens - estimate_tokens(suffix)
+    if budget <= 0:
+        return ""
+    cut = text[: budget * BYTES_PER_TOKEN]
+    while cut and estimate_tokens(cut) > budget:
+        cut = cut[: len(cut) * 9 // 10]
+    return cut.rstrip() + suffix
+
+
+def pack(
+    blocks: Sequence[str], scores: Sequence[float], max_tokens: int, noun: str = "item"
+) -> PackResult:
+    """
+    Select the highest-scoring blocks that fit within a token budget.
+
+    Blocks are chosen greedily by score; the best block that does not fit
+    whole is truncated when enough budget remains. The selection is returned
+    in the original block order, with an elision marker for every run of
+    dropped blocks. Marker cost is reserved up front, so the packed text
+    never exceeds the budget.
+    """
+    if len(blocks) != len(scores):
+        raise ValueError("blocks and scores must have the same length")
+
+    marker_cost = estimate_tokens(elision_marker(len(blocks), noun))
+    remaining = max_tokens - marker_cost
+    selected: dict[int, str] = {}
+    truncated = 0
+
+    for i in sorted(range(len(blocks)), key=lambda j: scores[j], reverse=True):
+        cost = estimate_tokens(blocks[i]) + marker_cost
+        if cost <= remaining:
+            selected[i] = blocks[i]
+            remaining -= cost
+        elif remaining - marker_cost >= MIN_PARTIAL_TOKENS:
+            selected[i] = truncate_to_tokens(blocks[i], remaining - marker_cost)
+            remaining = 0
+            truncated = 1
+
+    result = PackResult(kept=len(selected), truncated=truncated)
+    dropped = 0
+    for i in range(len(blocks)):
+        if i in selected:
+            if dropped:
+                result.chunks.append(elision_marker(dropped, noun))
+                dropped = 0
+            result.chunks.append(selected[i])
+        else:
+            dropped += 1
+            result.elided += 1
+    if dropped:
+        result.chunks.append(elision_marker(dropped, noun))
+
+    result.tokens = sum(estimate_tokens(chunk) for chunk in result.chunks)
+    return result
@@ -0,0 +1,139 @@
+"""Speculative prefetch of the contexts behind top search hits
+
+Agents usually follow ``memory_search`` with ``memory_get_context`` on the
+first hit or two. When prefetching is enabled (``top_n > 0``), each search
+starts background fetches of the full contexts of its top ``top_n`` hits
+whose similarity is at least ``min_similarity``, with at most
+``max_inflight`` fetches running at once. Results are held for ``ttl``
+seconds in a small LRU, and a ``get_context`` call arriving while a
+prefetch is in flight waits for it rather than issuing a second request.
+
+The counters tune the knobs: ``precision`` is the share of prefetches that
+were read before expiring (low means ``top_n`` is too high or the threshold
+too low) and ``coverage`` the share of context reads served by a prefetch
+(low means prefetching misses what agents read).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .cache import TTLCache
+from .timing import detach_timer
+
+logger = logging.getLogger(__name__)
+
+ContextFetcher = Callable[[str], Awaitable[dict[str, Any]]]
+
+
+class Prefetcher:
+    """Background context fetches for search hits, with hit-rate counters"""
+
+    def __init__(
+        self,
+        fetch: ContextFetcher,
+        top_n: int,
+        min_similarity: float,
+        max_inflight: int,
+        ttl: float,
+        maxsize: int,
+    ) -> None:
+        self.fetch = fetch
+        self.top_n = top_n
+        self.min_similarity = min_similarity
+        self.max_inflight = max(1, max_inflight)
+        # conversation id -> {"data": full context data, "used": bool}
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.issued = 0
+        self.failed = 0
+        self.used = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_n > 0
+
+    @property
+    def precision(self) -> float:
+        return self.used / self.issued if self.issued else 0.0
+
+    @property
+    def coverage(self) -> float:
+        reads = self.used + self.misses
+        return self.used / reads if reads else 0.0
+
+    def schedule(self, hits: list[dict[str, Any]]) -> list[str]:
+        """Start fetching contexts for the top hits, returning the ids scheduled"""
+        scheduled: list[str] = []
+        if not self.enabled:
+            return scheduled
+        for hit in hits[: self.top_n]:
+            conv_id = hit.get("conversation_id")
+            if not conv_id or (hit.get("similarity") or 0.0) < self.min_similarity:
+                continue
+            if conv_id in self._inflight or conv_id in self.cache:
+                continue
+            if len(self._inflight) >= self.max_inflight:
+                break
+            task = asyncio.create_task(self._prefetch(conv_id))
+            task.add_done_callback(lambda t, c=conv_id: self._finished(c, t))
+            self._inflight[conv_id] = task
+            self.issued += 1
+            scheduled.append(conv_id)
+        return scheduled
+
+    async def _prefetch(self, conv_id: str) -> dict[str, Any] | None:
+        # Background work; the search's slow-call record must not include it
+        detach_timer()
+        # Yield first so the search response is sent before the prefetch starts
+        await asyncio.sleep(0)
+        try:
+            result = await self.fetch(conv_id)
+        except Exception as e:
+            logger.debug(f"Prefetch of {conv_id} failed: {e}")
+            result = {}
+        if not result.get("success") or "data" not in result:
+            self.failed += 1
+            return None
+
+        entry = {"data": result["data"], "used": False}
+        # A write while the fetch was in flight detached it; don't cache stale data
+        if self._inflight.get(conv_id) is asyncio.current_task():
+            self.cache.set(conv_id, entry)
+        return entry
+
+    def _finished(self, conv_id: str, task: asyncio.Task) -> None:
+        if self._inflight.get(conv_id) is task:
+            del self._inflight[conv_id]
+
+    async def take(self, conv_id: str) -> dict[str, Any] | None:
+        """Prefetched full context data for conv_id, or None (counted as a miss)"""
+        entry = self.cache.get(conv_id)
+        task = self._inflight.get(conv_id)
+        if entry is None and task is not None:
+            entry = await asyncio.shield(task)
+        if entry is None:
+            self.misses += 1
+            return None
+        if not entry["used"]:
+            entry["used"] = True
+            self.used += 1
+        return entry["data"]
+
+    def invalidate(self, conv_id: str | None) -> None:
+        """Forget a conversation that was written, including an in-flight fetch"""
+        if conv_id:
+            self.cache.pop(conv_id)
+            self._inflight.pop(conv_id, None)
+
+    def describe(self) -> str:
+        return (
+            f"{self.used} of {self.issued} prefetches used ({self.precision:.0%}), "
+            f"{self.used} of {self.used + self.misses} context reads served ({self.coverage:.0%})"
+        )
+
+    def reset(self) -> None:
+        self.cache.clear()
+        self.issued = self.failed = self.used = self.misses = 0
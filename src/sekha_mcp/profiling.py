@@ -0,0 +1,131 @@
+"""In-process sampling profiler for the running server
+
+A background thread periodically captures the event loop thread's stack via
+``sys._current_frames`` and aggregates identical stacks. Results are written
+in the collapsed-stack format (``frame;frame;frame count`` per line) read by
+flamegraph.pl, speedscope and similar tools. Nothing runs while the profiler
+is stopped.
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Render a frame chain root-first as 'module:function;...'"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", Path(code.co_filename).stem)
+        names.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """Time-bounded stack sampler for a single target thread"""
+
+    def __init__(self, output_dir: str | Path, interval: float, max_duration: float) -> None:
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.max_duration = max_duration
+        self.samples: Counter[str] = Counter()
+        self.started_at: float | None = None
+        self.last_output: Path | None = None
+        self._target: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float | None = None, thread_id: int | None = None) -> float:
+        """
+        Start sampling thread_id (default: the calling thread) in the background.
+
+        Sampling stops on its own after `duration` seconds (capped at
+        max_duration) and the profile is written out. Returns the effective
+        duration.
+        """
+        with self._lock:
+            if self.running:
+                raise RuntimeError("Profiler is already running")
+
+            duration = min(duration or self.max_duration, self.max_duration)
+            self.samples = Counter()
+            self.started_at = time.monotonic()
+            self._target = thread_id if thread_id is not None else threading.get_ident()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(duration,), name="sekha-profiler", daemon=True
+            )
+            self._thread.start()
+
+        logger.info(f"Profiler started for {duration:.0f}s")
+        return duration
+
+    def stop(self) -> Path | None:
+        """Stop sampling and return the written profile path (None if not running)"""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return None
+            self._stop.set()
+            thread.join()
+            self._thread = None
+        return self.last_output
+
+    def _run(self, duration: float) -> None:
+        deadline = time.monotonic() + duration
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self.samples[_collapse(frame)] += 1
+        self.last_output = self._write()
+
+    def _write(self) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self.output_dir / f"sekha-profile-{stamp}-{os.getpid()}.folded"
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(f"Profile with {sum(self.samples.values())} samples written to {path}")
+        return path
+
+
+def toggle() -> None:
+    """Start or stop the profiler; installed as the SIGUSR1 handler"""
+    if profiler.running:
+        profiler.stop()
+    else:
+        profiler.start()
+
+
+def install_signal_handler(loop) -> bool:
+    """Toggle profiling on SIGUSR1 when profiling is enabled (POSIX only)"""
+    if not settings.profiling_enabled or not hasattr(signal, "SIGUSR1"):
+        return False
+    loop.add_signal_handler(signal.SIGUSR1, toggle)
+    logger.info("Profiling enabled; send SIGUSR1 to start or stop a profile")
+    return True
+
+
+profiler = SamplingProfiler(
+    output_dir=settings.profile_dir,
+    interval=settings.profile_interval_ms / 1000,
+    max_duration=settings.profile_max_seconds,
+)
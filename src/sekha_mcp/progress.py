@@ -0,0 +1,31 @@
+"""MCP progress notifications for long-running tool calls"""
+
+import logging
+
+from mcp.server.lowlevel.server import request_ctx
+
+logger = logging.getLogger(__name__)
+
+
+async def report_progress(progress: float, total: float | None = None, message: str | None = None):
+    """
+    Send a progress notification for the tool call being handled.
+
+    A no-op outside of a request, or when the client did not ask for progress
+    by sending a progressToken, so tools can call it unconditionally.
+    """
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return
+
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return
+
+    try:
+        await ctx.session.send_progress_notification(
+            token, progress, total=total, message=message, related_request_id=ctx.request_id
+        )
+    except Exception as e:
+        logger.debug(f"Progress notification dropped: {e}")
@@ -0,0 +1,163 @@
+"""MCP resources for conversations and folders, with change subscriptions
+
+Conversations are exposed as ``sekha://conversation/{id}`` and folders as
+``sekha://folder/{path}`` (path without its leading slash). Reading a
+conversation returns its controller context as JSON; reading a folder returns
+the controller's statistics for that folder.
+
+Clients that subscribe to a URI receive ``notifications/resources/updated``
+whenever a tool call stores or updates something behind it, so they can
+cache resource contents and refetch only on change.
+"""
+
+import json
+import logging
+import weakref
+from typing import Any
+from urllib.parse import quote, unquote
+
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.types import Resource, ResourceTemplate
+from pydantic import AnyUrl
+
+from .client import sekha_client
+
+logger = logging.getLogger(__name__)
+
+SCHEME = "sekha"
+CONVERSATION_PREFIX = f"{SCHEME}://conversation/"
+FOLDER_PREFIX = f"{SCHEME}://folder/"
+JSON_MIME = "application/json"
+
+RESOURCE_TEMPLATES = [
+    ResourceTemplate(
+        uriTemplate=CONVERSATION_PREFIX + "{conversation_id}",
+        name="conversation",
+        description="A stored conversation with its messages and metadata",
+        mimeType=JSON_MIME,
+    ),
+    ResourceTemplate(
+        uriTemplate=FOLDER_PREFIX + "{path}",
+        name="folder",
+        description="Statistics for a conversation folder (path without leading slash)",
+        mimeType=JSON_MIME,
+    ),
+]
+
+
+def conversation_uri(conversation_id: str) -> str:
+    return CONVERSATION_PREFIX + quote(conversation_id, safe="")
+
+
+def folder_uri(folder: str) -> str:
+    return FOLDER_PREFIX + quote(folder.lstrip("/"), safe="/")
+
+
+def parse_uri(uri: str) -> tuple[str, str]:
+    """Split a resource URI into ('conversation', id) or ('folder', '/path')"""
+    if uri.startswith(CONVERSATION_PREFIX):
+        conversation_id = unquote(uri[len(CONVERSATION_PREFIX) :])
+        if conversation_id:
+            return "conversation", conversation_id
+    elif uri.startswith(FOLDER_PREFIX):
+        return "folder", "/" + unquote(uri[len(FOLDER_PREFIX) :]).strip("/")
+    raise ValueError(f"Unknown resource: {uri}")
+
+
+async def list_resources() -> list[Resource]:
+    """List one resource per folder known to the controller"""
+    result = await sekha_client.get_stats()
+    if not result.get("success") or "data" not in result:
+        raise ValueError(result.get("error", "Stats retrieval failed"))
+
+    return [
+        Resource(
+            uri=AnyUrl(folder_uri(folder)),
+            name=folder,
+            description=f"Conversation folder {folder}",
+            mimeType=JSON_MIME,
+        )
+        for folder in result["data"].get("folders", [])
+    ]
+
+
+async def read_resource(uri: str) -> list[ReadResourceContents]:
+    """Fetch a conversation or folder resource from the controller as JSON"""
+    kind, key = parse_uri(uri)
+    if kind == "conversation":
+        result = await sekha_client.get_context(key)
+    else:
+        result = await sekha_client.get_stats(folder=key)
+
+    if not result.get("success") or "data" not in result:
+        raise ValueError(f"{uri}: {result.get('error', 'Not found')}")
+
+    text = json.dumps(result["data"], ensure_ascii=False, separators=(",", ":"), default=str)
+    return [ReadResourceContents(content=text, mime_type=JSON_MIME)]
+
+
+class Subscriptions:
+    """Resource URIs each client session has subscribed to
+
+    Sessions are held weakly so a disconnected client drops out on its own.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, weakref.WeakSet] = {}
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        self._sessions.setdefault(uri, weakref.WeakSet()).add(session)
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        sessions = self._sessions.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[uri]
+
+    def __contains__(self, uri: str) -> bool:
+        return bool(self._sessions.get(uri))
+
+    def watches_folders(self) -> bool:
+        return any(uri.startswith(FOLDER_PREFIX) for uri in self._sessions)
+
+    async def notify(self, uris: list[str]) -> int:
+        """Send resources/updated to every session subscribed to any of uris"""
+        sent = 0
+        for uri in uris:
+            for session in list(self._sessions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                    sent += 1
+                except Exception as e:
+                    logger.warning(f"Dropping subscriber to {uri}: {e}")
+                    self.unsubscribe(uri, session)
+        return sent
+
+
+subscriptions = Subscriptions()
+
+
+async def notify_changed(conversation_id: str | None, folders: list[str | None]) -> int:
+    """Notify subscribers that a conversation and the given folders changed"""
+    uris = list(dict.fromkeys(folder_uri(folder) for folder in folders if folder))
+    if conversation_id:
+        uris.insert(0, conversation_uri(conversation_id))
+    return await subscriptions.notify(uris)
+
+
+async def current_folder(conversation_id: str) -> str | None:
+    """A conversation's folder ahead of a write, so that folder's subscribers hear of it
+
+    Local copies answer when they can; otherwise the controller is only asked
+    while some session is subscribed to a folder.
+    """
+    folder = sekha_client.folder_of(conversation_id)
+    if folder is not None or not subscriptions.watches_folders():
+        return folder
+    try:
+        result = await sekha_client.get_context(conversation_id, limit=0)
+    except Exception as e:
+        logger.debug(f"Folder lookup for {conversation_id} failed: {e}")
+        return None
+    return (result.get("data") or {}).get("folder")
@@ -5,15 +5,30 @@ import logging
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
+from pydantic import AnyUrl
 
+from . import resources
+from .client import sekha_client
 from .config import settings
+from .health import health_monitor
+from .profiling import install_signal_handler
+from .timing import log_if_slow, timed_call
 from .tools.memory_export import MEMORY_EXPORT_TOOL, memory_export_tool
 from .tools.memory_get_context import MEMORY_GET_CONTEXT_TOOL, memory_get_context_tool
+from .tools.memory_get_context_batch import (
+    MEMORY_GET_CONTEXT_BATCH_TOOL,
+    memory_get_context_batch_tool,
+)
+from .tools.memory_import import MEMORY_IMPORT_TOOL, memory_import_tool
+from .tools.memory_profile import MEMORY_PROFILE_TOOL, memory_profile_tool
 from .tools.memory_prune import MEMORY_PRUNE_TOOL, memory_prune_tool
+from .tools.memory_prune_apply import MEMORY_PRUNE_APPLY_TOOL, memory_prune_apply_tool
+from .tools.memory_recall import MEMORY_RECALL_TOOL, memory_recall_tool
 from .tools.memory_search import MEMORY_SEARCH_TOOL, memory_search_tool
 from .tools.memory_stats import MEMORY_STATS_TOOL, memory_stats_tool
 from .tools.memory_store import MEMORY_STORE_TOOL, memory_store_tool
 from .tools.memory_update import MEMORY_UPDATE_TOOL, memory_update_tool
+from .tools.memory_update_batch import MEMORY_UPDATE_BATCH_TOOL, memory_update_batch_tool
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +45,7 @@ app = Server(settings.server_name)
 @app.list_tools()
 async def list_tools():
     """Register available MCP tools"""
-    return [
+    tools = [
         MEMORY_STORE_TOOL,
         MEMORY_SEARCH_TOOL,
         MEMORY_UPDATE_TOOL,
@@ -38,7 +53,15 @@ async def list_tools():
         MEMORY_PRUNE_TOOL,
         MEMORY_EXPORT_TOOL,
         MEMORY_STATS_TOOL,
+        MEMORY_RECALL_TOOL,
+        MEMORY_UPDATE_BATCH_TOOL,
+        MEMORY_GET_CONTEXT_BATCH_TOOL,
+        MEMORY_PRUNE_APPLY_TOOL,
     ]
+    if settings.admin_tools_enabled:
+        # Both touch the server host: files read and written, process profiling
+        tools += [MEMORY_IMPORT_TOOL, MEMORY_PROFILE_TOOL]
+    return tools
 
 
 @app.call_tool()
@@ -54,21 +77,79 @@ async def call_tool(name: str, arguments: dict):
         "memory_prune": memory_prune_tool,
         "memory_export": memory_export_tool,
         "memory_stats": memory_stats_tool,
+        "memory_recall": memory_recall_tool,
+        "memory_update_batch": memory_update_batch_tool,
+        "memory_get_context_batch": memory_get_context_batch_tool,
+        "memory_prune_apply": memory_prune_apply_tool,
     }
+    if settings.admin_tools_enabled:
+        tools["memory_import"] = memory_import_tool
+        tools["memory_profile"] = memory_profile_tool
 
     if name not in tools:
         raise ValueError(f"Unknown tool: {name}")
 
-    return await tools[name](arguments)
+    with timed_call(name) as timer:
+        result = await tools[name](arguments)
+    log_if_slow(timer, settings.slow_call_threshold_ms, arguments, result)
+    return result
+
+
+@app.list_resources()
+async def list_resources():
+    """List folder resources known to the controller"""
+    return await resources.list_resources()
+
+
+@app.list_resource_templates()
+async def list_resource_templates():
+    """Advertise the conversation and folder URI templates"""
+    return resources.RESOURCE_TEMPLATES
+
+
+@app.read_resource()
+async def read_resource(uri: AnyUrl):
+    """Read a conversation or folder resource"""
+    return await resources.read_resource(str(uri))
+
+
+@app.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl):
+    """Send resources/updated notifications for uri to the calling session"""
+    resources.subscriptions.subscribe(str(uri), app.request_context.session)
+
+
+@app.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl):
+    """Stop notifications for uri to the calling session"""
+    resources.subscriptions.unsubscribe(str(uri), app.request_context.session)
+
+
+def initialization_options():
+    """Initialization options, advertising resource subscriptions"""
+    options = app.create_initialization_options()
+    # The low-level server always reports subscribe=False; the handlers above support it
+    if options.capabilities.resources is not None:
+        options.capabilities.resources.subscribe = True
+    return options
 
 
 async def main():
     """Start MCP server using stdio transport"""
     logger.info(f"🚀 Starting {settings.server_name} v{settings.server_version}")
     logger.info(f"📡 Connected to Sekha Controller: {settings.controller_url}")
-
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    install_signal_handler(asyncio.get_running_loop())
+    if settings.health_check_interval > 0:
+        health_monitor.start()
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, initialization_options())
+    finally:
+        await health_monitor.stop()
+        await sekha_client.aclose()
+        if sekha_client.index is not None and sekha_client.index.dirty:
+            sekha_client.index.save()
 
 
 if __name__ == "__main__":
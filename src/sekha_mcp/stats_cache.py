@@ -0,0 +1,128 @@
+"""Stale-while-revalidate cache for controller statistics
+
+Stats are one of the heavier controller queries and agents poll them often.
+Each folder (None for the global view) is served from memory while younger
+than ``ttl``; between ``ttl`` and ``max_stale`` the cached value is returned
+immediately and a single background refresh is started; older entries are
+fetched before returning. Concurrent fetches for a folder share one request.
+
+Local writes adjust cached counts where the effect is known (a stored
+conversation adds one to its folder and the global totals) and mark those
+entries stale, so the next read returns the adjusted value and refreshes in
+the background. Any other write drops every entry, so the next read waits for
+a fetch that sees it; stale-while-revalidate only covers age.
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .timing import record_cache
+
+logger = logging.getLogger(__name__)
+
+StatsFetcher = Callable[[str | None], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class _Entry:
+    result: dict[str, Any]
+    fetched_at: float
+    stale: bool = False
+
+
+class StatsCache:
+    """Per-folder stats responses refreshed on staleness"""
+
+    def __init__(
+        self,
+        fetch: StatsFetcher,
+        ttl: float,
+        max_stale: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self._clock = clock
+        self._entries: dict[str | None, _Entry] = {}
+        self._inflight: dict[str | None, asyncio.Task] = {}
+        # Bumped by writes so fetches begun before one are not cached
+        self._generation = 0
+
+    async def get(self, folder: str | None = None) -> dict[str, Any]:
+        """Return stats for folder, at most max_stale seconds old"""
+        if self.ttl <= 0:
+            return await self.fetch(folder)
+
+        entry = self._entries.get(folder)
+        if entry is not None:
+            age = self._clock() - entry.fetched_at
+            if age < self.ttl and not entry.stale:
+                record_cache("hit")
+                return entry.result
+            if age < self.max_stale:
+                record_cache("stale")
+                self._start_refresh(folder)
+                return entry.result
+
+        record_cache("miss")
+        return await asyncio.shield(self._start_refresh(folder))
+
+    def _start_refresh(self, folder: str | None) -> asyncio.Task:
+        task = self._inflight.get(folder)
+        if task is None:
+            task = asyncio.create_task(self._refresh(folder))
+            # Background failures are logged in _refresh; mark them retrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[folder] = task
+        return task
+
+    async def _refresh(self, folder: str | None) -> dict[str, Any]:
+        generation = self._generation
+        try:
+            result = await self.fetch(folder)
+            if result.get("success") and "data" in result and generation == self._generation:
+                self._entries[folder] = _Entry(result, self._clock())
+            return result
+        except Exception as e:
+            # Background refreshes have no caller to raise to; keep serving the old value
+            logger.warning(f"Stats refresh for {folder or 'all folders'} failed: {e}")
+            raise
+        finally:
+            if self._inflight.get(folder) is asyncio.current_task():
+                del self._inflight[folder]
+
+    def record_store(self, folder: str | None) -> None:
+        """Count a conversation stored locally in folder; affected entries refresh next read"""
+        self._detach_inflight()
+        for key in {None, folder}:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            result = copy.deepcopy(entry.result)
+            data = result["data"]
+            data["total_conversations"] = data.get("total_conversations", 0) + 1
+            if key is None and folder and folder not in data.setdefault("folders", []):
+                data["folders"].append(folder)
+            self._entries[key] = _Entry(result, entry.fetched_at, stale=True)
+
+    def invalidate(self) -> None:
+        """Drop every entry after a write whose effect on stats is unknown
+
+        Fetches already in flight are detached, so the next read starts one
+        that sees the write instead of joining one that may not.
+        """
+        self._entries.clear()
+        self._detach_inflight()
+
+    def _detach_inflight(self) -> None:
+        self._inflight.clear()
+        self._generation += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,5 @@
+"""Test and benchmark support for Sekha MCP Server"""
+
+from .fake_controller import ErrorInjection, FakeController, LatencyModel
+
+__all__ = ["FakeController", "LatencyModel", "ErrorInjection"]
@@ -0,0 +1,6 @@
+"""Serve the fake Sekha Controller: python -m sekha_mcp.testing --help"""
+
+from .fake_controller import main
+
+if __name__ == "__main__":
+    main()
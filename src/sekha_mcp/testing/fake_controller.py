@@ -0,0 +1,474 @@
+"""In-process stand-in for the Sekha Controller (Rust core)
+
+FakeController is a plain ASGI application implementing the controller
+endpoints used by SekhaClient. Use it in-process through
+``httpx.ASGITransport`` for offline tests, or serve it on a local port
+(``python -m sekha_mcp.testing``) to drive a real MCP
+server process in benchmarks.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import re
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Responses at least this large are gzipped for clients that accept it
+COMPRESS_MIN_BYTES = 1024
+
+
+@dataclass
+class LatencyModel:
+    """Per-request latency distribution, in milliseconds
+
+    Supported distributions: ``constant`` (mean), ``uniform`` (mean +/- jitter),
+    ``normal`` (mean, stddev=jitter) and ``lognormal`` (median=mean,
+    sigma=jitter / mean). Samples are clamped at zero.
+    """
+
+    distribution: str = "constant"
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency sample in seconds"""
+        if self.distribution == "constant" or self.mean_ms <= 0:
+            ms = self.mean_ms
+        elif self.distribution == "uniform":
+            ms = rng.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.mean_ms, self.jitter_ms)
+        elif self.distribution == "lognormal":
+            ms = rng.lognormvariate(0.0, self.jitter_ms / self.mean_ms) * self.mean_ms
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        return max(ms, 0.0) / 1000.0
+
+
+@dataclass
+class ErrorInjection:
+    """Fraction of requests answered with an injected error status"""
+
+    rate: float = 0.0
+    status_codes: tuple[int, ...] = (500, 503)
+
+    def pick(self, rng: random.Random) -> int | None:
+        """Return a status code to fail with, or None to serve normally"""
+        if self.rate > 0 and rng.random() < self.rate:
+            return rng.choice(self.status_codes)
+        return None
+
+
+@dataclass
+class FakeController:
+    """ASGI app emulating the Sekha Controller endpoints
+
+    ``latency`` and ``errors`` apply to every endpoint unless overridden per
+    endpoint name (e.g. ``"memory_search"``, ``"stats"`` or ``"health"``) in
+    ``endpoint_latency`` / ``endpoint_errors``.
+    """
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    errors: ErrorInjection = field(default_factory=ErrorInjection)
+    endpoint_latency: dict[str, LatencyModel] = field(default_factory=dict)
+    endpoint_errors: dict[str, ErrorInjection] = field(default_factory=dict)
+    api_key: str | None = None
+    seed: int = 0
+    conversations: dict[str, dict[str, Any]] = field(default_factory=dict)
+    request_counts: Counter = field(default_factory=Counter)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._routes = {
+            ("POST", "/mcp/tools/memory_store"): ("memory_store", self._store),
+            ("POST", "/mcp/tools/memory_append"): ("memory_append", self._append),
+            ("POST", "/mcp/tools/memory_search"): ("memory_search", self._search),
+            ("POST", "/mcp/tools/memory_update"): ("memory_update", self._update),
+            ("POST", "/mcp/tools/memory_get_context"): ("memory_get_context", self._context),
+            ("POST", "/mcp/tools/memory_prune"): ("memory_prune", self._prune),
+            ("GET", "/api/v1/stats"): ("stats", self._stats),
+            ("GET", "/api/v1/conversations/ids"): ("list_ids", self._list_ids),
+            ("DELETE", "/api/v1/conversations/{id}"): ("delete", self._delete),
+            ("GET", "/health"): ("health", self._health),
+        }
+
+    # -- Dataset management --
+
+    def add_conversation(self, conversation: dict[str, Any]) -> str:
+        """Insert a conversation record (export or store format) and return its id"""
+        conv_id = conversation.get("conversation_id") or str(uuid.uuid4())
+        now = _now()
+        self.conversations[conv_id] = {
+            "conversation_id": conv_id,
+            "label": conversation.get("label", "Untitled"),
+            "folder": conversation.get("folder", "/"),
+            "status": conversation.get("status", "active"),
+            "importance_score": conversation.get("importance_score", 5.0),
+            "created_at": conversation.get("created_at") or now,
+            "updated_at": conversation.get("updated_at") or now,
+            "messages": list(conversation.get("messages", [])),
+        }
+        return conv_id
+
+    def load_dataset(self, path: str | Path) -> int:
+        """Load conversations from a JSON array or NDJSON file, returning the count"""
+        text = Path(path).read_text(encoding="utf-8")
+        stripped = text.lstrip()
+        if stripped.startswith("["):
+            records = json.loads(stripped)
+        else:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+        for record in records:
+            self.add_conversation(record)
+        return len(records)
+
+    def generate_dataset(
+        self, count: int, messages_per_conversation: int = 10, content_chars: int = 200
+    ) -> list[str]:
+        """Populate deterministic synthetic conversations and return their ids"""
+        words = ["memory", "rust", "python", "vector", "search", "agent", "context", "folder"]
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        ids = []
+        for i in range(count):
+            created = start + timedelta(hours=i)
+            messages = []
+            for j in range(messages_per_conversation):
+                body = " ".join(self._rng.choice(words) for _ in range(content_chars // 7))
+                messages.append(
+                    {
+                        "role": "user" if j % 2 == 0 else "assistant",
+                        "content": f"{body} #{i}-{j}"[:content_chars],
+                        "timestamp": (created + timedelta(minutes=j)).isoformat(),
+                    }
+                )
+            ids.append(
+                self.add_conversation(
+                    {
+                        "conversation_id": str(uuid.UUID(int=self._rng.getrandbits(128))),
+                        "label": f"Conversation {i} about {self._rng.choice(words)}",
+                        "folder": f"/bench/{i % 5}",
+                        "importance_score": round(self._rng.uniform(0, 10), 1),
+                        "created_at": created.isoformat(),
+                        "messages": messages,
+                    }
+                )
+            )
+        return ids
+
+    # -- ASGI entry point --
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        path, delete_id = scope["path"], None
+        if scope["method"] == "DELETE" and path.startswith("/api/v1/conversations/"):
+            path, _, delete_id = path.rpartition("/")
+            path += "/{id}"
+        route = self._routes.get((scope["method"], path))
+        if route is None:
+            await _respond(send, 404, {"success": False, "error": "Not found"})
+            return
+        name, handler = route
+        self.request_counts[name] += 1
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        delay = self.endpoint_latency.get(name, self.latency).sample(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers = dict(scope.get("headers", []))
+        if (
+            self.api_key is not None
+            and name != "health"
+            and headers.get(b"authorization") != f"Bearer {self.api_key}".encode()
+        ):
+            await _respond(send, 401, {"success": False, "error": "Unauthorized"})
+            return
+
+        injected = self.endpoint_errors.get(name, self.errors).pick(self._rng)
+        if injected is not None:
+            await _respond(send, injected, {"success": False, "error": "Injected failure"})
+            return
+
+        encoding = headers.get(b"content-encoding", b"identity")
+        if encoding == b"gzip":
+            body = gzip.decompress(body)
+        elif encoding != b"identity":
+            await _respond(send, 415, {"success": False, "error": "Unsupported encoding"})
+            return
+        compress = b"gzip" in headers.get(b"accept-encoding", b"")
+
+        try:
+            if delete_id is not None:
+                payload = {"conversation_id": delete_id}
+            elif scope["method"] == "GET":
+                query = parse_qs(scope.get("query_string", b"").decode())
+                payload = {k: v[-1] for k, v in query.items()}
+            else:
+                payload = json.loads(body or b"{}")
+        except ValueError:
+            await _respond(send, 400, {"success": False, "error": "Invalid JSON body"})
+            return
+
+        status, response = handler(payload)
+        await _respond(send, status, response, compress)
+
+    # -- Endpoint handlers --
+
+    def _store(self, payload: dict) -> tuple[int, dict]:
+        if not payload.get("label") or not payload.get("messages"):
+            return 400, {"success": False, "error": "label and messages are required"}
+        conv_id = self.add_conversation({k: v for k, v in payload.items() if k != "status"})
+        return 200, {
+            "success": True,
+            "data": {"conversation_id": conv_id, "message_count": len(payload["messages"])},
+        }
+
+    def _append(self, payload: dict) -> tuple[int, dict]:
+        conv = self.conversations.get(payload.get("conversation_id", ""))
+        if conv is None:
+            return 404, {"success": False, "error": "Conversation not found"}
+        if not payload.get("messages"):
+            return 400, {"success": False, "error": "messages are required"}
+        conv["messages"].extend(payload["messages"])
+        conv["updated_at"] = _now()
+        return 200, {
+            "success": True,
+            "data": {
+                "conversation_id": conv["conversation_id"],
+                "message_count": len(conv["messages"]),
+            },
+        }
+
+    def _search(self, payload: dict) -> tuple[int, dict]:
+        terms = set(_TOKEN_RE.findall(str(payload.get("query", "")).lower()))
+        labels = set(payload.get("filter_labels") or [])
+        limit = int(payload.get("limit", 10))
+        offset = int(payload.get("offset", 0))
+
+        scored = []
+        for conv in self.conversations.values():
+            if labels and conv["label"] not in labels:
+                continue
+            text = " ".join([conv["label"], *(m.get("content", "") for m in conv["messages"])])
+            words = set(_TOKEN_RE.findall(text.lower()))
+            if not terms or not words:
+                continue
+            similarity = len(terms & words) / len(terms)
+            if similarity > 0:
+                scored.append((similarity, conv, text))
+
+        scored.sort(key=lambda item: (-item[0], item[1]["created_at"]))
+        page = scored[offset : offset + limit]
+        results = [
+            {
+                "conversation_id": conv["conversation_id"],
+                "label": conv["label"],
+                "folder": conv["folder"],
+                "content": text[:1000],
+                "similarity": round(similarity, 4),
+                "importance_score": conv["importance_score"],
+                "created_at": conv["created_at"],
+            }
+            for similarity, conv, text in page
+        ]
+        return 200, {
+            "success": True,
+            "data": {"results": results, "has_more": offset + limit < len(scored)},
+        }
+
+    def _update(self, payload: dict) -> tuple[int, dict]:
+        conv = self.conversations.get(payload.get("conversation_id", ""))
+        if conv is None:
+            return 404, {"success": False, "error": "Conversation not found"}
+
+        updated = []
+        for key in ("label", "folder", "importance_score", "status"):
+            if key in payload and conv.get(key) != payload[key]:
+                conv[key] = payload[key]
+                updated.append(key)
+        if updated:
+            conv["updated_at"] = _now()
+        return 200, {"success": True, "data": {"updated_fields": updated}}
+
+    def _context(self, payload: dict) -> tuple[int, dict]:
+        conv = self.conversations.get(payload.get("conversation_id", ""))
+        if conv is None:
+            return 404, {"success": False, "error": "Conversation not found"}
+
+        messages = conv["messages"]
+        since, until = payload.get("since"), payload.get("until")
+        if since or until:
+            messages = [
+                m
+                for m in messages
+                if (not since or _ts(m.get("timestamp")) >= _ts(since))
+                and (not until or _ts(m.get("timestamp")) <= _ts(until))
+            ]
+
+        total = len(messages)
+        if payload.get("tail") is not None:
+            start = max(total - int(payload["tail"]), 0)
+            end = total
+        else:
+            start = min(int(payload.get("offset") or 0), total)
+            limit = payload.get("limit")
+            end = total if limit is None else start + int(limit)
+
+        data = {k: v for k, v in conv.items() if k != "messages"}
+        data.update(
+            {
+                "messages": messages[start:end],
+                "total_messages": total,
+                "offset": start,
+                "word_count": sum(len(m.get("content", "").split()) for m in conv["messages"]),
+            }
+        )
+        return 200, {"success": True, "data": data}
+
+    def _prune(self, payload: dict) -> tuple[int, dict]:
+        threshold_days = int(payload.get("threshold_days", 30))
+        importance_threshold = payload.get("importance_threshold")
+        now = datetime.now(timezone.utc)
+
+        suggestions = []
+        for conv in self.conversations.values():
+            age_days = (now - _ts(conv["created_at"])).days
+            if age_days < threshold_days:
+                continue
+            if importance_threshold is not None and conv["importance_score"] >= float(
+                importance_threshold
+            ):
+                continue
+            suggestions.append(
+                {
+                    "conversation_id": conv["conversation_id"],
+                    "label": conv["label"],
+                    "age_days": age_days,
+                    "importance_score": conv["importance_score"],
+                    "reason": f"Older than {threshold_days} days",
+                }
+            )
+        if "limit" not in payload:
+            return 200, {"success": True, "data": {"suggestions": suggestions}}
+
+        offset, limit = int(payload.get("offset", 0)), int(payload["limit"])
+        return 200, {
+            "success": True,
+            "data": {
+                "suggestions": suggestions[offset : offset + limit],
+                "has_more": offset + limit < len(suggestions),
+            },
+        }
+
+    def _delete(self, payload: dict) -> tuple[int, dict]:
+        if self.conversations.pop(payload["conversation_id"], None) is None:
+            return 404, {"success": False, "error": "Conversation not found"}
+        return 200, {"success": True, "data": {"deleted": payload["conversation_id"]}}
+
+    def _list_ids(self, payload: dict) -> tuple[int, dict]:
+        offset = int(payload.get("offset", 0))
+        limit = int(payload.get("limit", 1000))
+        ids = list(self.conversations)
+        return 200, {
+            "success": True,
+            "data": {
+                "conversation_ids": ids[offset : offset + limit],
+                "has_more": offset + limit < len(ids),
+            },
+        }
+
+    def _stats(self, payload: dict) -> tuple[int, dict]:
+        folder = payload.get("folder")
+        convs = [
+            c for c in self.conversations.values() if not folder or c["folder"].startswith(folder)
+        ]
+        average = sum(c["importance_score"] for c in convs) / len(convs) if convs else 0.0
+        return 200, {
+            "success": True,
+            "data": {
+                "total_conversations": len(convs),
+                "average_importance": average,
+                "folders": sorted({c["folder"] for c in convs}),
+            },
+        }
+
+    def _health(self, payload: dict) -> tuple[int, dict]:
+        return 200, {"status": "healthy"}
+
+
+async def _respond(send: Any, status: int, body: dict, compress: bool = False) -> None:
+    raw = json.dumps(body).encode("utf-8")
+    headers = [(b"content-type", b"application/json")]
+    if compress and len(raw) >= COMPRESS_MIN_BYTES:
+        raw = gzip.compress(raw)
+        headers.append((b"content-encoding", b"gzip"))
+    headers.append((b"content-length", str(len(raw)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": raw})
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _ts(value: Any) -> datetime:
+    """Parse an ISO 8601 timestamp (naive values are UTC; missing sorts first)"""
+    if not value:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve a FakeController over HTTP (requires uvicorn)"""
+    parser = argparse.ArgumentParser(description="Run a fake Sekha Controller")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--dataset", help="JSON or NDJSON file of conversations to load")
+    parser.add_argument("--generate", type=int, default=0, help="Synthetic conversations")
+    parser.add_argument("--messages", type=int, default=10, help="Messages per synthetic one")
+    parser.add_argument("--latency", default="constant", help="Latency distribution")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    controller = FakeController(
+        latency=LatencyModel(args.latency, args.latency_ms, args.jitter_ms),
+        errors=ErrorInjection(rate=args.error_rate),
+        seed=args.seed,
+    )
+    if args.dataset:
+        controller.load_dataset(args.dataset)
+    if args.generate:
+        controller.generate_dataset(args.generate, args.messages)
+
+    uvicorn.run(controller, host=args.host, port=args.port, log_level="warning")
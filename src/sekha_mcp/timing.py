@@ -0,0 +1,127 @@
+"""Per-call phase timing for the slow-call log
+
+``call_tool`` opens a PhaseTimer for each tool call and stores it in a context
+variable; tools and the client add phase durations, controller requests,
+cache outcomes and retries to whichever timer is current. Without a current
+timer every recording helper is a no-op, so tools called directly (tests,
+scripts) pay only a context variable lookup.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("sekha_mcp.slow_calls")
+
+_current: ContextVar["PhaseTimer | None"] = ContextVar("sekha_phase_timer", default=None)
+
+
+@dataclass
+class PhaseTimer:
+    """Monotonic-clock breakdown of one tool call"""
+
+    tool: str
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    requests: list[tuple[str, float]] = field(default_factory=list)
+    cache: list[str] = field(default_factory=list)
+    retries: int = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def record(self, argument_bytes: int, response_bytes: int) -> dict[str, Any]:
+        """Build the structured slow-call record"""
+        controller = sum(seconds for _, seconds in self.requests)
+        return {
+            "tool": self.tool,
+            "total_ms": round(self.elapsed * 1000, 2),
+            "argument_bytes": argument_bytes,
+            "response_bytes": response_bytes,
+            "validation_ms": round(self.phases.get("validate", 0.0) * 1000, 2),
+            "controller_ms": round(controller * 1000, 2),
+            "controller_requests": [
+                {"path": path, "ms": round(seconds * 1000, 2)} for path, seconds in self.requests
+            ],
+            "render_ms": round(self.phases.get("render", 0.0) * 1000, 2),
+            "cache": ",".join(self.cache) if self.cache else "none",
+            "retries": self.retries,
+        }
+
+
+@contextmanager
+def timed_call(tool: str) -> Iterator[PhaseTimer]:
+    """Make a fresh PhaseTimer current for the duration of a tool call"""
+    timer = PhaseTimer(tool)
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Accumulate the enclosed block's duration under `name` on the current timer"""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - started)
+
+
+def detach_timer() -> None:
+    """Stop recording on the caller's timer for the rest of the current task
+
+    Background tasks copy the context of the call that started them; calling
+    this first keeps their work out of that call's slow-call record.
+    """
+    _current.set(None)
+
+
+def record_request(path: str, seconds: float) -> None:
+    """Record one controller request on the current timer"""
+    timer = _current.get()
+    if timer is not None:
+        timer.requests.append((path, seconds))
+
+
+def record_cache(outcome: str) -> None:
+    """Record a cache outcome such as 'hit', 'miss' or 'stale' on the current timer"""
+    timer = _current.get()
+    if timer is not None:
+        timer.cache.append(outcome)
+
+
+def record_retry() -> None:
+    """Count one retried controller request on the current timer"""
+    timer = _current.get()
+    if timer is not None:
+        timer.retries += 1
+
+
+def log_if_slow(
+    timer: PhaseTimer, threshold_ms: float, arguments: dict, result: list[Any]
+) -> dict[str, Any] | None:
+    """Emit one structured record when the call exceeded threshold_ms (0 disables)"""
+    if threshold_ms <= 0 or timer.elapsed * 1000 < threshold_ms:
+        return None
+
+    argument_bytes = len(json.dumps(arguments, default=str).encode("utf-8"))
+    response_bytes = sum(len(getattr(item, "text", "").encode("utf-8")) for item in result)
+    record = timer.record(argument_bytes, response_bytes)
+    logger.warning(f"Slow tool call: {json.dumps(record)}", extra={"slow_call": record})
+    return record
@@ -3,11 +3,17 @@
 # Only export tool functions and definitions from this package
 from .memory_export import MEMORY_EXPORT_TOOL, memory_export_tool
 from .memory_get_context import MEMORY_GET_CONTEXT_TOOL, memory_get_context_tool
+from .memory_get_context_batch import MEMORY_GET_CONTEXT_BATCH_TOOL, memory_get_context_batch_tool
+from .memory_import import MEMORY_IMPORT_TOOL, memory_import_tool
+from .memory_profile import MEMORY_PROFILE_TOOL, memory_profile_tool
 from .memory_prune import MEMORY_PRUNE_TOOL, memory_prune_tool
+from .memory_prune_apply import MEMORY_PRUNE_APPLY_TOOL, memory_prune_apply_tool
+from .memory_recall import MEMORY_RECALL_TOOL, memory_recall_tool
 from .memory_search import MEMORY_SEARCH_TOOL, memory_search_tool
 from .memory_stats import MEMORY_STATS_TOOL, memory_stats_tool
 from .memory_store import MEMORY_STORE_TOOL, memory_store_tool
 from .memory_update import MEMORY_UPDATE_TOOL, memory_update_tool
+from .memory_update_batch import MEMORY_UPDATE_BATCH_TOOL, memory_update_batch_tool
 
 __all__ = [
     # Tool functions
@@ -18,6 +24,12 @@ __all__ = [
     "memory_prune_tool",
     "memory_export_tool",
     "memory_stats_tool",
+    "memory_recall_tool",
+    "memory_update_batch_tool",
+    "memory_get_context_batch_tool",
+    "memory_prune_apply_tool",
+    "memory_import_tool",
+    "memory_profile_tool",
     # Tool definitions
     "MEMORY_STORE_TOOL",
     "MEMORY_SEARCH_TOOL",
@@ -26,4 +38,10 @@ __all__ = [
     "MEMORY_PRUNE_TOOL",
     "MEMORY_EXPORT_TOOL",
     "MEMORY_STATS_TOOL",
+    "MEMORY_RECALL_TOOL",
+    "MEMORY_UPDATE_BATCH_TOOL",
+    "MEMORY_GET_CONTEXT_BATCH_TOOL",
+    "MEMORY_PRUNE_APPLY_TOOL",
+    "MEMORY_IMPORT_TOOL",
+    "MEMORY_PROFILE_TOOL",
 ]
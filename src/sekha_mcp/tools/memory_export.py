@@ -7,7 +7,9 @@ from datetime import datetime
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import ConversationContextRequest
+from ..models import ConversationContextRequest, OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +22,16 @@ async def memory_export_tool(arguments: dict) -> list[TextContent]:
         conversation_id: UUID of conversation to export
         format: Export format ('json' or 'markdown')
         include_metadata: Include metadata fields (default: true)
+        output_format: 'text' (default) returns the export itself; 'json' returns
+            it as compact JSON, with Markdown exports wrapped in a JSON object
 
     Returns:
         Exported conversation in requested format
     """
+    fmt = requested_format(arguments)
     try:
-        context_request = ConversationContextRequest(**arguments)
+        with phase("validate"):
+            context_request = ConversationContextRequest(**arguments)
         export_format = arguments.get("format", "json")
         include_metadata = arguments.get("include_metadata", True)
 
@@ -34,16 +40,28 @@ async def memory_export_tool(arguments: dict) -> list[TextContent]:
 
         if not result.get("success") or "data" not in result:
             error_msg = result.get("error", "Conversation not found")
-            return [TextContent(type="text", text=f"❌ Export failed: {error_msg}")]
+            return error_content(fmt, f"Export failed: {error_msg}")
 
         data = result["data"]
 
         if export_format.lower() == "json":
-            export_content = _export_to_json(data, include_metadata)
+            if fmt == OutputFormat.JSON:
+                return json_content(_export_record(data, include_metadata))
+            with phase("render"):
+                export_content = _export_to_json(data, include_metadata)
             return [TextContent(type="text", text=export_content)]
 
         elif export_format.lower() == "markdown":
-            export_content = _export_to_markdown(data, include_metadata)
+            with phase("render"):
+                export_content = _export_to_markdown(data, include_metadata)
+            if fmt == OutputFormat.JSON:
+                return json_content(
+                    {
+                        "conversation_id": data.get("conversation_id"),
+                        "format": "markdown",
+                        "content": export_content,
+                    }
+                )
             return [TextContent(type="text", text=export_content)]
 
         else:
@@ -51,14 +69,19 @@ async def memory_export_tool(arguments: dict) -> list[TextContent]:
 
     except ValueError as ve:
         logger.error(f"Export validation error: {ve}")
-        return [TextContent(type="text", text=f"❌ Validation error: {str(ve)}")]
+        return error_content(fmt, f"Validation error: {str(ve)}")
     except Exception as e:
         logger.error(f"Export failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
 
 
 def _export_to_json(data: dict, include_metadata: bool) -> str:
     """Export conversation to JSON format"""
+    return json.dumps(_export_record(data, include_metadata), indent=2, ensure_ascii=False)
+
+
+def _export_record(data: dict, include_metadata: bool) -> dict:
+    """Build the exported conversation record"""
     export = {
         "conversation_id": data.get("conversation_id"),
         "label": data.get("label"),
@@ -76,7 +99,7 @@ def _export_to_json(data: dict, include_metadata: bool) -> str:
             "session_count": data.get("session_count"),
         }
 
-    return json.dumps(export, indent=2, ensure_ascii=False)
+    return export
 
 
 def _export_to_markdown(data: dict, include_metadata: bool) -> str:
@@ -141,6 +164,7 @@ MEMORY_EXPORT_TOOL = Tool(
                 "description": "Include metadata fields (word count, session count)",
                 "default": True,
             },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": ["conversation_id"],
     },
@@ -1,79 +1,255 @@
 """Memory Get Context Tool - Retrieve full conversation details"""
 
 import logging
+from datetime import datetime, timezone
+from typing import Any
 
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import ContextInput
+from ..cursors import decode_cursor, encode_cursor
+from ..models import ContextInput, OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..packing import estimate_tokens, pack, recency_ranks
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
 
 async def memory_get_context_tool(arguments: dict) -> list[TextContent]:
     """
-    Retrieve full conversation with all messages and metadata.
+    Retrieve a conversation with its messages and metadata.
 
     Args:
         conversation_id: UUID of the conversation to retrieve
+        offset: Index of the first message to return (optional)
+        limit: Maximum number of messages to return (optional)
+        tail: Return only the last N messages (optional)
+        since: Only include messages at or after this ISO 8601 timestamp (optional)
+        until: Only include messages at or before this ISO 8601 timestamp (optional)
+        cursor: Continuation cursor from a previous windowed call (optional)
+        max_tokens: Token budget for the rendered output; the most recent
+            messages are kept and the rest elided (optional)
+        output_format: 'text' (default) or 'json' for the windowed controller
+            data; max_tokens only applies to text
 
     Returns:
-        Complete conversation with formatted message history
+        Conversation with formatted message history, plus a continuation
+        cursor when more messages are available
     """
+    fmt = requested_format(arguments)
     try:
-        context_input = ContextInput(**arguments)
+        with phase("validate"):
+            context_input = _resolve_cursor(ContextInput(**arguments))
+        window = window_params(context_input)
 
-        result = await sekha_client.get_context(context_input.conversation_id)
+        result = await sekha_client.get_context(context_input.conversation_id, **window)
 
         if result.get("success") and "data" in result:
-            data = result["data"]
-
-            # Validate required fields
-            required_fields = ["label", "folder", "status", "messages"]
-            missing = [f for f in required_fields if f not in data]
-            if missing:
-                raise ValueError(f"Missing required fields: {missing}")
-
-            messages = data.get("messages", [])
-            if not messages:
-                logger.warning(f"Conversation {context_input.conversation_id} has no messages")
-
-            output = [
-                f"📄 **{data.get('label', 'Untitled')}**\n",
-                f"📁 Folder: {data.get('folder', '/')}\n",
-                f"📊 Status: {data.get('status', 'unknown')}\n",
-                f"⭐ Importance: {data.get('importance_score', 'N/A')}\n",
-                f"🕐 Created: {data.get('created_at', 'Unknown')}\n",
-                f"📝 Messages: {len(messages)}\n",
-                "=" * 50,
-                "\n",
-            ]
-
-            for i, msg in enumerate(messages, 1):
-                role = msg.get("role", "unknown").upper()
-                content = msg.get("content", "")
-                output.append(f"{i}. **{role}**: {content}\n")
-
-            if not messages:
-                output.append("\n*No messages found in this conversation*\n")
-
-            return [TextContent(type="text", text="".join(output))]
+            if fmt == OutputFormat.JSON:
+                return json_content(context_record(result["data"], context_input))
+            with phase("render"):
+                text = render_context(result["data"], context_input)
+            return [TextContent(type="text", text=text)]
         else:
             error_msg = result.get("error", "Conversation not found")
             logger.warning(f"Get context failed: {error_msg}")
-            return [TextContent(type="text", text=f"❌ Conversation not found: {error_msg}")]
+            return error_content(fmt, f"Conversation not found: {error_msg}")
 
     except ValueError as ve:
         logger.error(f"Validation error in memory_get_context: {ve}")
-        return [TextContent(type="text", text=f"❌ Validation error: {str(ve)}")]
+        return error_content(fmt, f"Validation error: {str(ve)}")
     except Exception as e:
         logger.error(f"Get context failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+def render_context(data: dict, context_input: ContextInput) -> str:
+    """Render a controller context response for the requested window and budget"""
+    # Validate required fields
+    required_fields = ["label", "folder", "status", "messages"]
+    missing = [f for f in required_fields if f not in data]
+    if missing:
+        raise ValueError(f"Missing required fields: {missing}")
+
+    windowed = bool(window_params(context_input))
+    messages, start, total = _apply_window(data, context_input)
+    if not messages and not windowed:
+        logger.warning(f"Conversation {context_input.conversation_id} has no messages")
+
+    if windowed:
+        message_count = f"{len(messages)} of {total} (from #{start + 1})"
+    else:
+        message_count = str(len(messages))
+
+    output = [
+        f"📄 **{data.get('label', 'Untitled')}**\n",
+        f"📁 Folder: {data.get('folder', '/')}\n",
+        f"📊 Status: {data.get('status', 'unknown')}\n",
+        f"⭐ Importance: {data.get('importance_score', 'N/A')}\n",
+        f"🕐 Created: {data.get('created_at', 'Unknown')}\n",
+        f"📝 Messages: {message_count}\n",
+        "=" * 50,
+        "\n",
+    ]
+
+    lines = [
+        f"{i}. **{msg.get('role', 'unknown').upper()}**: {msg.get('content', '')}\n"
+        for i, msg in enumerate(messages, start + 1)
+    ]
+
+    footer = []
+    if not messages:
+        if windowed:
+            footer.append("\n*No messages in the requested window*\n")
+        else:
+            footer.append("\n*No messages found in this conversation*\n")
+
+    next_offset = start + len(messages)
+    if context_input.limit is not None and messages and next_offset < total:
+        cursor = _next_cursor(context_input, next_offset)
+        footer.append(
+            f"\n➡️ {total - next_offset} more message"
+            f"{'s' if total - next_offset > 1 else ''}. "
+            f"Continue with cursor: {cursor}\n"
+        )
+
+    if context_input.max_tokens is not None and lines:
+        fixed = "".join(output) + "".join(footer)
+        budget = context_input.max_tokens - estimate_tokens(fixed)
+        # Later messages rank higher; earlier ones are elided first
+        packed = pack(lines, recency_ranks(len(lines)), budget, noun="message")
+        lines = packed.chunks
+
+    return "".join(output + lines + footer)
+
+
+def context_record(data: dict, context_input: ContextInput) -> dict:
+    """Controller context data restricted to the requested window, for JSON output"""
+    messages, start, total = _apply_window(data, context_input)
+    next_offset = start + len(messages)
+    cursor = None
+    if context_input.limit is not None and messages and next_offset < total:
+        cursor = _next_cursor(context_input, next_offset)
+
+    return {
+        **data,
+        "messages": messages,
+        "offset": start,
+        "total_messages": total,
+        "cursor": cursor,
+    }
+
+
+def _resolve_cursor(context_input: ContextInput) -> ContextInput:
+    """Merge the window stored in a continuation cursor into the input"""
+    if context_input.cursor is None:
+        return context_input
+
+    state = decode_cursor(context_input.cursor)
+    if state.get("conversation_id") != context_input.conversation_id:
+        raise ValueError("Cursor does not belong to this conversation")
+
+    return context_input.model_copy(
+        update={
+            "offset": state.get("offset", 0),
+            "limit": context_input.limit or state.get("limit"),
+            "since": context_input.since or _parse_timestamp(state.get("since")),
+            "until": context_input.until or _parse_timestamp(state.get("until")),
+            "cursor": None,
+        }
+    )
+
+
+def window_params(context_input: ContextInput) -> dict[str, Any]:
+    """Build the window keyword arguments pushed down to the controller"""
+    window: dict[str, Any] = {
+        "offset": context_input.offset,
+        "limit": context_input.limit,
+        "tail": context_input.tail,
+        "since": context_input.since.isoformat() if context_input.since else None,
+        "until": context_input.until.isoformat() if context_input.until else None,
+    }
+    return {k: v for k, v in window.items() if v is not None}
+
+
+def _apply_window(data: dict, context_input: ContextInput) -> tuple[list[dict], int, int]:
+    """
+    Return the windowed messages, the index of the first one and the total count.
+
+    Controllers that support windowing report ``total_messages`` (and the
+    ``offset`` of the returned slice); older ones return the full history,
+    which is windowed locally instead.
+    """
+    messages = data.get("messages", [])
+
+    if "total_messages" in data:
+        total = data["total_messages"]
+        if "offset" in data:
+            start = data["offset"]
+        elif context_input.tail is not None:
+            start = max(total - len(messages), 0)
+        else:
+            start = context_input.offset or 0
+        return messages, start, total
+
+    if context_input.since or context_input.until:
+        messages = [
+            m for m in messages if _in_range(_parse_timestamp(m.get("timestamp")), context_input)
+        ]
+
+    total = len(messages)
+    if context_input.tail is not None:
+        start = max(total - context_input.tail, 0)
+        end = total
+    else:
+        start = min(context_input.offset or 0, total)
+        end = total if context_input.limit is None else start + context_input.limit
+
+    return messages[start:end], start, total
+
+
+def _next_cursor(context_input: ContextInput, next_offset: int) -> str:
+    """Encode the state needed to continue after the current window"""
+    return encode_cursor(
+        {
+            "conversation_id": context_input.conversation_id,
+            "offset": next_offset,
+            "limit": context_input.limit,
+            "since": context_input.since.isoformat() if context_input.since else None,
+            "until": context_input.until.isoformat() if context_input.until else None,
+        }
+    )
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse an ISO 8601 timestamp, treating naive values as UTC"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _in_range(timestamp: datetime | None, context_input: ContextInput) -> bool:
+    """Check whether a message timestamp falls inside the requested time range"""
+    if timestamp is None:
+        return False
+    if context_input.since and timestamp < context_input.since:
+        return False
+    if context_input.until and timestamp > context_input.until:
+        return False
+    return True
 
 
 MEMORY_GET_CONTEXT_TOOL = Tool(
     name="memory_get_context",
-    description="Retrieve complete conversation context with full message history",
+    description=(
+        "Retrieve conversation context with its message history, optionally windowed "
+        "by offset/limit, tail or time range"
+    ),
     inputSchema={
         "type": "object",
         "properties": {
@@ -82,7 +258,45 @@ MEMORY_GET_CONTEXT_TOOL = Tool(
                 "description": "UUID of the conversation to retrieve",
                 "minLength": 1,
                 "pattern": "^[a-f0-9\\-]{36}$",
-            }
+            },
+            "offset": {
+                "type": "integer",
+                "description": "Index of the first message to return",
+                "minimum": 0,
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of messages to return",
+                "minimum": 1,
+                "maximum": 1000,
+            },
+            "tail": {
+                "type": "integer",
+                "description": "Return only the last N messages (cannot be combined with offset)",
+                "minimum": 1,
+                "maximum": 1000,
+            },
+            "since": {
+                "type": "string",
+                "format": "date-time",
+                "description": "Only include messages at or after this ISO 8601 timestamp",
+            },
+            "until": {
+                "type": "string",
+                "format": "date-time",
+                "description": "Only include messages at or before this ISO 8601 timestamp",
+            },
+            "cursor": {
+                "type": "string",
+                "description": "Continuation cursor returned by a previous windowed call",
+            },
+            "max_tokens": {
+                "type": "integer",
+                "description": ("Token budget for the response; older messages are elided to fit"),
+                "minimum": 50,
+                "maximum": 200000,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": ["conversation_id"],
     },
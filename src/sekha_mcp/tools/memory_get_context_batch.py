@@ -0,0 +1,134 @@
+"""Memory Get Context Batch Tool - Retrieve many conversations at once"""
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from mcp.types import TextContent, Tool
+from pydantic import ValidationError
+
+from ..client import sekha_client
+from ..concurrency import gather_bounded
+from ..config import settings
+from ..models import ContextBatchInput, ContextInput, OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..timing import phase
+from .memory_get_context import (
+    MEMORY_GET_CONTEXT_TOOL,
+    context_record,
+    render_context,
+    window_params,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def memory_get_context_batch_tool(arguments: dict) -> list[TextContent]:
+    """
+    Retrieve several conversations with bounded concurrency.
+
+    Args:
+        conversation_ids: UUIDs of the conversations to retrieve
+        offset, limit, tail, since, until: Message window applied to each conversation
+        max_tokens: Token budget applied to each conversation (optional)
+        output_format: 'text' (default) or 'json' for per-conversation records
+
+    Returns:
+        One section per conversation, in request order
+    """
+    fmt = requested_format(arguments)
+    try:
+        with phase("validate"):
+            batch_input = ContextBatchInput(**arguments)
+        items = batch_input.items()
+
+        results = await gather_bounded(_get_one, items, settings.max_concurrency)
+        render = context_record if fmt == OutputFormat.JSON else render_context
+        with phase("render"):
+            for res in results:
+                if res["success"]:
+                    _render_one(res, render)
+        succeeded = sum(1 for res in results if res["success"])
+
+        if fmt == OutputFormat.JSON:
+            records = [
+                (
+                    {"conversation_id": res["conversation_id"], "success": True} | res["rendered"]
+                    if res["success"]
+                    else {k: res[k] for k in ("conversation_id", "success", "error")}
+                )
+                for res in results
+            ]
+            return json_content({"retrieved": succeeded, "total": len(items), "results": records})
+
+        output = [f"📦 Retrieved {succeeded} of {len(items)} conversations\n"]
+        for res in results:
+            text = res["rendered"] if res["success"] else f"❌ {res['error']}\n"
+            output.append(f"\n{'#' * 50}\n🆔 {res['conversation_id']}\n{text}")
+
+        return [TextContent(type="text", text="".join(output))]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_get_context_batch: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Get context batch failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+async def _get_one(item: dict) -> dict:
+    """Validate and fetch one conversation, returning its outcome record"""
+    outcome = {"conversation_id": item["conversation_id"], "success": False}
+    try:
+        context_input = ContextInput(**item)
+    except ValidationError as ve:
+        messages = "; ".join(err["msg"] for err in ve.errors())
+        return outcome | {"error": f"Validation error: {messages}"}
+
+    try:
+        result = await sekha_client.get_context(
+            context_input.conversation_id, **window_params(context_input)
+        )
+    except Exception as e:
+        logger.warning(f"Batch context fetch of {context_input.conversation_id} failed: {e}")
+        return outcome | {"error": f"Error: {str(e)}"}
+
+    if not result.get("success") or "data" not in result:
+        return outcome | {"error": f"Conversation not found: {result.get('error', 'Not found')}"}
+    return outcome | {"success": True, "data": result["data"], "input": context_input}
+
+
+def _render_one(res: dict, render: Callable[[dict, ContextInput], Any]) -> None:
+    """Render one fetched conversation, turning bad data into that item's error"""
+    try:
+        res["rendered"] = render(res["data"], res["input"])
+    except ValueError as e:
+        logger.warning(f"Batch context of {res['conversation_id']} could not be rendered: {e}")
+        res.update(success=False, error=f"Invalid conversation data: {e}")
+
+
+_WINDOW_SCHEMA = {
+    name: prop
+    for name, prop in MEMORY_GET_CONTEXT_TOOL.inputSchema["properties"].items()
+    if name not in ("conversation_id", "cursor")
+}
+
+MEMORY_GET_CONTEXT_BATCH_TOOL = Tool(
+    name="memory_get_context_batch",
+    description="Retrieve several conversations in one call, optionally windowed",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "conversation_ids": {
+                "type": "array",
+                "description": "UUIDs of the conversations to retrieve",
+                "minItems": 1,
+                "maxItems": 50,
+                "items": {"type": "string", "minLength": 1},
+            },
+            **_WINDOW_SCHEMA,
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": ["conversation_ids"],
+    },
+)
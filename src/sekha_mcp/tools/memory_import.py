@@ -0,0 +1,453 @@
+"""Memory Import Tool - Restore conversations exported by memory_export"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+from mcp.types import TextContent, Tool
+from pydantic import ValidationError
+
+from ..client import sekha_client
+from ..config import settings
+from ..models import ConversationInput, ImportInput, OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..progress import report_progress
+from ..resources import notify_changed
+from ..timing import phase, record_retry
+from .memory_store import api_conversation, content_hash
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Store attempts per conversation; transient failures back off exponentially
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Write the checkpoint after this many finished records
+CHECKPOINT_EVERY = 200
+
+# Report progress after this many finished records
+PROGRESS_EVERY = 100
+
+# Per-record errors kept in the summary
+MAX_ERRORS = 50
+
+READ_CHUNK = 1 << 16
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
+# Export record fields that memory_store accepts
+_STORE_FIELDS = ("label", "folder", "messages", "importance_score")
+
+
+@dataclass
+class ImportSummary:
+    """Outcome of one import run; counts cover records after the resume point"""
+
+    path: str
+    checkpoint: str
+    resumed_from: int = 0
+    completed: int = 0
+    stored: int = 0
+    invalid: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def error(self, number: int, message: str) -> None:
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"#{number}: {message}")
+
+
+class _Watermark:
+    """Highest record number below which every record has finished"""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self._finished: set[int] = set()
+
+    def finish(self, number: int) -> None:
+        self._finished.add(number)
+        while self.value + 1 in self._finished:
+            self.value += 1
+            self._finished.remove(self.value)
+
+
+async def memory_import_tool(arguments: dict) -> list[TextContent]:
+    """
+    Import conversations from a memory_export file on the server's host.
+
+    Args:
+        path: NDJSON file (one exported conversation per line), a JSON array of
+            exported conversations, or a single exported conversation
+        checkpoint: Checkpoint file (default: <path>.checkpoint.json)
+        resume: Skip records a previous run already finished (default: True)
+        concurrency: Parallel stores (default: MAX_CONCURRENCY)
+        output_format: 'text' (default) or 'json' for the import summary
+
+    Records are streamed and validated one by one; invalid records are
+    counted and skipped. A progress notification is sent every
+    PROGRESS_EVERY records when the client supplied a progress token.
+
+    Returns:
+        Import summary with the first errors
+    """
+    fmt = requested_format(arguments)
+    try:
+        with phase("validate"):
+            import_input = ImportInput(**arguments)
+
+        async def progress(summary: ImportSummary) -> None:
+            await report_progress(
+                summary.completed, None, f"{summary.stored} stored, {summary.failed} failed"
+            )
+
+        summary = await import_conversations(
+            import_input.path,
+            checkpoint=import_input.checkpoint,
+            resume=import_input.resume,
+            concurrency=import_input.concurrency,
+            progress=progress,
+        )
+
+        if fmt == OutputFormat.JSON:
+            return json_content(asdict(summary))
+        return [TextContent(type="text", text=render_import(summary))]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_import: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Memory import failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+async def import_conversations(
+    path: str,
+    checkpoint: str | None = None,
+    resume: bool = True,
+    concurrency: int | None = None,
+    progress: Callable[[ImportSummary], Awaitable[None]] | None = None,
+) -> ImportSummary:
+    """
+    Stream an export file into the controller through a bounded pipeline.
+
+    The reader validates records and feeds a bounded queue drained by
+    `concurrency` store workers, so memory stays flat however large the file.
+    The checkpoint records the highest record number below which every
+    record has finished; it is written periodically and when the run ends or
+    is interrupted, and a resumed run skips those records. Stores carry the
+    content hash as their idempotency key, so records in flight at an
+    interruption are not duplicated when they are sent again.
+    """
+    source = Path(path).expanduser()
+    if not source.is_file():
+        raise ValueError(f"Import file not found: {source}")
+    checkpoint_path = (
+        Path(checkpoint).expanduser()
+        if checkpoint
+        else source.with_name(f"{source.name}.checkpoint.json")
+    )
+    fingerprint = _fingerprint(source)
+    state = _load_checkpoint(checkpoint_path, fingerprint) if resume else {}
+
+    summary = ImportSummary(str(source), str(checkpoint_path))
+    summary.resumed_from = state.get("completed", 0)
+    watermark = _Watermark(summary.resumed_from)
+    workers = concurrency or settings.max_concurrency
+    queue: asyncio.Queue[tuple[int, dict[str, Any]] | None] = asyncio.Queue(maxsize=workers * 4)
+    folders: set[str] = set()
+    started = time.perf_counter()
+
+    def save() -> None:
+        _save_checkpoint(checkpoint_path, fingerprint, watermark.value)
+
+    async def finish(number: int) -> None:
+        watermark.finish(number)
+        summary.completed += 1
+        if summary.completed % CHECKPOINT_EVERY == 0:
+            save()
+        if progress is not None and summary.completed % PROGRESS_EVERY == 0:
+            await progress(summary)
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not None:
+            number, conversation = item
+            try:
+                error = await _store_with_retries(conversation)
+            except Exception as e:
+                # A dead worker could leave the reader blocked on a full queue
+                error = f"Error: {e}"
+            if error is None:
+                summary.stored += 1
+                folders.add(conversation["folder"])
+            else:
+                summary.failed += 1
+                summary.error(number, error)
+            await finish(number)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        for number, value in iter_records(source):
+            if number <= summary.resumed_from:
+                continue
+            try:
+                conversation = _conversation(value)
+            except ValueError as e:
+                summary.invalid += 1
+                summary.error(number, _describe(e))
+                await finish(number)
+                continue
+            await queue.put((number, conversation))
+
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        summary.seconds = round(time.perf_counter() - started, 3)
+        try:
+            save()
+        except OSError as e:
+            logger.warning(f"Could not write import checkpoint {checkpoint_path}: {e}")
+
+    if folders:
+        await notify_changed(None, sorted(folders))
+    return summary
+
+
+def iter_records(path: str | Path) -> Iterator[tuple[int, Any]]:
+    """
+    Yield (record number, value) for each record in an export file.
+
+    A file starting with ``[`` is a JSON array, decoded element by element.
+    ``.ndjson`` and ``.jsonl`` files, and other files whose whole first line
+    is a JSON value, are read line by line, and a malformed line yields its
+    decode error in place of a value. Anything else (such as one
+    pretty-printed conversation) is decoded as a stream of JSON documents.
+    """
+    with open(path, encoding="utf-8") as f:
+        head = f.read(READ_CHUNK).lstrip()
+        if head.startswith("["):
+            yield from enumerate(_iter_array(f, head[1:]), 1)
+            return
+
+        if Path(path).suffix.lower() not in NDJSON_SUFFIXES:
+            head = _through_first_newline(f, head)
+            try:
+                json.loads(head.split("\n", 1)[0])
+            except json.JSONDecodeError:
+                yield from enumerate(_iter_documents(f, head), 1)
+                return
+
+        number = 0
+        for line in _lines(f, head):
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, ValueError(f"Invalid JSON: {e.msg}")
+
+
+def _through_first_newline(f, head: str) -> str:
+    """Extend head until it holds the whole first line, however long"""
+    parts, chunk = [head], head
+    while "\n" not in chunk:
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            break
+        parts.append(chunk)
+    return "".join(parts)
+
+
+def _lines(f, head: str) -> Iterator[str]:
+    """Lines of the file, starting with the already-read head"""
+    pending = head
+    for line in f:
+        *complete, pending = (pending + line).split("\n")
+        yield from complete
+    yield from pending.split("\n")
+
+
+def _iter_array(f, buffer: str) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array without reading it whole"""
+    decoder = json.JSONDecoder()
+    pos, eof = 0, False
+    while True:
+        while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Most likely a record cut off at the end of the buffer; read more
+            if eof:
+                raise ValueError("Malformed JSON array in import file") from None
+            chunk = f.read(READ_CHUNK)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        yield value
+        pos = end
+
+
+def _iter_documents(f, buffer: str) -> Iterator[Any]:
+    """Decode a stream of whitespace-separated JSON documents without reading it whole"""
+    decoder = json.JSONDecoder()
+    pos, eof = 0, False
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos < len(buffer):
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ValueError(f"Malformed JSON in import file: {e.msg}") from None
+            else:
+                yield value
+                pos = end
+                continue
+        elif eof:
+            return
+        # Out of data, or a document cut off at the end of the buffer; read more
+        chunk = f.read(READ_CHUNK)
+        buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+
+
+def _conversation(value: Any) -> dict[str, Any]:
+    """Validate one exported record and convert it to the controller's store format"""
+    if isinstance(value, Exception):
+        raise ValueError(str(value))
+    if not isinstance(value, dict):
+        raise ValueError("Record is not a JSON object")
+    fields = {key: value[key] for key in _STORE_FIELDS if value.get(key) is not None}
+    return api_conversation(ConversationInput(**fields))
+
+
+def _describe(error: ValueError) -> str:
+    """One-line reason for a rejected record"""
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        return f"{location}: {first['msg']}" if location else first["msg"]
+    return str(error)
+
+
+async def _store_with_retries(conversation: dict[str, Any]) -> str | None:
+    """Store one conversation, retrying transient failures; returns an error or None"""
+    key = content_hash(conversation)
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            result = await sekha_client.store_conversation(conversation, idempotency_key=key)
+        except httpx.HTTPStatusError as e:
+            error = f"HTTP {e.response.status_code}"
+            if e.response.status_code not in RETRY_STATUSES:
+                return error
+        except httpx.TransportError as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            if result.get("success"):
+                return None
+            return str(result.get("error", "Store failed"))
+
+        if attempt + 1 < MAX_ATTEMPTS:
+            record_retry()
+            await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt)
+    return error
+
+
+def _fingerprint(source: Path) -> dict[str, Any]:
+    stat = source.stat()
+    return {"source": str(source.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_checkpoint(path: Path, fingerprint: dict[str, Any]) -> dict[str, Any]:
+    """Read a checkpoint for this exact file, or {} if missing, stale or unreadable"""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable import checkpoint {path}: {e}")
+        return {}
+
+    if state.get("version") != CHECKPOINT_VERSION or any(
+        state.get(key) != value for key, value in fingerprint.items()
+    ):
+        logger.warning(f"Import checkpoint {path} is for a different file; starting over")
+        return {}
+    return state
+
+
+def _save_checkpoint(path: Path, fingerprint: dict[str, Any], completed: int) -> None:
+    state = {"version": CHECKPOINT_VERSION, **fingerprint, "completed": completed}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def render_import(summary: ImportSummary) -> str:
+    """Human-readable import summary"""
+    output = [
+        f"📥 Imported {summary.stored} conversation{'s' if summary.stored != 1 else ''} "
+        f"from {summary.path} in {summary.seconds:.1f}s\n"
+    ]
+    if summary.resumed_from:
+        output.append(f"⏭️ Resumed after record {summary.resumed_from}\n")
+    if summary.invalid:
+        output.append(f"⚠️ {summary.invalid} invalid records skipped\n")
+    if summary.failed:
+        output.append(f"❌ {summary.failed} records failed to store\n")
+    output.extend(f"  - {error}\n" for error in summary.errors)
+    output.append(f"Checkpoint: {summary.checkpoint}\n")
+    return "".join(output)
+
+
+MEMORY_IMPORT_TOOL = Tool(
+    name="memory_import",
+    description=(
+        "Restore conversations from a memory_export NDJSON or JSON file on the server host, "
+        "storing them in parallel with a resumable checkpoint"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Path of the export file (NDJSON, JSON array or one conversation)",
+                "minLength": 1,
+            },
+            "checkpoint": {
+                "type": "string",
+                "description": "Checkpoint file (default: <path>.checkpoint.json)",
+                "minLength": 1,
+            },
+            "resume": {
+                "type": "boolean",
+                "description": "Skip records a previous run of this file already finished",
+                "default": True,
+            },
+            "concurrency": {
+                "type": "integer",
+                "description": "Parallel stores (default: server MAX_CONCURRENCY)",
+                "minimum": 1,
+                "maximum": 64,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": ["path"],
+    },
+)
@@ -0,0 +1,116 @@
+"""Memory Profile Tool - Capture a sampling profile of the running server (admin only)"""
+
+import logging
+import time
+
+from mcp.types import TextContent, Tool
+
+from ..config import settings
+from ..models import OutputFormat, ProfileAction, ProfileInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..profiling import profiler
+
+logger = logging.getLogger(__name__)
+
+
+async def memory_profile_tool(arguments: dict) -> list[TextContent]:
+    """
+    Start, stop or inspect the sampling profiler.
+
+    Only registered when ADMIN_TOOLS_ENABLED is set, and only usable when
+    PROFILING_ENABLED is set.
+
+    Args:
+        action: 'start', 'stop' or 'status' (default: 'status')
+        duration_seconds: Sampling duration for 'start', capped at
+            PROFILE_MAX_SECONDS (optional)
+        output_format: 'text' (default) or 'json' for the profiler state
+
+    Returns:
+        Profiler state, or the path of the written collapsed-stack profile
+    """
+    fmt = requested_format(arguments)
+    try:
+        profile_input = ProfileInput(**arguments)
+
+        if not settings.profiling_enabled:
+            return error_content(
+                fmt, "Profiling is disabled. Set PROFILING_ENABLED=true to enable it."
+            )
+
+        if profile_input.action == ProfileAction.START:
+            if profiler.running:
+                raise ValueError("Profiler is already running")
+            duration = profiler.start(profile_input.duration_seconds)
+            text = (
+                f"🔬 Profiling started for {duration:.0f}s "
+                f"(sampling every {profiler.interval * 1000:.0f}ms)\n"
+                f"📁 Output directory: {profiler.output_dir}\n"
+                "Call memory_profile with action 'stop' to finish early."
+            )
+
+        elif profile_input.action == ProfileAction.STOP:
+            if not profiler.running:
+                text = "ℹ️ Profiler is not running"
+                if profiler.last_output:
+                    text += f"\n📄 Last profile: {profiler.last_output}"
+            else:
+                path = profiler.stop()
+                samples = sum(profiler.samples.values())
+                text = f"✅ Profile written to {path} ({samples} samples)"
+
+        else:
+            if profiler.running:
+                elapsed = time.monotonic() - (profiler.started_at or time.monotonic())
+                samples = sum(profiler.samples.values())
+                text = f"🔬 Profiling: {elapsed:.1f}s elapsed, {samples} samples"
+            else:
+                text = "💤 Profiler idle"
+            if profiler.last_output:
+                text += f"\n📄 Last profile: {profiler.last_output}"
+
+        if fmt == OutputFormat.JSON:
+            return json_content(
+                {
+                    "running": profiler.running,
+                    "samples": sum(profiler.samples.values()),
+                    "output_dir": str(profiler.output_dir),
+                    "last_output": str(profiler.last_output) if profiler.last_output else None,
+                }
+            )
+        return [TextContent(type="text", text=text)]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_profile: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Memory profile failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+MEMORY_PROFILE_TOOL = Tool(
+    name="memory_profile",
+    description=(
+        "Admin only: capture a time-bounded sampling profile of the MCP server and write "
+        "it as a flamegraph-compatible collapsed-stack file"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": "Profiler action",
+                "enum": ["start", "stop", "status"],
+                "default": "status",
+            },
+            "duration_seconds": {
+                "type": "number",
+                "description": "Sampling duration for 'start' (capped by server config)",
+                "exclusiveMinimum": 0,
+                "maximum": 3600,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": [],
+    },
+)
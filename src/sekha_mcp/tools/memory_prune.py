@@ -5,10 +5,20 @@ import logging
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import PruneInput
+from ..config import settings
+from ..cursors import CursorStore
+from ..models import OutputFormat, PruneInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..progress import report_progress
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
+# Pagination state for follow-up pages, held server-side
+prune_cursors = CursorStore(
+    maxsize=settings.search_cursor_max_entries, ttl=settings.search_cursor_ttl
+)
+
 
 async def memory_prune_tool(arguments: dict) -> list[TextContent]:
     """
@@ -17,20 +27,61 @@ async def memory_prune_tool(arguments: dict) -> list[TextContent]:
     Args:
         threshold_days: Age threshold in days (default: 30)
         importance_threshold: Minimum importance score to keep (0.0-10.0)
+        limit: Suggestions per page (default: 50, max: 500)
+        cursor: Continuation cursor from a previous page (optional)
+        output_format: 'text' (default) or 'json' for the raw suggestions with
+            paging state
+
+    Each rendered suggestion is also sent as a progress notification when the
+    client supplied a progress token.
 
     Returns:
-        List of suggested conversations to prune with reasoning
+        One page of suggested conversations to prune with reasoning, plus a
+        continuation cursor when more remain
     """
+    fmt = requested_format(arguments)
     try:
-        prune_input = PruneInput(**arguments)
+        with phase("validate"):
+            prune_input = PruneInput(**arguments)
+
+        offset = 0
+        if prune_input.cursor is not None:
+            state = prune_cursors.get(prune_input.cursor)
+            offset = state["offset"]
+            prune_input = prune_input.model_copy(
+                update={
+                    "threshold_days": state["threshold_days"],
+                    "importance_threshold": state["importance_threshold"],
+                    "limit": state["limit"],
+                }
+            )
 
         result = await sekha_client.prune_memory(
             threshold_days=prune_input.threshold_days,
             importance_threshold=prune_input.importance_threshold,
+            offset=offset,
+            limit=prune_input.limit,
         )
 
         if result.get("success") and "data" in result:
-            suggestions = result["data"].get("suggestions", [])
+            data = result["data"]
+            suggestions = data.get("suggestions", [])
+
+            cursor = None
+            if suggestions and data.get("has_more", len(suggestions) >= prune_input.limit):
+                cursor = prune_cursors.put(
+                    {
+                        "threshold_days": prune_input.threshold_days,
+                        "importance_threshold": prune_input.importance_threshold,
+                        "limit": prune_input.limit,
+                        "offset": offset + len(suggestions),
+                    }
+                )
+
+            if fmt == OutputFormat.JSON:
+                return json_content(
+                    {**data, "offset": offset, "has_more": bool(cursor), "cursor": cursor}
+                )
 
             if not suggestions:
                 return [
@@ -44,39 +95,64 @@ async def memory_prune_tool(arguments: dict) -> list[TextContent]:
                     )
                 ]
 
-            output = [
-                f"🗑️ Found {len(suggestions)} conversation{'s' if len(suggestions) > 1 else ''} "
-                f"to consider pruning:\n"
-            ]
-
-            for i, sugg in enumerate(suggestions, 1):
-                label = sugg.get("label", "Untitled")
-                conv_id = sugg.get("conversation_id", "unknown")
-                age = sugg.get("age_days", 0)
-                importance = sugg.get("importance_score", 0)
-                reason = sugg.get("reason", "No reason provided")
-
-                output.append(
-                    f"\n{i}. **{label}** (ID: {conv_id})\n"
-                    f"   📅 Age: {age} days\n"
-                    f"   ⭐ Importance: {importance}/10\n"
-                    f"   💭 Reason: {reason}"
-                )
-
-            output.append(
-                "\n\n💡 Tip: Review these conversations before pruning. "
-                "Consider updating importance scores for valuable old conversations."
-            )
+            with phase("render"):
+                parts = [_prune_header(suggestions)]
+                for i, suggestion in enumerate(suggestions, offset + 1):
+                    parts.append(_format_suggestion(i, suggestion))
+                    # Send each suggestion as soon as it is formatted
+                    await report_progress(
+                        i - offset,
+                        len(suggestions),
+                        f"{suggestion.get('conversation_id')}: "
+                        f"{suggestion.get('label', 'Untitled')}",
+                    )
+                parts.append(PRUNE_TIP)
+                text = "".join(parts)
 
-            return [TextContent(type="text", text="".join(output))]
+            if cursor:
+                text += f"\n\n➡️ More suggestions available. Continue with cursor: {cursor}"
+            return [TextContent(type="text", text=text)]
         else:
             error_msg = result.get("error", "Prune check failed")
             logger.warning(f"Prune check failed: {error_msg}")
-            return [TextContent(type="text", text=f"❌ Prune check failed: {error_msg}")]
+            return error_content(fmt, f"Prune check failed: {error_msg}")
 
     except Exception as e:
         logger.error(f"Memory prune failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+PRUNE_TIP = (
+    "\n\n💡 Tip: Review these conversations before pruning. "
+    "Consider updating importance scores for valuable old conversations, "
+    "then archive or delete the rest with memory_prune_apply."
+)
+
+
+def render_prune(suggestions: list[dict], offset: int = 0) -> str:
+    """Render pruning suggestions as a list numbered from offset + 1 with a review tip"""
+    output = [_prune_header(suggestions)]
+    output.extend(_format_suggestion(i, sugg) for i, sugg in enumerate(suggestions, offset + 1))
+    output.append(PRUNE_TIP)
+    return "".join(output)
+
+
+def _prune_header(suggestions: list[dict]) -> str:
+    return (
+        f"🗑️ Found {len(suggestions)} conversation{'s' if len(suggestions) > 1 else ''} "
+        f"to consider pruning:\n"
+    )
+
+
+def _format_suggestion(index: int, sugg: dict) -> str:
+    """Render one pruning suggestion"""
+    return (
+        f"\n{index}. **{sugg.get('label', 'Untitled')}** "
+        f"(ID: {sugg.get('conversation_id', 'unknown')})\n"
+        f"   📅 Age: {sugg.get('age_days', 0)} days\n"
+        f"   ⭐ Importance: {sugg.get('importance_score', 0)}/10\n"
+        f"   💭 Reason: {sugg.get('reason', 'No reason provided')}"
+    )
 
 
 MEMORY_PRUNE_TOOL = Tool(
@@ -98,6 +174,18 @@ MEMORY_PRUNE_TOOL = Tool(
                 "minimum": 0.0,
                 "maximum": 10.0,
             },
+            "limit": {
+                "type": "integer",
+                "description": "Suggestions per page",
+                "default": 50,
+                "minimum": 1,
+                "maximum": 500,
+            },
+            "cursor": {
+                "type": "string",
+                "description": "Continuation cursor returned by a previous page",
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": [],
     },
@@ -0,0 +1,196 @@
+"""Memory Prune Apply Tool - Archive or delete many conversations at once"""
+
+import logging
+
+from mcp.types import TextContent, Tool
+
+from ..client import sekha_client
+from ..concurrency import gather_bounded
+from ..config import settings
+from ..models import OutputFormat, PruneAction, PruneApplyInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..progress import report_progress
+from ..resources import notify_changed
+from ..timing import phase
+
+logger = logging.getLogger(__name__)
+
+VERBS = {
+    PruneAction.ARCHIVE: "Archived",
+    PruneAction.DELETE: "Deleted",
+    PruneAction.OFFLOAD: "Offloaded",
+}
+
+# Conversations written to each cold storage segment
+OFFLOAD_BATCH = 100
+
+
+async def memory_prune_apply_tool(arguments: dict) -> list[TextContent]:
+    """
+    Archive, offload or delete a set of conversations with bounded concurrency.
+
+    Args:
+        action: 'archive' (mark archived, reversible), 'delete' (permanent) or
+            'offload' (move to local cold storage, still readable)
+        conversation_ids: Conversations to prune (up to 1000)
+        threshold_days: Instead of ids, prune every memory_prune suggestion
+            for this age threshold (streamed page by page)
+        importance_threshold: Importance threshold for those suggestions (optional)
+        max_items: Upper bound on conversations pruned by criteria (default: 1000)
+        output_format: 'text' (default) or 'json' for per-conversation records
+
+    A progress notification is sent as each conversation completes when the
+    client supplied a progress token.
+
+    Returns:
+        Summary with one result line per failed conversation
+    """
+    fmt = requested_format(arguments)
+    try:
+        with phase("validate"):
+            apply_input = PruneApplyInput(**arguments)
+            if apply_input.action == PruneAction.OFFLOAD and sekha_client.cold is None:
+                raise ValueError("Cold storage is disabled; set COLD_STORAGE_ENABLED=true")
+
+        if apply_input.conversation_ids is not None:
+            ids = list(dict.fromkeys(apply_input.conversation_ids))
+        else:
+            ids = await _suggested_ids(apply_input)
+
+        done = 0
+
+        async def reported(outcome: dict) -> dict:
+            nonlocal done
+            done += 1
+            conv_id = outcome["conversation_id"]
+            await report_progress(done, len(ids), f"{conv_id}: {outcome.get('error', 'ok')}")
+            return outcome
+
+        async def prune_one(conv_id: str) -> dict:
+            return await reported(await _prune_one(conv_id, apply_input.action))
+
+        if apply_input.action == PruneAction.OFFLOAD:
+            results = await _offload(ids, reported)
+        else:
+            results = await gather_bounded(prune_one, ids, settings.max_concurrency)
+        succeeded = sum(1 for res in results if res["success"])
+        verb = VERBS[apply_input.action]
+
+        if fmt == OutputFormat.JSON:
+            return json_content(
+                {
+                    "action": apply_input.action.value,
+                    "succeeded": succeeded,
+                    "total": len(ids),
+                    "results": results,
+                }
+            )
+
+        output = [f"🗑️ {verb} {succeeded} of {len(ids)} conversations\n"]
+        output.extend(
+            f"\n❌ {res['conversation_id']}: {res['error']}"
+            for res in results
+            if not res["success"]
+        )
+        return [TextContent(type="text", text="".join(output))]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_prune_apply: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Memory prune apply failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+async def _offload(ids: list[str], reported) -> list[dict]:
+    """Offload conversations to cold storage, one segment per batch"""
+    results = []
+    for start in range(0, len(ids), OFFLOAD_BATCH):
+        for outcome in await sekha_client.offload_conversations(ids[start : start + OFFLOAD_BATCH]):
+            if outcome["success"]:
+                await notify_changed(outcome["conversation_id"], [])
+            results.append(await reported(outcome))
+    return results
+
+
+async def _suggested_ids(apply_input: PruneApplyInput) -> list[str]:
+    """Collect up to max_items distinct suggested ids, streaming suggestion pages"""
+    assert apply_input.threshold_days is not None
+    # Insertion-ordered set: overlapping pages must not prune a conversation twice
+    ids: dict[str, None] = {}
+    async for page in sekha_client.iter_prune_pages(
+        apply_input.threshold_days, apply_input.importance_threshold
+    ):
+        ids.update((s["conversation_id"], None) for s in page if s.get("conversation_id"))
+        if len(ids) >= apply_input.max_items:
+            return list(ids)[: apply_input.max_items]
+    return list(ids)
+
+
+async def _prune_one(conv_id: str, action: PruneAction) -> dict:
+    """Archive or delete one conversation, returning its outcome record"""
+    outcome = {"conversation_id": conv_id, "success": False}
+    try:
+        if action == PruneAction.ARCHIVE:
+            result = await sekha_client.update_conversation(conv_id, status="archived")
+        else:
+            result = await sekha_client.delete_conversation(conv_id)
+    except Exception as e:
+        logger.warning(f"Prune of {conv_id} failed: {e}")
+        return outcome | {"error": f"Error: {str(e)}"}
+
+    if not result.get("success"):
+        return outcome | {"error": result.get("error", "Prune failed")}
+
+    await notify_changed(conv_id, [])
+    return outcome | {"success": True}
+
+
+MEMORY_PRUNE_APPLY_TOOL = Tool(
+    name="memory_prune_apply",
+    description=(
+        "Archive, offload to cold storage or permanently delete many conversations at once, "
+        "selected by id or by memory_prune criteria"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "description": (
+                    "'archive' marks conversations archived; 'delete' is permanent; "
+                    "'offload' moves them to local cold storage where they stay readable"
+                ),
+                "enum": ["archive", "delete", "offload"],
+            },
+            "conversation_ids": {
+                "type": "array",
+                "description": "Conversations to prune",
+                "minItems": 1,
+                "maxItems": 1000,
+                "items": {"type": "string", "minLength": 1},
+            },
+            "threshold_days": {
+                "type": "integer",
+                "description": "Instead of ids, prune all memory_prune suggestions for this age",
+                "minimum": 1,
+                "maximum": 365,
+            },
+            "importance_threshold": {
+                "type": "number",
+                "description": "Importance threshold for suggestions (with threshold_days)",
+                "minimum": 0.0,
+                "maximum": 10.0,
+            },
+            "max_items": {
+                "type": "integer",
+                "description": "Maximum conversations pruned by criteria",
+                "default": 1000,
+                "minimum": 1,
+                "maximum": 10000,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": ["action"],
+    },
+)
@@ -0,0 +1,203 @@
+"""Memory Recall Tool - Search and fetch top matching conversations in one call"""
+
+import logging
+
+from mcp.types import TextContent, Tool
+
+from ..client import sekha_client
+from ..concurrency import gather_bounded
+from ..config import settings
+from ..models import OutputFormat, RecallInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..packing import estimate_tokens, pack, recency_ranks, relevance_score
+from ..timing import phase
+
+logger = logging.getLogger(__name__)
+
+
+async def memory_recall_tool(arguments: dict) -> list[TextContent]:
+    """
+    Search conversations and retrieve the context of the top matches.
+
+    Args:
+        query: Natural language search query
+        top_k: Number of top matches to retrieve (default: 3, max: 10)
+        filter_labels: Optional list of labels to restrict search
+        tail: Only retrieve the last N messages of each match (optional)
+        max_tokens: Token budget for the merged output (optional)
+        output_format: 'text' (default) or 'json' for the hits with their
+            context data; max_tokens only applies to text
+
+    Returns:
+        Merged context of the top matching conversations
+    """
+    fmt = requested_format(arguments)
+    try:
+        with phase("validate"):
+            recall_input = RecallInput(**arguments)
+
+        if not recall_input.query.strip():
+            raise ValueError("Search query cannot be empty")
+
+        result = await sekha_client.search_memory(
+            query=recall_input.query,
+            limit=recall_input.top_k,
+            filter_labels=recall_input.filter_labels,
+        )
+
+        if not result.get("success") or "data" not in result:
+            error_msg = result.get("error", "Search failed")
+            logger.warning(f"Recall search failed: {error_msg}")
+            return error_content(fmt, f"Search failed: {error_msg}")
+
+        hits = [hit for hit in result["data"].get("results", []) if hit.get("conversation_id")][
+            : recall_input.top_k
+        ]
+
+        if not hits and fmt == OutputFormat.TEXT:
+            return [TextContent(type="text", text="🔍 No matching conversations found.")]
+
+        window = {"tail": recall_input.tail} if recall_input.tail is not None else {}
+        contexts = await gather_bounded(
+            lambda hit: sekha_client.get_context(hit["conversation_id"], **window),
+            hits,
+            settings.max_concurrency,
+        )
+
+        if fmt == OutputFormat.JSON:
+            return json_content(
+                {
+                    "query": recall_input.query,
+                    "results": [
+                        _recall_record(hit, ctx) for hit, ctx in zip(hits, contexts, strict=True)
+                    ],
+                }
+            )
+
+        header = (
+            f"🧠 Recalled {len(hits)} conversation{'s' if len(hits) > 1 else ''} "
+            f"for: {recall_input.query}\n"
+        )
+        with phase("render"):
+            blocks, scores = _build_blocks(hits, contexts)
+
+            if recall_input.max_tokens is not None:
+                budget = recall_input.max_tokens - estimate_tokens(header)
+                blocks = pack(blocks, scores, budget, noun="message").chunks
+
+        return [TextContent(type="text", text=header + "".join(blocks))]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_recall: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Memory recall failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+def _recall_record(hit: dict, context) -> dict:
+    """One hit with its context data, or the reason the context is missing"""
+    if isinstance(context, BaseException):
+        return hit | {"context": None, "error": str(context)}
+    if not context.get("success") or "data" not in context:
+        return hit | {"context": None, "error": context.get("error", "Conversation not found")}
+    return hit | {"context": context["data"], "error": None}
+
+
+def _build_blocks(hits: list[dict], contexts: list) -> tuple[list[str], list[float]]:
+    """
+    Render each hit as a section header followed by its messages.
+
+    Section headers score infinitely high so that packing only ever elides
+    messages; messages rank by hit similarity, conversation importance and
+    recency within the conversation.
+    """
+    blocks: list[str] = []
+    scores: list[float] = []
+
+    for i, (hit, context) in enumerate(zip(hits, contexts, strict=True), 1):
+        conv_id = hit["conversation_id"]
+        section = (
+            f"\n{'=' * 50}\n"
+            f"{i}. **{hit.get('label', 'Untitled')}** (Score: {hit.get('similarity', 0):.2f})\n"
+            f"   📁 {hit.get('folder', '/')}\n"
+            f"   🆔 {conv_id}\n"
+        )
+
+        if isinstance(context, BaseException):
+            logger.warning(f"Recall context fetch failed for {conv_id}: {context}")
+            blocks.append(section + f"   ⚠️ Context unavailable: {context}\n")
+            scores.append(float("inf"))
+            continue
+        if not context.get("success") or "data" not in context:
+            error_msg = context.get("error", "Conversation not found")
+            blocks.append(section + f"   ⚠️ Context unavailable: {error_msg}\n")
+            scores.append(float("inf"))
+            continue
+
+        data = context["data"]
+        messages = data.get("messages", [])
+        blocks.append(section)
+        scores.append(float("inf"))
+
+        for rank, msg in zip(recency_ranks(len(messages)), messages, strict=True):
+            blocks.append(
+                f"   - **{msg.get('role', 'unknown').upper()}**: {msg.get('content', '')}\n"
+            )
+            scores.append(
+                relevance_score(
+                    similarity=hit.get("similarity"),
+                    importance=data.get("importance_score"),
+                    recency=rank,
+                )
+            )
+
+    return blocks, scores
+
+
+MEMORY_RECALL_TOOL = Tool(
+    name="memory_recall",
+    description=(
+        "Search conversations and retrieve the full context of the top matches in one call"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Natural language search query",
+                "minLength": 1,
+                "maxLength": 1000,
+            },
+            "top_k": {
+                "type": "integer",
+                "description": "Number of top matches whose context is retrieved",
+                "default": 3,
+                "minimum": 1,
+                "maximum": 10,
+            },
+            "filter_labels": {
+                "type": "array",
+                "description": "Filter by specific conversation labels",
+                "items": {"type": "string", "minLength": 1},
+                "default": [],
+            },
+            "tail": {
+                "type": "integer",
+                "description": "Only retrieve the last N messages of each match",
+                "minimum": 1,
+                "maximum": 1000,
+            },
+            "max_tokens": {
+                "type": "integer",
+                "description": (
+                    "Token budget for the response; less relevant messages are elided to fit"
+                ),
+                "minimum": 50,
+                "maximum": 200000,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": ["query"],
+    },
+)
@@ -1,14 +1,31 @@
 """Memory Search Tool - Semantic search across conversations"""
 
 import logging
+from typing import Any
 
+import httpx
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import SearchInput
+from ..config import settings
+from ..cursors import CursorStore
+from ..health import health_monitor
+from ..models import OutputFormat, SearchInput, SearchMode
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..packing import estimate_tokens, pack, recency_ranks, relevance_score
+from ..progress import report_progress
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
+# Excerpt length per hit when no token budget is given
+EXCERPT_CHARS = 200
+
+# Pagination state for follow-up pages, held server-side
+search_cursors = CursorStore(
+    maxsize=settings.search_cursor_max_entries, ttl=settings.search_cursor_ttl
+)
+
 
 async def memory_search_tool(arguments: dict) -> list[TextContent]:
     """
@@ -18,59 +35,202 @@ async def memory_search_tool(arguments: dict) -> list[TextContent]:
         query: Natural language search query
         limit: Maximum results to return (default: 10, max: 50)
         filter_labels: Optional list of labels to restrict search
+        max_tokens: Token budget for the rendered results; the most relevant
+            hits are kept in full and the rest truncated or elided (optional)
+        cursor: Continuation cursor from a previous page of the same query (optional)
+        mode: 'semantic' (default) searches via the controller; 'lexical'
+            ranks conversations in the local BM25 index, which is also used
+            when the controller cannot be reached
+        output_format: 'text' (default) or 'json' for the raw hits with paging
+            state; max_tokens only applies to text
+
+    Each rendered hit is also sent as a progress notification when the client
+    supplied a progress token, so the first hits arrive before the full page.
 
     Returns:
-        Formatted search results with similarity scores and excerpts
+        Formatted search results with similarity scores and excerpts, plus a
+        continuation cursor when more results are available
     """
+    fmt = requested_format(arguments)
     try:
-        search_input = SearchInput(**arguments)
+        with phase("validate"):
+            search_input = SearchInput(**arguments)
 
         # Validate query
         if not search_input.query.strip():
             raise ValueError("Search query cannot be empty")
 
-        result = await sekha_client.search_memory(
-            query=search_input.query,
-            limit=search_input.limit,
-            filter_labels=search_input.filter_labels,
-        )
+        offset = 0
+        if search_input.cursor is not None:
+            state = search_cursors.get(search_input.cursor)
+            if state["query"] != search_input.query:
+                raise ValueError("Cursor does not belong to this query")
+            offset = state["offset"]
+            search_input = search_input.model_copy(
+                update={
+                    "limit": state["limit"],
+                    "filter_labels": state["filter_labels"],
+                    "max_tokens": state["max_tokens"],
+                    "mode": state.get("mode", SearchMode.SEMANTIC),
+                }
+            )
+
+        degraded = False
+        if search_input.mode == SearchMode.LEXICAL:
+            result = _lexical_search(search_input, offset)
+        elif sekha_client.index is not None and health_monitor.unavailable:
+            # The controller has failed its recent health probes; skip the timeout
+            result = _lexical_search(search_input, offset)
+            degraded = True
+        else:
+            try:
+                result = await sekha_client.search_memory(
+                    query=search_input.query,
+                    limit=search_input.limit,
+                    filter_labels=search_input.filter_labels,
+                    **({"offset": offset} if offset else {}),
+                )
+            except httpx.HTTPError as e:
+                if sekha_client.index is None:
+                    raise
+                logger.warning(f"Controller search failed, using local lexical index: {e}")
+                result = _lexical_search(search_input, offset)
+                degraded = True
 
         if result.get("success") and "data" in result:
-            results = result["data"].get("results", [])
+            data = result["data"]
+            results = data.get("results", [])
+            if not degraded:
+                sekha_client.prefetch.schedule(results)
+
+            cursor = None
+            if results and data.get("has_more", len(results) >= search_input.limit):
+                cursor = search_cursors.put(
+                    {
+                        "query": search_input.query,
+                        "limit": search_input.limit,
+                        "filter_labels": search_input.filter_labels,
+                        "max_tokens": search_input.max_tokens,
+                        "offset": offset + len(results),
+                        "mode": SearchMode.LEXICAL if degraded else search_input.mode,
+                    }
+                )
+
+            if fmt == OutputFormat.JSON:
+                return json_content(
+                    {
+                        "results": results,
+                        "offset": offset,
+                        "has_more": bool(cursor),
+                        "cursor": cursor,
+                        "mode": (SearchMode.LEXICAL if degraded else search_input.mode).value,
+                        "degraded": degraded,
+                    }
+                )
 
+            notice = (
+                "⚠️ Controller unavailable; showing local lexical matches.\n" if degraded else ""
+            )
             if not results:
-                return [TextContent(type="text", text="🔍 No matching conversations found.")]
+                return [
+                    TextContent(type="text", text=notice + "🔍 No matching conversations found.")
+                ]
 
-            output = [
+            header = notice + (
                 f"🔍 Found {len(results)} relevant conversation{'s' if len(results) > 1 else ''}:\n"
-            ]
-
-            for i, res in enumerate(results, 1):
-                similarity = res.get("similarity", 0)
-                label = res.get("label", "Untitled")
-                folder = res.get("folder", "/")
-                content = res.get("content", "")[:200]
-                conv_id = res.get("conversation_id", "unknown")
-
-                output.append(
-                    f"\n{i}. **{label}** (Score: {similarity:.2f})\n"
-                    f"   📁 {folder}\n"
-                    f"   📝 {content}{'...' if len(res.get('content', '')) > 200 else ''}\n"
-                    f"   🆔 {conv_id}"
-                )
+            )
+
+            budget = None
+            if search_input.max_tokens is not None:
+                budget = search_input.max_tokens - estimate_tokens(header)
+            with phase("render"):
+                if budget is None:
+                    blocks = []
+                    for i, res in enumerate(results, offset + 1):
+                        blocks.append(_format_hit(i, res, EXCERPT_CHARS))
+                        # Send each hit as soon as it is formatted
+                        await report_progress(len(blocks), len(results), blocks[-1])
+                else:
+                    # The packer needs every hit before it can choose what to keep
+                    blocks = render_hits(results, offset, budget)
+                    for i, block in enumerate(blocks, 1):
+                        await report_progress(i, len(blocks), block)
 
-            return [TextContent(type="text", text="".join(output))]
+            if cursor:
+                blocks.append(f"\n\n➡️ More results available. Continue with cursor: {cursor}")
+
+            return [TextContent(type="text", text=header + "".join(blocks))]
         else:
             error_msg = result.get("error", "Search failed")
             logger.warning(f"Search failed: {error_msg}")
-            return [TextContent(type="text", text=f"❌ Search failed: {error_msg}")]
+            return error_content(fmt, f"Search failed: {error_msg}")
 
     except ValueError as ve:
         logger.error(f"Validation error in memory_search: {ve}")
-        return [TextContent(type="text", text=f"❌ Validation error: {str(ve)}")]
+        return error_content(fmt, f"Validation error: {str(ve)}")
     except Exception as e:
         logger.error(f"Memory search failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+def _lexical_search(search_input: SearchInput, offset: int) -> dict[str, Any]:
+    """Answer a search from the local lexical index in the controller's response shape"""
+    if sekha_client.index is None:
+        raise ValueError("Lexical search is disabled. Set LEXICAL_INDEX_ENABLED=true to enable it.")
+    results, has_more = sekha_client.index.search(
+        search_input.query,
+        limit=search_input.limit,
+        offset=offset,
+        filter_labels=search_input.filter_labels,
+    )
+    return {"success": True, "data": {"results": results, "has_more": has_more}}
+
+
+def render_hits(results: list[dict], offset: int = 0, max_tokens: int | None = None) -> list[str]:
+    """
+    Render search hits as text blocks, numbered from offset + 1.
+
+    Without a token budget each hit's content is cut to EXCERPT_CHARS; with
+    one, full content is handed to the packer, which truncates or elides the
+    least relevant hits to fit.
+    """
+    if max_tokens is None:
+        return [_format_hit(i, res, EXCERPT_CHARS) for i, res in enumerate(results, offset + 1)]
+
+    blocks = [_format_hit(i, res, None) for i, res in enumerate(results, offset + 1)]
+    return pack(blocks, _hit_scores(results), max_tokens, noun="result").chunks
+
+
+def _format_hit(index: int, res: dict, excerpt_chars: int | None) -> str:
+    """Render one search hit, optionally cutting its content to an excerpt"""
+    content = res.get("content", "")
+    if excerpt_chars is not None and len(content) > excerpt_chars:
+        content = content[:excerpt_chars] + "..."
+
+    return (
+        f"\n{index}. **{res.get('label', 'Untitled')}** (Score: {res.get('similarity', 0):.2f})\n"
+        f"   📁 {res.get('folder', '/')}\n"
+        f"   📝 {content}\n"
+        f"   🆔 {res.get('conversation_id', 'unknown')}"
+    )
+
+
+def _hit_scores(results: list[dict]) -> list[float]:
+    """Rank hits by similarity, importance and recency for token-budgeted packing"""
+    dated = sorted(
+        (i for i, res in enumerate(results) if res.get("created_at")),
+        key=lambda i: str(results[i]["created_at"]),
+    )
+    recency = dict(zip(dated, recency_ranks(len(dated)), strict=True))
+
+    return [
+        relevance_score(
+            similarity=res.get("similarity"),
+            importance=res.get("importance_score"),
+            recency=recency.get(i),
+        )
+        for i, res in enumerate(results)
+    ]
 
 
 MEMORY_SEARCH_TOOL = Tool(
@@ -98,6 +258,28 @@ MEMORY_SEARCH_TOOL = Tool(
                 "items": {"type": "string", "minLength": 1},
                 "default": [],
             },
+            "max_tokens": {
+                "type": "integer",
+                "description": (
+                    "Token budget for the response; less relevant results are elided to fit"
+                ),
+                "minimum": 50,
+                "maximum": 200000,
+            },
+            "cursor": {
+                "type": "string",
+                "description": "Continuation cursor returned by a previous page of this query",
+            },
+            "mode": {
+                "type": "string",
+                "description": (
+                    "'semantic' searches via the controller; 'lexical' uses the local "
+                    "keyword index (fast, works offline)"
+                ),
+                "enum": ["semantic", "lexical"],
+                "default": "semantic",
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": ["query"],
     },
@@ -6,6 +6,11 @@ from mcp.types import TextContent, Tool
 from pydantic import BaseModel, Field
 
 from ..client import sekha_client
+from ..compression import stats as compression_stats
+from ..health import health_monitor
+from ..models import OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +25,19 @@ async def memory_stats_tool(arguments: dict) -> list[TextContent]:
 
     Args:
         folder: Optional specific folder to analyze
+        output_format: 'text' (default) or 'json' for the raw controller data
     """
+    fmt = requested_format(arguments)
     try:
-        input_data = StatsInput(**arguments)
+        with phase("validate"):
+            input_data = StatsInput(**arguments)
 
         result = await sekha_client.get_stats(folder=input_data.folder)
 
         if result.get("success") and "data" in result:
             data = result["data"]
+            if fmt == OutputFormat.JSON:
+                return json_content(data)
 
             output = ["📊 Memory Statistics\n", "=" * 30, "\n"]
 
@@ -42,14 +52,35 @@ async def memory_stats_tool(arguments: dict) -> list[TextContent]:
             if data.get("estimated_token_savings"):
                 output.append(f"\n💾 Estimated Storage: {data['estimated_token_savings']} tokens\n")
 
+            if compression_stats.saved_bytes > 0:
+                output.append(f"\n🗜️ Transport compression {compression_stats.describe()}\n")
+
+            if sekha_client.prefetch.issued:
+                output.append(f"\n⚡ Prefetch: {sekha_client.prefetch.describe()}\n")
+
+            if sekha_client.known.rejected:
+                output.append(f"\n🚫 {sekha_client.known.describe()}\n")
+
+            health = health_monitor.status
+            if health_monitor.running and health is not None:
+                output.append(f"\n🩺 Controller {health.status}")
+                # Latency percentiles only exist once a probe has succeeded
+                if health.p50_latency_ms is not None:
+                    output.append(
+                        f": p50 {health.p50_latency_ms} ms, p99 {health.p99_latency_ms} ms"
+                    )
+                if health.consecutive_failures:
+                    output.append(f", {health.consecutive_failures} failed probes in a row")
+                output.append("\n")
+
             return [TextContent(type="text", text="".join(output))]
         else:
             error_msg = result.get("error", "Stats retrieval failed")
-            return [TextContent(type="text", text=f"❌ {error_msg}")]
+            return error_content(fmt, f"{error_msg}")
 
     except Exception as e:
         logger.error(f"Stats failed: {e}")
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
 
 
 MEMORY_STATS_TOOL = Tool(
@@ -62,7 +93,8 @@ MEMORY_STATS_TOOL = Tool(
                 "type": "string",
                 "description": "Optional specific folder to analyze",
                 "pattern": "^/[a-zA-Z0-9_\\-/]*$",
-            }
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": [],
     },
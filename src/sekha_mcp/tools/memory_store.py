@@ -1,16 +1,60 @@
 """Memory Store Tool - Stores conversations in Sekha memory system"""
 
+import hashlib
+import json
 import logging
 from typing import Any
 
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import ConversationInput, MessageRole
+from ..models import ConversationInput, MessageRole, OutputFormat
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..resources import notify_changed
+from ..timing import phase, record_cache
 
 logger = logging.getLogger(__name__)
 
 
+def content_hash(conversation: dict[str, Any]) -> str:
+    """
+    Stable hash of a conversation's normalized label, folder, importance and messages.
+
+    Whitespace around the label and message contents, a trailing folder
+    slash, timestamps and metadata do not affect the hash, so a retried or
+    re-saved transcript hashes the same.
+    """
+    normalized = [
+        conversation["label"].strip(),
+        conversation["folder"].rstrip("/") or "/",
+        conversation.get("importance_score"),
+        [[m["role"], m["content"].strip()] for m in conversation["messages"]],
+    ]
+    raw = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def api_conversation(conv_input: ConversationInput) -> dict[str, Any]:
+    """Convert validated input to the controller's store format"""
+    conversation: dict[str, Any] = {
+        "label": conv_input.label,
+        "folder": conv_input.folder,
+        "messages": [
+            {
+                "role": msg.role.value if isinstance(msg.role, MessageRole) else msg.role,
+                "content": msg.content,
+                "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+                "metadata": msg.metadata or {},
+            }
+            for msg in conv_input.messages
+        ],
+    }
+
+    if conv_input.importance_score is not None:
+        conversation["importance_score"] = conv_input.importance_score
+    return conversation
+
+
 async def memory_store_tool(arguments: dict) -> list[TextContent]:
     """
     Store a new conversation in Sekha memory.
@@ -20,62 +64,85 @@ async def memory_store_tool(arguments: dict) -> list[TextContent]:
         folder: Folder path (e.g., /projects/ai)
         messages: List of message objects with role, content, timestamp, metadata
         importance_score: Optional importance score 0.0-10.0
+        append: Treat messages as the full transcript so far and send only
+            the messages not yet persisted (default: False)
+        conversation_id: Existing conversation to append to (append mode)
+        session_key: Client-side key identifying the transcript (append mode)
+        output_format: 'text' (default) or 'json' for the raw controller data
+
+    Plain stores of a conversation identical to one stored recently (see
+    content_hash) return the original conversation ID without contacting the
+    controller; otherwise the hash is sent as the Idempotency-Key header.
 
     Returns:
         List of TextContent objects with status message and conversation ID
     """
+    fmt = requested_format(arguments)
     try:
         # Validate and parse input
-        conv_input = ConversationInput(**arguments)
+        with phase("validate"):
+            conv_input = ConversationInput(**arguments)
 
         # Ensure at least one message
         if not conv_input.messages:
             raise ValueError("At least one message is required")
 
-        # Convert to API format
-        conversation: dict[str, Any] = {
-            "label": conv_input.label,
-            "folder": conv_input.folder,
-            "messages": [
-                {
-                    "role": msg.role.value if isinstance(msg.role, MessageRole) else msg.role,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
-                    "metadata": msg.metadata or {},
-                }
-                for msg in conv_input.messages
-            ],
-        }
-
-        if conv_input.importance_score is not None:
-            conversation["importance_score"] = conv_input.importance_score
+        conversation = api_conversation(conv_input)
 
         # Store via Sekha Controller
-        result = await sekha_client.store_conversation(conversation)
+        if conv_input.append:
+            result = await sekha_client.store_incremental(
+                conversation,
+                session_key=conv_input.session_key,
+                conversation_id=conv_input.conversation_id,
+            )
+        else:
+            key = content_hash(conversation)
+            original = sekha_client.stored_hashes.get(key)
+            if original is not None:
+                record_cache("hit")
+                result = {"success": True, "data": {**original, "deduplicated": True}}
+            else:
+                result = await sekha_client.store_conversation(conversation, idempotency_key=key)
+                if result.get("success") and result.get("data", {}).get("conversation_id"):
+                    sekha_client.remember_stored(key, result["data"])
 
         if result.get("success") and "data" in result:
             data = result["data"]
+            if data.get("mode") != "unchanged" and not data.get("deduplicated"):
+                await notify_changed(data.get("conversation_id"), [conv_input.folder])
+            if data.get("replaced"):
+                await notify_changed(data["replaced"], [])
+            if fmt == OutputFormat.JSON:
+                return json_content(data)
+            headline = {
+                "append": f"✅ Appended {data.get('appended', 0)} new messages!",
+                "unchanged": "ℹ️ No new messages to store.",
+            }.get(data.get("mode", ""), "✅ Conversation stored successfully!")
+            if data.get("deduplicated"):
+                headline = "ℹ️ Identical conversation already stored."
             return [
                 TextContent(
                     type="text",
                     text=(
-                        f"✅ Conversation stored successfully!\n"
+                        f"{headline}\n"
                         f"ID: {data.get('conversation_id', 'unknown')}\n"
                         f"Messages: {data.get('message_count', 0)}"
+                        + (f"\nReplaces: {data['replaced']}" if data.get("replaced") else "")
                     ),
                 )
             ]
         else:
             error_msg = result.get("error", "Unknown error")
             logger.warning(f"Store failed: {error_msg}")
-            return [TextContent(type="text", text=f"❌ Failed to store conversation: {error_msg}")]
+            return error_content(fmt, f"Failed to store conversation: {error_msg}")
 
     except ValueError as ve:
         logger.error(f"Validation error in memory_store: {ve}")
-        return [TextContent(type="text", text=f"❌ Validation error: {str(ve)}")]
+        return error_content(fmt, f"Validation error: {str(ve)}")
     except Exception as e:
         logger.error(f"Memory store failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
 
 
 MEMORY_STORE_TOOL = Tool(
@@ -133,6 +200,24 @@ MEMORY_STORE_TOOL = Tool(
                 "maximum": 10.0,
                 "default": 5.0,
             },
+            "append": {
+                "type": "boolean",
+                "description": (
+                    "Treat messages as the full transcript so far and only send messages "
+                    "not yet stored (requires conversation_id or session_key)"
+                ),
+                "default": False,
+            },
+            "conversation_id": {
+                "type": "string",
+                "description": "Existing conversation to append to (append mode)",
+            },
+            "session_key": {
+                "type": "string",
+                "description": "Client-chosen key identifying this transcript (append mode)",
+                "maxLength": 200,
+            },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": ["label", "folder", "messages"],
     },
@@ -5,7 +5,10 @@ import logging
 from mcp.types import TextContent, Tool
 
 from ..client import sekha_client
-from ..models import UpdateInput
+from ..models import OutputFormat, UpdateInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..resources import current_folder, notify_changed
+from ..timing import phase
 
 logger = logging.getLogger(__name__)
 
@@ -19,24 +22,17 @@ async def memory_update_tool(arguments: dict) -> list[TextContent]:
         label: New conversation title (optional)
         folder: New folder path (optional)
         importance_score: New importance score 0.0-10.0 (optional)
+        output_format: 'text' (default) or 'json' for the raw controller data
 
     Returns:
         Success status with list of updated fields
     """
+    fmt = requested_format(arguments)
     try:
-        update_input = UpdateInput(**arguments)
-
-        # Validate at least one field is being updated
-        fields_to_update = [
-            f
-            for f in [update_input.label, update_input.folder, update_input.importance_score]
-            if f is not None
-        ]
-        if not fields_to_update:
-            raise ValueError(
-                "At least one field (label, folder, or importance_score) must be provided"
-            )
+        with phase("validate"):
+            update_input = UpdateInput(**arguments)
 
+        previous_folder = await current_folder(update_input.conversation_id)
         result = await sekha_client.update_conversation(
             conversation_id=update_input.conversation_id,
             label=update_input.label,
@@ -45,6 +41,11 @@ async def memory_update_tool(arguments: dict) -> list[TextContent]:
         )
 
         if result.get("success") and "data" in result:
+            await notify_changed(
+                update_input.conversation_id, [previous_folder, update_input.folder]
+            )
+            if fmt == OutputFormat.JSON:
+                return json_content(result["data"])
             updated_fields = result["data"].get("updated_fields", [])
 
             if not updated_fields:
@@ -70,14 +71,14 @@ async def memory_update_tool(arguments: dict) -> list[TextContent]:
         else:
             error_msg = result.get("error", "Update failed")
             logger.warning(f"Update failed: {error_msg}")
-            return [TextContent(type="text", text=f"❌ Update failed: {error_msg}")]
+            return error_content(fmt, f"Update failed: {error_msg}")
 
     except ValueError as ve:
         logger.error(f"Validation error in memory_update: {ve}")
-        return [TextContent(type="text", text=f"❌ Validation error: {str(ve)}")]
+        return error_content(fmt, f"Validation error: {str(ve)}")
     except Exception as e:
         logger.error(f"Memory update failed: {e}", exc_info=True)
-        return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
+        return error_content(fmt, f"Error: {str(e)}")
 
 
 MEMORY_UPDATE_TOOL = Tool(
@@ -109,6 +110,7 @@ MEMORY_UPDATE_TOOL = Tool(
                 "minimum": 0.0,
                 "maximum": 10.0,
             },
+            "output_format": OUTPUT_FORMAT_PROPERTY,
         },
         "required": ["conversation_id"],
     },
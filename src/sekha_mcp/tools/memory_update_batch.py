@@ -0,0 +1,154 @@
+"""Memory Update Batch Tool - Update metadata of many conversations at once"""
+
+import logging
+
+from mcp.types import TextContent, Tool
+from pydantic import ValidationError
+
+from ..client import sekha_client
+from ..concurrency import gather_bounded
+from ..config import settings
+from ..models import OutputFormat, UpdateBatchInput, UpdateInput
+from ..output import OUTPUT_FORMAT_PROPERTY, error_content, json_content, requested_format
+from ..resources import current_folder, notify_changed
+from ..timing import phase
+
+logger = logging.getLogger(__name__)
+
+
+async def memory_update_batch_tool(arguments: dict) -> list[TextContent]:
+    """
+    Update metadata of many conversations with bounded concurrency.
+
+    Args:
+        updates: List of update objects (conversation_id plus fields to change)
+        conversation_ids: Conversation ids that all receive the shared fields below
+        label: New title applied to every id in conversation_ids (optional)
+        folder: New folder applied to every id in conversation_ids (optional)
+        importance_score: New importance applied to every id in conversation_ids (optional)
+        output_format: 'text' (default) or 'json' for per-conversation records
+
+    Returns:
+        Summary with one result line per conversation
+    """
+    fmt = requested_format(arguments)
+    try:
+        with phase("validate"):
+            batch_input = UpdateBatchInput(**arguments)
+        items = batch_input.items()
+
+        results = await gather_bounded(_update_one, items, settings.max_concurrency)
+        succeeded = sum(1 for res in results if res["success"])
+
+        if fmt == OutputFormat.JSON:
+            return json_content({"updated": succeeded, "total": len(items), "results": results})
+
+        output = [f"📦 Updated {succeeded} of {len(items)} conversations\n"]
+        output.extend(_result_line(res) for res in results)
+
+        return [TextContent(type="text", text="".join(output))]
+
+    except ValueError as ve:
+        logger.error(f"Validation error in memory_update_batch: {ve}")
+        return error_content(fmt, f"Validation error: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Memory update batch failed: {e}", exc_info=True)
+        return error_content(fmt, f"Error: {str(e)}")
+
+
+async def _update_one(item: dict) -> dict:
+    """Validate and apply one update, returning its outcome record"""
+    conv_id = item.get("conversation_id", "unknown")
+    outcome = {"conversation_id": conv_id, "success": False}
+    try:
+        update_input = UpdateInput(**item)
+    except ValidationError as ve:
+        messages = "; ".join(err["msg"] for err in ve.errors())
+        return outcome | {"error": f"Validation error: {messages}"}
+
+    previous_folder = await current_folder(update_input.conversation_id)
+    try:
+        result = await sekha_client.update_conversation(
+            conversation_id=update_input.conversation_id,
+            label=update_input.label,
+            folder=update_input.folder,
+            importance_score=update_input.importance_score,
+        )
+    except Exception as e:
+        logger.warning(f"Batch update of {conv_id} failed: {e}")
+        return outcome | {"error": f"Error: {str(e)}"}
+
+    if not result.get("success") or "data" not in result:
+        return outcome | {"error": result.get("error", "Update failed")}
+
+    await notify_changed(update_input.conversation_id, [previous_folder, update_input.folder])
+    return outcome | {"success": True, "updated_fields": result["data"].get("updated_fields", [])}
+
+
+def _result_line(outcome: dict) -> str:
+    """Render one update outcome as a result line"""
+    conv_id = outcome["conversation_id"]
+    if not outcome["success"]:
+        return f"\n❌ {conv_id}: {outcome['error']}"
+    if not outcome["updated_fields"]:
+        return f"\n⚠️ {conv_id}: no fields were changed"
+    return f"\n✅ {conv_id}: {', '.join(outcome['updated_fields'])}"
+
+
+_UPDATE_FIELDS_SCHEMA = {
+    "label": {
+        "type": "string",
+        "description": "New conversation title",
+        "minLength": 1,
+        "maxLength": 500,
+    },
+    "folder": {
+        "type": "string",
+        "description": "New folder path (e.g., /projects/ai)",
+        "pattern": "^/[a-zA-Z0-9_\\-/]*$",
+    },
+    "importance_score": {
+        "type": "number",
+        "description": "New importance score (0.0-10.0, higher is more important)",
+        "minimum": 0.0,
+        "maximum": 10.0,
+    },
+}
+
+MEMORY_UPDATE_BATCH_TOOL = Tool(
+    name="memory_update_batch",
+    description=(
+        "Update metadata (label, folder, importance score) of many conversations in one call"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "updates": {
+                "type": "array",
+                "description": "Per-conversation updates",
+                "maxItems": 100,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "conversation_id": {
+                            "type": "string",
+                            "description": "UUID of the conversation to update",
+                            "minLength": 1,
+                        },
+                        **_UPDATE_FIELDS_SCHEMA,
+                    },
+                    "required": ["conversation_id"],
+                },
+            },
+            "conversation_ids": {
+                "type": "array",
+                "description": "Conversations that all receive the label/folder/importance below",
+                "maxItems": 100,
+                "items": {"type": "string", "minLength": 1},
+            },
+            **_UPDATE_FIELDS_SCHEMA,
+            "output_format": OUTPUT_FORMAT_PROPERTY,
+        },
+        "required": [],
+    },
+)
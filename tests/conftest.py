@@ -0,0 +1,41 @@
+"""Shared test fixtures"""
+
+import pytest
+
+from sekha_mcp import compression
+from sekha_mcp.client import sekha_client
+from sekha_mcp.compression import stats as compression_stats
+
+
+@pytest.fixture(autouse=True)
+def _clear_store_dedup():
+    """Start every test with an empty dedup table so identical payloads reach the mocks"""
+    sekha_client.stored_hashes.clear()
+    yield
+    sekha_client.stored_hashes.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_compression_stats():
+    """Keep byte counters and rejected encodings per test"""
+    compression_stats.reset()
+    compression.rejected.clear()
+    yield
+    compression_stats.reset()
+    compression.rejected.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_stats_cache():
+    """Stats cached by the global client in one test must not answer the next"""
+    sekha_client.stats.clear()
+    yield
+    sekha_client.stats.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_not_found_cache():
+    """Ids one test's controller reported missing must not be rejected in the next"""
+    sekha_client.known.reset()
+    yield
+    sekha_client.known.reset()
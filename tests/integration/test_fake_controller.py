@@ -0,0 +1,310 @@
+"""Offline integration tests against the in-process fake controller"""
+
+import copy
+import json
+import random
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sekha_mcp.client import SekhaClient, sekha_client
+from sekha_mcp.testing import ErrorInjection, FakeController, LatencyModel
+from sekha_mcp.tools.memory_get_context import memory_get_context_tool
+from sekha_mcp.tools.memory_prune import memory_prune_tool
+from sekha_mcp.tools.memory_prune_apply import memory_prune_apply_tool
+from sekha_mcp.tools.memory_search import memory_search_tool
+from sekha_mcp.tools.memory_store import memory_store_tool
+
+pytestmark = pytest.mark.integration
+
+
+def _client(controller: FakeController) -> SekhaClient:
+    return SekhaClient(transport=httpx.ASGITransport(app=controller))
+
+
+@pytest.mark.asyncio
+async def test_client_round_trip():
+    """Test store, search, update, context, stats and prune end-to-end"""
+    controller = FakeController()
+    client = _client(controller)
+
+    stored = await client.store_conversation(
+        {
+            "label": "Rust borrow checker",
+            "folder": "/work",
+            "importance_score": 2.0,
+            "messages": [{"role": "user", "content": f"lifetimes question {i}"} for i in range(5)],
+        }
+    )
+    conv_id = stored["data"]["conversation_id"]
+
+    search = await client.search_memory("borrow lifetimes")
+    assert search["data"]["results"][0]["conversation_id"] == conv_id
+
+    update = await client.update_conversation(conv_id, folder="/archive")
+    assert update["data"]["updated_fields"] == ["folder"]
+
+    context = await client.get_context(conv_id, offset=1, limit=2)
+    assert context["data"]["total_messages"] == 5
+    assert [m["content"] for m in context["data"]["messages"]] == [
+        "lifetimes question 1",
+        "lifetimes question 2",
+    ]
+
+    stats = await client.get_stats(folder="/archive")
+    assert stats["data"]["total_conversations"] == 1
+
+    controller.conversations[conv_id]["created_at"] = "2020-01-01T00:00:00+00:00"
+    prune = await client.prune_memory(threshold_days=30, importance_threshold=5.0)
+    assert prune["data"]["suggestions"][0]["conversation_id"] == conv_id
+
+    assert controller.request_counts["memory_store"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tools_end_to_end_through_fake_controller():
+    """Test tools against the fake controller without mocking the client"""
+    controller = FakeController()
+    controller.generate_dataset(3, messages_per_conversation=6)
+    conv_id = next(iter(controller.conversations))
+
+    with patch.object(sekha_client, "transport", httpx.ASGITransport(app=controller)):
+        stored = await memory_store_tool(
+            {
+                "label": "Offline test",
+                "folder": "/tests",
+                "messages": [{"role": "user", "content": "offline controller works"}],
+            }
+        )
+        search = await memory_search_tool({"query": "offline controller"})
+        context = await memory_get_context_tool(
+            {"conversation_id": conv_id, "limit": 2, "offset": 2}
+        )
+
+    assert "stored successfully" in stored[0].text
+    assert "Offline test" in search[0].text
+    assert "2 of 6 (from #3)" in context[0].text
+    assert "Continue with cursor" in context[0].text
+
+
+@pytest.mark.asyncio
+async def test_error_injection_and_not_found():
+    """Test injected failures and unknown ids surface as HTTP errors"""
+    controller = FakeController(
+        endpoint_errors={"memory_search": ErrorInjection(rate=1.0, status_codes=(503,))}
+    )
+    client = _client(controller)
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.search_memory("anything")
+    assert exc_info.value.response.status_code == 503
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_context("missing")
+    assert exc_info.value.response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_latency_and_auth():
+    """Test configured latency is applied and the API key is enforced"""
+    controller = FakeController(
+        endpoint_latency={"stats": LatencyModel("constant", 20)}, api_key="secret"
+    )
+    client = _client(controller)
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_stats()
+    assert exc_info.value.response.status_code == 401
+
+    client.headers["Authorization"] = "Bearer secret"
+    started = time.perf_counter()
+    await client.get_stats()
+    assert time.perf_counter() - started >= 0.02
+
+
+def test_latency_distributions_are_non_negative():
+    """Test each distribution samples non-negative seconds"""
+    rng = random.Random(1)
+    for distribution in ("constant", "uniform", "normal", "lognormal"):
+        model = LatencyModel(distribution, mean_ms=5, jitter_ms=10)
+        assert all(model.sample(rng) >= 0 for _ in range(100))
+
+    with pytest.raises(ValueError):
+        LatencyModel("pareto", mean_ms=5).sample(rng)
+
+
+def test_load_dataset_json_and_ndjson(tmp_path):
+    """Test datasets load from JSON arrays and NDJSON exports"""
+    records = [
+        {"conversation_id": "conv-1", "label": "One", "messages": []},
+        {"conversation_id": "conv-2", "label": "Two", "messages": []},
+    ]
+    json_path = tmp_path / "dataset.json"
+    json_path.write_text(json.dumps(records))
+    ndjson_path = tmp_path / "dataset.ndjson"
+    ndjson_path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+    controller = FakeController()
+    assert controller.load_dataset(json_path) == 2
+    assert controller.load_dataset(ndjson_path) == 2
+    assert set(controller.conversations) == {"conv-1", "conv-2"}
+
+
+@pytest.mark.asyncio
+async def test_incremental_store_sends_only_new_messages():
+    """Test append mode uploads each message once and falls back to a full store"""
+    controller = FakeController()
+    client = _client(controller)
+    transcript = [{"role": "user", "content": f"step {i}"} for i in range(3)]
+    conversation = {"label": "Agent run", "folder": "/agents", "messages": transcript}
+
+    first = await client.store_incremental(conversation, session_key="run-1")
+    conv_id = first["data"]["conversation_id"]
+    assert first["data"]["mode"] == "full"
+
+    transcript += [{"role": "assistant", "content": "step 3"}]
+    second = await client.store_incremental(conversation, session_key="run-1")
+    assert second["data"] == {
+        "conversation_id": conv_id,
+        "message_count": 4,
+        "appended": 1,
+        "mode": "append",
+    }
+    unchanged = await client.store_incremental(conversation, session_key="run-1")
+    assert unchanged["data"]["mode"] == "unchanged"
+    assert controller.request_counts["memory_append"] == 1
+    assert len(controller.conversations[conv_id]["messages"]) == 4
+
+    # A fresh process learns the persisted prefix from the controller
+    fresh = _client(controller)
+    transcript += [{"role": "user", "content": "step 4"}]
+    resumed = await fresh.store_incremental(conversation, conversation_id=conv_id)
+    assert (resumed["data"]["mode"], resumed["data"]["appended"]) == ("append", 1)
+
+    # Rewritten history, or a conversation deleted upstream, stores a new one
+    edited = {**conversation, "messages": [{"role": "user", "content": "other"}, *transcript]}
+    rewritten = await fresh.store_incremental(edited, conversation_id=conv_id)
+    assert rewritten["data"]["mode"] == "full"
+    assert rewritten["data"]["conversation_id"] != conv_id
+
+    del controller.conversations[conv_id]
+    transcript += [{"role": "user", "content": "step 5"}]
+    gone = await client.store_incremental(conversation, session_key="run-1")
+    assert gone["data"]["mode"] == "full"
+    assert controller.request_counts["memory_store"] == 3
+
+
+@pytest.mark.asyncio
+async def test_incremental_store_without_append_endpoint():
+    """Test a controller lacking memory_append keeps one copy and the id stays known"""
+    controller = FakeController()
+    del controller._routes[("POST", "/mcp/tools/memory_append")]
+    client = _client(controller)
+    transcript = [{"role": "user", "content": "step 0"}]
+    conversation = {"label": "Agent run", "folder": "/agents", "messages": transcript}
+    first = await client.store_incremental(conversation, session_key="run-1")
+    conv_id = first["data"]["conversation_id"]
+
+    transcript.append({"role": "assistant", "content": "step 1"})
+    second = await client.store_incremental(conversation, session_key="run-1")
+    assert second["data"]["mode"] == "full"
+    assert second["data"]["replaced"] == conv_id
+    assert not client.append_supported
+
+    for i in range(2, 4):
+        transcript.append({"role": "user", "content": f"step {i}"})
+        latest = await client.store_incremental(conversation, session_key="run-1")
+
+    # Each checkpoint replaced the previous copy instead of adding one
+    assert list(controller.conversations) == [latest["data"]["conversation_id"]]
+    assert len(controller.conversations[latest["data"]["conversation_id"]]["messages"]) == 4
+
+    # The route's 404 never marks the live conversation as missing, even when
+    # the superseded copy cannot be deleted
+    controller = FakeController(endpoint_errors={"delete": ErrorInjection(rate=1.0)})
+    del controller._routes[("POST", "/mcp/tools/memory_append")]
+    client = _client(controller)
+    conversation["messages"] = transcript[:1]
+    original = (await client.store_incremental(conversation))["data"]
+    conversation["messages"] = transcript
+    await client.store_incremental(conversation, conversation_id=original["conversation_id"])
+    assert not client.known.rejects(original["conversation_id"])
+    assert (await client.get_context(original["conversation_id"]))["success"]
+
+
+@pytest.mark.asyncio
+async def test_prune_pages_and_apply():
+    """Test paging prune suggestions locally, then archiving and deleting them"""
+    controller = FakeController()
+    client = _client(controller)
+    ids = []
+    for i in range(5):
+        stored = await client.store_conversation(
+            {"label": f"old {i}", "folder": "/tmp", "messages": [{"role": "user", "content": "x"}]}
+        )
+        ids.append(stored["data"]["conversation_id"])
+        controller.conversations[ids[-1]]["created_at"] = "2020-01-01T00:00:00+00:00"
+
+    page = await client.prune_memory(threshold_days=30, offset=2, limit=2)
+    assert len(page["data"]["suggestions"]) == 2
+    assert page["data"]["has_more"] is True
+
+    pages = [p async for p in client.iter_prune_pages(threshold_days=30, page_size=2)]
+    assert [len(p) for p in pages] == [2, 2, 1]
+
+    archived = await client.update_conversation(ids[0], status="archived")
+    assert archived["success"]
+    assert controller.conversations[ids[0]]["status"] == "archived"
+
+    deleted = await client.delete_conversation(ids[1])
+    assert deleted["data"] == {"deleted": ids[1]}
+    assert ids[1] not in controller.conversations
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.delete_conversation(ids[1])
+
+
+@pytest.mark.asyncio
+async def test_prune_apply_pages_past_first_page():
+    """Test criteria-based pruning walks every page exactly once"""
+    controller = FakeController()
+    for i in range(250):
+        controller.add_conversation({"label": f"old {i}", "created_at": "2020-01-01T00:00:00Z"})
+    client = _client(controller)
+
+    with patch("sekha_mcp.tools.memory_prune.sekha_client", client):
+        first = json.loads(
+            (
+                await memory_prune_tool(
+                    {"threshold_days": 30, "limit": 100, "output_format": "json"}
+                )
+            )[0].text
+        )
+        second = json.loads(
+            (await memory_prune_tool({"cursor": first["cursor"], "output_format": "json"}))[0].text
+        )
+    first_ids = {s["conversation_id"] for s in first["suggestions"]}
+    assert first_ids.isdisjoint(s["conversation_id"] for s in second["suggestions"])
+
+    with patch("sekha_mcp.tools.memory_prune_apply.sekha_client", client):
+        result = await memory_prune_apply_tool(
+            {"action": "delete", "threshold_days": 30, "max_items": 300, "output_format": "json"}
+        )
+    data = json.loads(result[0].text)
+    assert (data["succeeded"], data["total"]) == (250, 250)
+    assert controller.conversations == {}
+    assert controller.request_counts["memory_prune"] == 5
+
+
+@pytest.mark.asyncio
+async def test_unpaginated_prune_response_of_exactly_limit_ends_paging():
+    """Test a controller ignoring offset/limit cannot make the same page repeat"""
+    suggestions = [{"conversation_id": f"c{i}"} for i in range(100)]
+    client = SekhaClient()
+    response = {"success": True, "data": {"suggestions": suggestions}}
+    with patch.object(client, "_post", side_effect=lambda *a: copy.deepcopy(response)):
+        pages = [p async for p in client.iter_prune_pages(threshold_days=30, page_size=100)]
+        later = await client.prune_memory(threshold_days=30, offset=100, limit=100)
+    assert [len(p) for p in pages] == [100]
+    assert later["data"] == {"suggestions": [], "has_more": False}
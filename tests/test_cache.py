@@ -0,0 +1,54 @@
+"""Tests for in-process caches"""
+
+from sekha_mcp.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test the cache stays bounded and keeps recently used entries"""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    """Test entries expire after their TTL, including per-entry overrides"""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("short", 1, ttl=1)
+    cache.set("default", 2)
+
+    clock.now = 2
+    assert cache.get("short") is None
+    assert cache.get("default") == 2
+
+    clock.now = 6
+    assert cache.get("default", "gone") == "gone"
+    assert len(cache) == 0
+
+
+def test_ttl_cache_pop_and_clear():
+    """Test pop returns the value and removes it"""
+    cache = TTLCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+
+    cache.clear()
+    assert len(cache) == 0
@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from sekha_mcp.client import SekhaClient
+from sekha_mcp.testing import FakeController
 
 
 @pytest.fixture
@@ -166,6 +167,25 @@ async def test_client_get_context_success(client):
         assert result["data"]["label"] == "Test Conversation"
 
 
+@pytest.mark.asyncio
+async def test_client_get_context_window_payload(client):
+    """Test window parameters are included only when provided"""
+    with patch("httpx.AsyncClient.post", new=AsyncMock()) as mock_post:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True, "data": {"messages": []}}
+        mock_response.raise_for_status = lambda: None
+        mock_post.return_value = mock_response
+
+        await client.get_context("conv-123", tail=5, since="2024-01-01T00:00:00+00:00")
+
+        assert mock_post.call_args[1]["json"] == {
+            "conversation_id": "conv-123",
+            "tail": 5,
+            "since": "2024-01-01T00:00:00+00:00",
+        }
+
+
 @pytest.mark.asyncio
 async def test_client_prune_memory_with_threshold(client):
     """Test memory pruning with threshold"""
@@ -343,3 +363,20 @@ async def test_client_get_stats_success(client):
 
         assert result["success"] is True
         assert result["data"]["total_conversations"] == 100
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_connection_pool():
+    """Test one pool serves every request until the transport changes or it is closed"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    pool = client.http()
+    await client.get_stats()
+    await client.search_memory("q")
+    assert client.http() is pool
+
+    client.transport = httpx.ASGITransport(app=controller)
+    assert client.http() is not pool
+
+    await client.aclose()
+    assert client.http().is_closed is False
@@ -0,0 +1,216 @@
+"""Tests for the local cold storage tier"""
+
+import asyncio
+import json
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.cold_storage import ColdStore, window_context
+from sekha_mcp.disk_cache import DiskCache
+from sekha_mcp.testing import FakeController
+from sekha_mcp.tools.memory_export import memory_export_tool
+from sekha_mcp.tools.memory_prune_apply import memory_prune_apply_tool
+
+
+def _conversation(conv_id: str, count: int = 3) -> dict:
+    return {
+        "conversation_id": conv_id,
+        "label": f"Conversation {conv_id}",
+        "folder": "/old",
+        "status": "active",
+        "messages": [
+            {
+                "role": "user",
+                "content": f"message {i}",
+                "timestamp": f"2024-01-0{i + 1}T00:00:00Z",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    cold = ColdStore(tmp_path / "cold")
+    yield cold
+    cold.close()
+
+
+def test_offload_reads_single_records_back(store):
+    """Test records are packed into one segment and read back by offset"""
+    segment = store.offload([_conversation("a"), _conversation("b", 5)])
+
+    assert [p.stem for p in store.segments.iterdir()] == [segment]
+    assert len(store) == 2 and "b" in store and "c" not in store
+    assert store.get("b")["messages"][4]["content"] == "message 4"
+    assert store.get("c") is None
+    assert store.offload([]) is None
+
+
+def test_segments_are_content_addressed_and_collected(store):
+    """Test identical batches share a segment and unreferenced segments are deleted"""
+    first = store.offload([_conversation("a")])
+    assert store.offload([_conversation("a")]) == first
+
+    second = store.offload([_conversation("a", 4), _conversation("b")])
+    assert {p.stem for p in store.segments.iterdir()} == {second}
+    assert len(store.get("a")["messages"]) == 4
+
+    assert store.remove("a") is True
+    assert store.remove("a") is False
+    assert list(store.segments.iterdir())
+    store.remove("b")
+    assert not list(store.segments.iterdir())
+
+
+def test_index_persists_and_rejects_unknown_versions(tmp_path):
+    cold = ColdStore(tmp_path)
+    cold.offload([_conversation("a")])
+    cold.close()
+
+    reopened = ColdStore(tmp_path)
+    assert reopened.get("a")["label"] == "Conversation a"
+    reopened._db.execute("PRAGMA user_version=99")
+    reopened.close()
+    with pytest.raises(ValueError):
+        ColdStore(tmp_path)
+
+
+def test_unreadable_segment_returns_none(store):
+    segment = store.offload([_conversation("a")])
+    (store.segments / f"{segment}.seg").write_bytes(b"garbage")
+    assert store.get("a") is None
+
+
+def test_window_context_matches_controller_windowing():
+    record = _conversation("a", 5)
+    assert [m["content"] for m in window_context(record, tail=2)["messages"]] == [
+        "message 3",
+        "message 4",
+    ]
+    window = window_context(record, offset=1, limit=2)
+    assert (window["offset"], window["total_messages"], len(window["messages"])) == (1, 5, 2)
+
+    ranged = window_context(record, since="2024-01-02T00:00:00Z", until="2024-01-03T00:00:00")
+    assert [m["content"] for m in ranged["messages"]] == ["message 1", "message 2"]
+    assert ranged["total_messages"] == 2
+
+
+async def test_client_offloads_and_rehydrates(tmp_path):
+    """Test offloaded conversations leave the controller but stay readable"""
+    controller = FakeController()
+    cold = ColdStore(tmp_path)
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller), cold=cold)
+    ids = []
+    for i in range(3):
+        stored = await client.store_conversation(
+            {"label": f"old {i}", "folder": "/x", "messages": [{"role": "user", "content": "hi"}]}
+        )
+        ids.append(stored["data"]["conversation_id"])
+
+    outcomes = await client.offload_conversations([ids[0], ids[1], "missing"])
+    assert [o["success"] for o in outcomes] == [True, True, False]
+    assert ids[0] not in controller.conversations and ids[2] in controller.conversations
+    assert len({p.name for p in cold.segments.iterdir()}) == 1
+
+    context = await client.get_context(ids[0], tail=1)
+    assert context["data"]["label"] == "old 0"
+    assert context["data"]["storage_tier"] == "cold"
+    assert controller.request_counts["memory_get_context"] == 3
+
+    # Offloading again is a no-op
+    assert (await client.offload_conversations([ids[0]]))[0]["success"]
+
+    deleted = await client.delete_conversation(ids[0])
+    assert deleted["data"]["storage_tier"] == "cold"
+    assert ids[0] not in cold
+    cold.close()
+
+
+async def test_offload_archives_the_current_upstream_copy(tmp_path):
+    """Test a stale prefetched or disk-cached context is never what gets archived"""
+    controller = FakeController()
+    cold = ColdStore(tmp_path / "cold")
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=1 << 20)
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller), cache=cache, cold=cold)
+    client.prefetch.top_n = 1
+    stored = await client.store_conversation(
+        {"label": "x", "folder": "/x", "messages": [{"role": "user", "content": "hi"}]}
+    )
+    conv_id = stored["data"]["conversation_id"]
+    await client.get_context(conv_id)
+    client.prefetch.schedule([{"conversation_id": conv_id, "similarity": 1.0}])
+    await asyncio.sleep(0.01)
+
+    # Another host appends without invalidating this host's caches
+    controller.conversations[conv_id]["messages"].append({"role": "user", "content": "newer"})
+    assert (await client.offload_conversations([conv_id]))[0]["success"]
+
+    assert [m["content"] for m in cold.get(conv_id)["messages"]] == ["hi", "newer"]
+    cache.close()
+    cold.close()
+
+
+async def test_failed_upstream_delete_keeps_conversation_hot(tmp_path):
+    controller = FakeController()
+    cold = ColdStore(tmp_path)
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller), cold=cold)
+    stored = await client.store_conversation(
+        {"label": "x", "folder": "/x", "messages": [{"role": "user", "content": "hi"}]}
+    )
+    conv_id = stored["data"]["conversation_id"]
+
+    with patch.object(client, "_delete", new=AsyncMock(side_effect=httpx.ConnectError("down"))):
+        outcome = (await client.offload_conversations([conv_id]))[0]
+
+    assert outcome == {"conversation_id": conv_id, "success": False, "error": "Error: down"}
+    assert conv_id not in cold and not list(cold.segments.iterdir())
+    cold.close()
+
+
+async def test_prune_apply_offload_and_export(tmp_path):
+    """Test the offload action end to end, then export from cold storage"""
+    controller = FakeController()
+    cold = ColdStore(tmp_path)
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller), cold=cold)
+    conv_id = controller.add_conversation({**_conversation("x"), "conversation_id": None})
+
+    with (
+        patch("sekha_mcp.tools.memory_prune_apply.sekha_client", client),
+        patch("sekha_mcp.tools.memory_export.sekha_client", client),
+        patch("sekha_mcp.tools.memory_prune_apply.notify_changed", new=AsyncMock()) as notify,
+    ):
+        result = await memory_prune_apply_tool({"action": "offload", "conversation_ids": [conv_id]})
+        exported = await memory_export_tool({"conversation_id": conv_id, "output_format": "json"})
+
+    assert "Offloaded 1 of 1" in result[0].text
+    notify.assert_awaited_once_with(conv_id, [])
+    assert conv_id not in controller.conversations
+    assert len(json.loads(exported[0].text)["messages"]) == 3
+    cold.close()
+
+
+async def test_prune_apply_offload_requires_cold_storage():
+    with patch("sekha_mcp.tools.memory_prune_apply.sekha_client.cold", None):
+        result = await memory_prune_apply_tool({"action": "offload", "conversation_ids": ["a"]})
+    assert "Cold storage is disabled" in result[0].text
+
+
+def test_open_cold_store(tmp_path, monkeypatch):
+    from sekha_mcp import cold_storage
+
+    monkeypatch.setattr(cold_storage.settings, "cold_storage_enabled", False)
+    assert cold_storage.open_cold_store() is None
+
+    monkeypatch.setattr(cold_storage.settings, "cold_storage_enabled", True)
+    monkeypatch.setattr(cold_storage.settings, "cold_storage_path", str(tmp_path))
+    opened = cold_storage.open_cold_store()
+    assert isinstance(opened, ColdStore)
+    opened.close()
+
+    with patch.object(cold_storage, "ColdStore", side_effect=sqlite3.Error("locked")):
+        assert cold_storage.open_cold_store() is None
@@ -0,0 +1,119 @@
+"""Tests for controller request/response compression"""
+
+import gzip
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from sekha_mcp import compression
+from sekha_mcp.client import SekhaClient, sekha_client
+from sekha_mcp.compression import choose_encoding, encode_body, stats
+from sekha_mcp.testing import FakeController
+from sekha_mcp.timing import timed_call
+from sekha_mcp.tools.memory_stats import memory_stats_tool
+
+
+def _messages(count: int) -> list[dict]:
+    return [
+        {"role": "user", "content": f"message {i} " + "lorem ipsum " * 20} for i in range(count)
+    ]
+
+
+def test_encode_body_respects_switch_and_threshold():
+    payload = {"messages": _messages(50)}
+    with patch.object(compression.settings, "compression_enabled", False):
+        assert encode_body(payload) is None
+
+    with (
+        patch.object(compression.settings, "compression_enabled", True),
+        patch.object(compression.settings, "compression_encoding", "gzip"),
+    ):
+        assert encode_body({"label": "tiny"}) is None
+        body, encoding = encode_body(payload)
+
+    assert encoding == "gzip"
+    assert gzip.decompress(body).startswith(b'{"messages":')
+    assert stats.requests_compressed == 1
+    assert stats.request_wire_bytes < stats.request_bytes / 5
+    assert stats.saved_bytes == stats.request_bytes - stats.request_wire_bytes
+
+
+def test_choose_encoding_falls_back_to_gzip():
+    assert choose_encoding("auto") in compression.ENCODERS
+    assert choose_encoding("gzip") == "gzip"
+    assert choose_encoding("lz4") == "gzip"
+    assert "gzip" in compression.ACCEPT_ENCODING
+
+    compression.rejected.add("gzip")
+    assert choose_encoding("lz4") is None
+
+
+async def test_round_trip_against_fake_controller_saves_bytes():
+    """Test compressed stores and gzipped contexts decode and are counted"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+
+    with (
+        patch.object(compression.settings, "compression_enabled", True),
+        patch.object(compression.settings, "compression_min_bytes", 1024),
+    ):
+        stored = await client.store_conversation(
+            {"label": "Big", "folder": "/big", "messages": _messages(100)}
+        )
+        conv_id = stored["data"]["conversation_id"]
+        context = await client.get_context(conv_id)
+
+    assert len(context["data"]["messages"]) == 100
+    assert controller.conversations[conv_id]["messages"][99]["content"].startswith("message 99")
+
+    summary = stats.summary()
+    assert summary["requests_compressed"] == 1
+    assert summary["responses"] == 2
+    assert summary["response_wire_bytes"] < summary["response_bytes"]
+    assert summary["saved_bytes"] > 0
+
+
+async def test_fake_controller_rejects_unknown_encoding():
+    controller = FakeController()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=controller)) as client:
+        response = await client.post(
+            "http://fake/mcp/tools/memory_store",
+            content=b"x",
+            headers={"Content-Encoding": "lz4"},
+        )
+    assert response.status_code == 415
+
+
+async def test_rejected_encoding_is_resent_plain_and_not_used_again():
+    """Test a 415 retries uncompressed and auto moves on to the next encoding"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    encoders = {"zstd": lambda b: b"zstd:" + b, **compression.ENCODERS}
+
+    with (
+        patch.object(compression, "ENCODERS", encoders),
+        patch.object(compression.settings, "compression_enabled", True),
+        patch.object(compression.settings, "compression_min_bytes", 1024),
+        timed_call("memory_store") as timer,
+    ):
+        for i in range(2):
+            stored = await client.store_conversation(
+                {"label": f"Big {i}", "folder": "/big", "messages": _messages(100)}
+            )
+            assert stored["success"]
+        assert compression.rejected == {"zstd"}
+        assert choose_encoding("auto") == "gzip"
+
+    assert timer.retries == 1
+    # zstd rejected, resent plain, then gzip straight away
+    assert controller.request_counts["memory_store"] == 3
+    assert len(controller.conversations) == 2
+
+
+async def test_memory_stats_reports_savings():
+    stats.responses = 1
+    stats.response_bytes, stats.response_wire_bytes = 4096, 1024
+    response = {"success": True, "data": {"total_conversations": 1}}
+    with patch.object(sekha_client, "get_stats", new=AsyncMock(return_value=response)):
+        result = await memory_stats_tool({})
+    assert "Transport compression saved 3.0 KiB of 4.0 KiB (75%)" in result[0].text
@@ -0,0 +1,43 @@
+"""Tests for bounded-concurrency helpers"""
+
+import asyncio
+
+import pytest
+
+from sekha_mcp.concurrency import gather_bounded
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_in_flight_calls():
+    """Test no more than `limit` calls run at once and order is preserved"""
+    in_flight = 0
+    peak = 0
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return item * 2
+
+    results = await gather_bounded(work, range(10), limit=3)
+
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_returns_exceptions_in_place():
+    """Test a failing item does not cancel the others"""
+
+    async def work(item: int) -> int:
+        if item == 1:
+            raise RuntimeError("boom")
+        return item
+
+    results = await gather_bounded(work, [0, 1, 2], limit=2)
+
+    assert results[0] == 0
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == 2
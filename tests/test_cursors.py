@@ -0,0 +1,37 @@
+"""Tests for pagination cursors"""
+
+import pytest
+
+from sekha_mcp.cursors import CursorStore, decode_cursor, encode_cursor
+
+
+def test_encode_decode_round_trip():
+    """Test opaque cursors round-trip their state"""
+    state = {"conversation_id": "conv-1", "offset": 20, "limit": 10}
+
+    token = encode_cursor(state)
+
+    assert "=" not in token
+    assert decode_cursor(token) == state
+
+
+@pytest.mark.parametrize("token", ["not a cursor!", "bm90LWpzb24", "WzEsMl0"])
+def test_decode_rejects_malformed_tokens(token):
+    """Test malformed, non-JSON and non-object cursors are rejected"""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token)
+
+
+def test_cursor_store_round_trip_and_bounds():
+    """Test the store returns copies and stays bounded"""
+    store = CursorStore(maxsize=2, ttl=60)
+    first = store.put({"offset": 10})
+    store.get(first)["offset"] = 99
+
+    assert store.get(first) == {"offset": 10}
+
+    store.put({"offset": 20})
+    store.put({"offset": 30})
+    assert len(store) == 2
+    with pytest.raises(ValueError, match="Unknown or expired cursor"):
+        store.get(first)
@@ -0,0 +1,197 @@
+"""Tests for the persistent SQLite read-through cache"""
+
+import secrets
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sekha_mcp import disk_cache
+from sekha_mcp.client import SEARCH_GENERATION, SekhaClient
+from sekha_mcp.disk_cache import SCHEMA_VERSION, DiskCache, open_disk_cache
+from sekha_mcp.timing import timed_call
+
+CONV_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=1024 * 1024, clock=clock)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_uses_wal_and_compression(cache):
+    """Test values survive a round trip and are stored compressed"""
+    value = {"success": True, "data": {"messages": [{"content": "héllo " * 500}]}}
+    cache.set("k", value, ttl=60)
+
+    assert cache.get("k") == value
+    assert cache.get("missing") is None
+    assert cache._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert cache.size() < 500
+
+
+def test_entries_shared_between_connections(tmp_path):
+    """Test a second process-level connection sees entries written by the first"""
+    path = tmp_path / "shared.sqlite3"
+    writer = DiskCache(path, max_bytes=1024 * 1024)
+    reader = DiskCache(path, max_bytes=1024 * 1024)
+    writer.set("k", [1, 2, 3], ttl=60)
+
+    assert reader.get("k") == [1, 2, 3]
+    writer.close()
+    reader.close()
+
+
+def test_ttl_expiry(cache, clock):
+    """Test expired entries are misses and get removed"""
+    cache.set("k", "v", ttl=10)
+    clock.now += 9
+    assert cache.get("k") == "v"
+    clock.now += 2
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_generation_and_tag_invalidation(cache):
+    """Test bumping a generation and invalidating a tag both turn entries into misses"""
+    generation = cache.generation("search")
+    cache.set("search", ["hit"], ttl=60, generation=generation)
+    cache.set("context", {"id": CONV_ID}, ttl=60, tag=CONV_ID)
+
+    cache.bump("search")
+    assert cache.generation("search") == generation + 1
+    assert cache.get("search", cache.generation("search")) is None
+
+    assert cache.invalidate_tag(CONV_ID) == 1
+    assert cache.get("context") is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path, clock):
+    """Test eviction removes expired entries first, then the oldest accessed"""
+    cache = DiskCache(tmp_path / "small.sqlite3", max_bytes=600, clock=clock)
+    for i in range(6):
+        clock.now += 100
+        cache.set(f"k{i}", secrets.token_hex(100), ttl=10_000)
+    cache.set("short", "gone", ttl=1)
+    clock.now += 100
+    assert cache.get("k0") is not None  # refreshes k0's access time
+
+    assert cache.evict() > 1
+    assert cache.size() <= 600
+    assert cache.get("short") is None
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    cache.close()
+
+
+def test_schema_version_mismatch_clears(tmp_path):
+    """Test a database written with another schema version starts empty"""
+    path = tmp_path / "old.sqlite3"
+    cache = DiskCache(path, max_bytes=1024 * 1024)
+    cache.set("k", "v", ttl=60)
+    cache._db.execute(f"PRAGMA user_version={SCHEMA_VERSION + 1}")
+    cache.close()
+
+    reopened = DiskCache(path, max_bytes=1024 * 1024)
+    assert reopened.get("k") is None
+    reopened.close()
+
+
+def test_open_disk_cache_respects_settings(tmp_path):
+    """Test the cache is only opened when enabled, and failures disable it"""
+    with patch.object(disk_cache.settings, "disk_cache_enabled", False):
+        assert open_disk_cache() is None
+
+    with (
+        patch.object(disk_cache.settings, "disk_cache_enabled", True),
+        patch.object(disk_cache.settings, "disk_cache_path", str(tmp_path / "c.sqlite3")),
+    ):
+        opened = open_disk_cache()
+        assert isinstance(opened, DiskCache)
+        opened.close()
+
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    with (
+        patch.object(disk_cache.settings, "disk_cache_enabled", True),
+        patch.object(disk_cache.settings, "disk_cache_path", str(blocker / "c.sqlite3")),
+    ):
+        assert open_disk_cache() is None
+
+
+async def test_client_reads_through_and_invalidates(cache):
+    """Test the client serves repeat reads from disk and invalidates on writes"""
+    client = SekhaClient(cache=cache)
+    context = {"success": True, "data": {"conversation_id": CONV_ID, "messages": []}}
+    search = {"success": True, "data": {"results": []}}
+
+    async def fake_post(path, payload):
+        return context if path.endswith("get_context") else search
+
+    post = AsyncMock(side_effect=fake_post)
+    with patch.object(client, "_post", post):
+        with timed_call("memory_get_context") as timer:
+            assert await client.get_context(CONV_ID) == context
+            assert await client.get_context(CONV_ID) == context
+        assert timer.cache == ["miss", "hit"]
+
+        await client.search_memory("q")
+        await client.search_memory("q")
+        assert post.await_count == 2
+
+        post.side_effect = None
+        post.return_value = {"success": True}
+        await client.update_conversation(CONV_ID, label="New")
+        assert cache.generation(SEARCH_GENERATION) == 1
+
+        post.side_effect = fake_post
+        await client.get_context(CONV_ID)
+        await client.search_memory("q")
+        assert post.await_count == 5
+
+        post.side_effect = None
+        await client.store_conversation({"label": "x"})
+        assert cache.generation(SEARCH_GENERATION) == 2
+
+
+async def test_client_skips_failures_and_survives_cache_errors(cache):
+    """Test failed responses are not cached and a broken cache falls back to the controller"""
+    client = SekhaClient(cache=cache)
+    post = AsyncMock(return_value={"success": False, "error": "not found"})
+    with patch.object(client, "_post", post):
+        await client.get_context(CONV_ID)
+        await client.get_context(CONV_ID)
+        assert post.await_count == 2
+
+        cache.close()
+        post.return_value = {"success": True, "data": {}}
+        assert await client.get_context(CONV_ID) == {"success": True, "data": {}}
+        await client.update_conversation(CONV_ID, label="x")
+
+
+async def test_cache_is_namespaced_by_controller_and_api_key(cache):
+    """Test processes on other controllers or tenants never share cached responses"""
+    context = {"success": True, "data": {"conversation_id": CONV_ID, "messages": []}}
+    post = AsyncMock(return_value=context)
+    clients = [SekhaClient(cache=cache) for _ in range(3)]
+    clients[1].base_url = "http://other-controller:8080"
+    clients[2].api_key = "another-tenant-key"
+    for client in clients:
+        with patch.object(client, "_post", post):
+            await client.get_context(CONV_ID)
+            await client.get_context(CONV_ID)
+    assert post.await_count == 3
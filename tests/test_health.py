@@ -1,10 +1,12 @@
 """Health check tests for Sekha MCP Server"""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from sekha_mcp.health import HealthStatus, check_controller_health
+from sekha_mcp.health import HealthMonitor, HealthStatus, check_controller_health
 
 
 @pytest.mark.asyncio
@@ -45,3 +47,108 @@ def test_health_status_model():
     assert health.status == "healthy"
     assert health.controller_reachable is True
     assert health.controller_url == "http://localhost:8080"
+
+
+def _transport(outcomes: list):
+    """MockTransport answering /health with the given status codes or exceptions"""
+    calls = iter(outcomes)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(calls)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"status": "healthy"})
+
+    return httpx.MockTransport(handler)
+
+
+async def test_monitor_tracks_failures_and_latency():
+    """Test probes update consecutive failures, last success and percentiles"""
+    monitor = HealthMonitor(interval=60, timeout=1, transport=_transport([200, 503, 200]))
+    monitor.samples.extend([(0.010, True), (0.030, True), (5.0, False)])
+
+    healthy = await monitor.probe()
+    assert healthy.status == "healthy" and healthy.consecutive_failures == 0
+    assert healthy.last_success is not None
+    assert healthy.p99_latency_ms == 30.0
+
+    degraded = await monitor.probe()
+    assert degraded.status == "degraded"
+    assert degraded.consecutive_failures == 1
+    assert degraded.last_success == healthy.last_success
+
+    recovered = await monitor.probe()
+    assert recovered.consecutive_failures == 0
+    assert recovered.p50_latency_ms is not None
+    await monitor.stop()
+
+
+async def test_running_monitor_serves_cached_status_and_fails_fast():
+    failures = [httpx.ConnectError("refused")] * 10
+    monitor = HealthMonitor(interval=0, timeout=1, transport=_transport(failures))
+    with patch("sekha_mcp.health.health_monitor", monitor):
+        monitor.start()
+        monitor.start()
+        while monitor.consecutive_failures < 3:
+            await asyncio.sleep(0)
+        monitor.interval = 60
+
+        health = await check_controller_health()
+        assert health is monitor.status
+        assert health.status == "unhealthy"
+        assert health.p50_latency_ms is None
+        assert monitor.unavailable
+
+        await monitor.stop()
+        assert not monitor.running and not monitor.unavailable
+
+
+async def test_search_skips_controller_while_monitor_reports_down():
+    from sekha_mcp.lexical import LexicalIndex
+    from sekha_mcp.tools.memory_search import memory_search_tool
+
+    index = LexicalIndex()
+    index.add("c1", label="Deploy notes", folder="/ops", texts=["kubernetes rollout"])
+    with (
+        patch("sekha_mcp.client.sekha_client.index", index),
+        patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as search,
+        patch.object(HealthMonitor, "unavailable", new=True),
+    ):
+        result = await memory_search_tool({"query": "kubernetes"})
+
+    search.assert_not_awaited()
+    assert "Controller unavailable" in result[0].text
+    assert "Deploy notes" in result[0].text
+
+
+async def test_stats_report_monitor_health():
+    from sekha_mcp.tools.memory_stats import memory_stats_tool
+
+    monitor = HealthMonitor(interval=60, timeout=1, transport=_transport([500, 200]))
+    stats = {"success": True, "data": {"total_conversations": 1}}
+    texts = []
+    for _ in range(2):
+        await monitor.probe()
+        with (
+            patch("sekha_mcp.tools.memory_stats.health_monitor", monitor),
+            patch.object(HealthMonitor, "running", new=True),
+            patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock(return_value=stats)),
+        ):
+            texts.append((await memory_stats_tool({}))[0].text)
+    await monitor.stop()
+
+    # No successful probe yet: no latencies to report
+    assert "🩺 Controller degraded, 1 failed probes in a row\n" in texts[0]
+    assert "None" not in texts[0]
+    assert "🩺 Controller healthy: p50 " in texts[1] and "None" not in texts[1]
+
+
+async def test_monitor_probes_over_the_shared_pool():
+    """Test probes without a dedicated transport reuse the client's connection pool"""
+    shared = httpx.AsyncClient(transport=_transport([200]))
+    monitor = HealthMonitor(interval=60, timeout=1)
+    with patch("sekha_mcp.health.sekha_client.http", return_value=shared):
+        assert (await monitor.probe()).status == "healthy"
+    await monitor.stop()
+    assert not shared.is_closed
+    await shared.aclose()
@@ -0,0 +1,173 @@
+"""Tests for the negative cache and Bloom filter of conversation ids"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.known_ids import BloomFilter, KnownIds
+from sekha_mcp.testing import ErrorInjection, FakeController
+from sekha_mcp.timing import timed_call
+from sekha_mcp.tools.memory_stats import memory_stats_tool
+
+
+def _conversation(label: str) -> dict:
+    return {"label": label, "folder": "/", "messages": [{"role": "user", "content": "hi"}]}
+
+
+def _client(controller: FakeController) -> SekhaClient:
+    return SekhaClient(transport=httpx.ASGITransport(app=controller))
+
+
+def _lister(*pages, error: Exception | None = None):
+    async def list_ids():
+        for page in pages:
+            yield page
+        if error is not None:
+            raise error
+
+    return list_ids
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    ids = [str(uuid.UUID(int=i)) for i in range(1000)]
+    for conv_id in ids:
+        bloom.add(conv_id)
+
+    assert all(conv_id in bloom for conv_id in ids)
+    assert len(bloom) == 1000
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(2000))
+    assert false_positives < 80
+
+
+async def test_negative_cache_expires_and_clears_on_store():
+    now = [0.0]
+    known = KnownIds(
+        None,
+        not_found_ttl=30,
+        max_entries=8,
+        error_rate=0.01,
+        refresh_interval=300,
+        clock=lambda: now[0],
+    )
+    known.not_found("gone")
+    assert known.rejects("gone") and not known.rejects("other")
+
+    now[0] = 31
+    assert not known.rejects("gone")
+
+    known.not_found("gone")
+    known.add("gone")
+    assert not known.rejects("gone")
+    assert known.rejected == 1
+
+    disabled = KnownIds(None, not_found_ttl=0, max_entries=8, error_rate=0.01, refresh_interval=1)
+    disabled.not_found("gone")
+    assert not disabled.rejects("gone")
+
+
+async def test_filter_refresh_and_unsupported_listing():
+    request = httpx.Request("GET", "http://controller/api/v1/conversations/ids")
+    known = KnownIds(
+        _lister(["a", "b"], ["c"]),
+        not_found_ttl=30,
+        max_entries=8,
+        error_rate=0.01,
+        refresh_interval=300,
+    )
+
+    # The first check starts a background build and does not wait for it
+    assert not known.rejects("zzz")
+    await asyncio.sleep(0)
+    assert known.filter is not None and len(known.filter) == 3
+    assert known.rejects("zzz") and not known.rejects("c")
+    known.add("zzz")
+    assert not known.rejects("zzz")
+
+    # A transient listing failure keeps the previous filter
+    known.list_ids = _lister(error=httpx.ConnectError("down"))
+    assert not await known.refresh()
+    assert known.filter is not None and not known.unsupported
+
+    known.list_ids = _lister(
+        error=httpx.HTTPStatusError("", request=request, response=httpx.Response(404))
+    )
+    assert not await known.refresh()
+    assert known.unsupported and known.filter is None
+    assert not known.rejects("zzz-2")
+
+
+async def test_client_rejects_missing_ids_locally():
+    """Test a 404 is remembered, so the repeat lookup never reaches the controller"""
+    controller = FakeController()
+    client = _client(controller)
+    missing = str(uuid.uuid4())
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            await client.get_context(missing)
+        assert excinfo.value.response.status_code == 404
+    with pytest.raises(httpx.HTTPStatusError), timed_call("memory_update") as timer:
+        await client.update_conversation(missing, label="x")
+    assert timer.cache == ["negative"]
+    assert controller.request_counts["memory_get_context"] == 1
+    assert controller.request_counts["memory_update"] == 0
+
+    # Deleted ids are remembered too; storing an id again clears it
+    stored = await client.store_conversation(_conversation("Doomed"))
+    conv_id = stored["data"]["conversation_id"]
+    await client.delete_conversation(conv_id)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.delete_conversation(conv_id)
+    assert controller.request_counts["delete"] == 1
+
+    client.known.add(conv_id)
+    controller.add_conversation({"conversation_id": conv_id, "label": "Back"})
+    assert (await client.get_context(conv_id))["data"]["label"] == "Back"
+
+
+async def test_client_bloom_filter_from_controller_listing():
+    controller = FakeController()
+    existing = controller.generate_dataset(3, messages_per_conversation=1)
+    with patch("sekha_mcp.client.settings.known_ids_filter_enabled", True):
+        client = _client(controller)
+    await client.known.refresh()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_context(str(uuid.uuid4()))
+    assert controller.request_counts["memory_get_context"] == 0
+    assert (await client.get_context(existing[0]))["success"]
+
+    # Conversations stored through this client are known straight away
+    stored = await client.store_conversation(_conversation("New"))
+    assert (await client.get_context(stored["data"]["conversation_id"]))["success"]
+    assert controller.request_counts["list_ids"] == 1
+
+
+async def test_listing_errors_leave_lookups_to_the_controller():
+    controller = FakeController(endpoint_errors={"list_ids": ErrorInjection(rate=1.0)})
+    controller.generate_dataset(1, messages_per_conversation=1)
+    with patch("sekha_mcp.client.settings.known_ids_filter_enabled", True):
+        client = _client(controller)
+
+    assert not await client.known.refresh()
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_context(str(uuid.uuid4()))
+    assert controller.request_counts["memory_get_context"] == 1
+
+
+async def test_stats_report_local_rejections():
+    known = KnownIds(None, not_found_ttl=30, max_entries=8, error_rate=0.01, refresh_interval=1)
+    known.not_found("gone")
+    known.rejects("gone")
+    stats = {"success": True, "data": {"total_conversations": 1}}
+    with (
+        patch("sekha_mcp.client.sekha_client.known", known),
+        patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock(return_value=stats)),
+    ):
+        result = await memory_stats_tool({})
+    assert "🚫 1 unknown conversation ids rejected locally" in result[0].text
@@ -0,0 +1,167 @@
+"""Tests for the local BM25 lexical index and memory_search's lexical mode"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from sekha_mcp import lexical
+from sekha_mcp.client import SekhaClient, sekha_client
+from sekha_mcp.lexical import LexicalIndex, open_lexical_index, tokenize
+from sekha_mcp.tools.memory_search import memory_search_tool
+
+
+@pytest.fixture
+def index():
+    index = LexicalIndex()
+    index.add("a", "Kubernetes rollout", "/work/infra", ["Canary deploy with Argo rollouts"])
+    index.add("b", "Sourdough", "/home/cooking", ["Feed the starter before baking bread"])
+    index.add(
+        "c", "Deploy notes", "/work", ["We deploy on Fridays", "Rollback plan for the deploy"]
+    )
+    return index
+
+
+def test_tokenize_is_case_and_unicode_aware():
+    assert tokenize("Café, CAFÉ! deploy_v2") == ["café", "café", "deploy_v2"]
+
+
+def test_bm25_ranking_and_filters(index):
+    """Test only matching documents rank, label matches first, and label filters apply"""
+    hits, has_more = index.search("rollout deploy")
+    assert {hit["conversation_id"] for hit in hits} == {"a", "c"}
+    assert not has_more
+    assert all(0 < hit["similarity"] < 1 for hit in hits)
+
+    hits, has_more = index.search("deploy", limit=1)
+    assert has_more and hits[0]["label"] == "Deploy notes"
+
+    hits, _ = index.search("deploy rollout", filter_labels=["Kubernetes rollout"])
+    assert [hit["conversation_id"] for hit in hits] == ["a"]
+
+    assert index.search("nothing matches") == ([], False)
+    assert LexicalIndex().search("deploy") == ([], False)
+
+
+def test_reindex_replaces_document_and_compacts(index):
+    """Test re-adding a conversation tombstones its old postings"""
+    assert not index.add(
+        "b", "Sourdough", "/home/cooking", ["Feed the starter before baking bread"]
+    )
+    assert index.add("b", "Sourdough", "/home/cooking", ["Now about deploy pipelines"])
+    assert len(index) == 3 and len(index.docs) == 4
+    assert index.search("starter") == ([], False)
+
+    index.compact()
+    assert len(index.docs) == 3
+    assert {hit["conversation_id"] for hit in index.search("deploy")[0]} == {"a", "b", "c"}
+
+
+def test_update_metadata_forces_reindex(index):
+    index.update_metadata("b", label="Bread", folder="/kitchen")
+    hit = index.search("sourdough")[0][0]
+    assert (hit["label"], hit["folder"]) == ("Bread", "/kitchen")
+    assert index.add("b", "Bread", "/kitchen", ["Feed the starter before baking bread"])
+    index.update_metadata("missing", label="x")
+
+
+def test_save_and_load_round_trip(tmp_path, index):
+    """Test the index persists compactly and reloads with identical results"""
+    path = tmp_path / "idx" / "lexical.json.z"
+    index.path = path
+    index.add("a", "Kubernetes rollout", "/work/infra", ["Blue green"])
+    index.save()
+    assert not index.dirty
+
+    loaded = LexicalIndex.load(path)
+    assert len(loaded) == 3
+    assert loaded.search("deploy rollout") == index.search("deploy rollout")
+
+    path.write_bytes(b"not an index")
+    assert len(LexicalIndex.load(path)) == 0
+    assert len(LexicalIndex.load(tmp_path / "missing")) == 0
+
+
+def test_maybe_save_is_throttled(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical.json.z")
+    index.add("a", "One", "/", ["text"])
+    index.maybe_save()
+    assert index.path.exists() and not index.dirty
+
+    index.add("b", "Two", "/", ["more"])
+    index.maybe_save()
+    assert index.dirty
+
+
+def test_open_lexical_index_respects_settings(tmp_path):
+    with patch.object(lexical.settings, "lexical_index_enabled", False):
+        assert open_lexical_index() is None
+    with (
+        patch.object(lexical.settings, "lexical_index_enabled", True),
+        patch.object(lexical.settings, "lexical_index_path", str(tmp_path / "i.json.z")),
+    ):
+        assert isinstance(open_lexical_index(), LexicalIndex)
+
+
+async def test_client_indexes_stored_and_fetched_conversations():
+    """Test memory_store payloads and full contexts feed the index, windows do not"""
+    client = SekhaClient(index=LexicalIndex())
+    stored = {"label": "Rust borrow checker", "folder": "/dev", "messages": [{"content": "x"}]}
+    context = {
+        "conversation_id": "ctx",
+        "label": "Tokio runtime",
+        "folder": "/dev",
+        "messages": [{"role": "user", "content": "async executors"}],
+    }
+
+    post = AsyncMock(return_value={"success": True, "data": {"conversation_id": "new"}})
+    with patch.object(client, "_post", post):
+        await client.store_conversation(stored)
+        post.return_value = {"success": True, "data": context}
+        await client.get_context("ctx", tail=1)
+        assert len(client.index) == 1
+        await client.get_context("ctx")
+        post.return_value = {"success": True}
+        await client.update_conversation("new", label="Ownership")
+
+    assert [hit["conversation_id"] for hit in client.index.search("executors")[0]] == ["ctx"]
+    assert client.index.search("borrow")[0][0]["label"] == "Ownership"
+
+
+async def test_memory_search_lexical_mode_and_fallback(index):
+    """Test mode='lexical' skips the controller and outages degrade to the index"""
+    search = AsyncMock(side_effect=httpx.ConnectError("refused"))
+    with (
+        patch.object(sekha_client, "index", index),
+        patch.object(sekha_client, "search_memory", new=search),
+    ):
+        result = await memory_search_tool({"query": "deploy", "mode": "lexical", "limit": 1})
+        assert "Deploy notes" in result[0].text
+        assert "Continue with cursor" in result[0].text
+        search.assert_not_awaited()
+
+        result = await memory_search_tool({"query": "sourdough", "output_format": "json"})
+        payload = json.loads(result[0].text)
+        assert payload["degraded"] is True and payload["mode"] == "lexical"
+        assert payload["results"][0]["conversation_id"] == "b"
+
+        result = await memory_search_tool({"query": "sourdough"})
+        assert result[0].text.startswith("⚠️ Controller unavailable")
+
+    # An enabled but still empty index is a fallback too, not a reason to re-raise
+    with (
+        patch.object(sekha_client, "index", LexicalIndex()),
+        patch.object(sekha_client, "search_memory", new=search),
+    ):
+        result = await memory_search_tool({"query": "deploy"})
+        assert result[0].text.startswith("⚠️ Controller unavailable")
+
+    with (
+        patch.object(sekha_client, "index", None),
+        patch.object(sekha_client, "search_memory", new=search),
+    ):
+        result = await memory_search_tool({"query": "deploy"})
+        assert result[0].text.startswith("❌ Error")
+        result = await memory_search_tool({"query": "deploy", "mode": "lexical"})
+        assert "Lexical search is disabled" in result[0].text
@@ -0,0 +1,225 @@
+"""Tests for memory_import and the import CLI subcommand"""
+
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.main import run_import
+from sekha_mcp.testing import FakeController
+from sekha_mcp.timing import timed_call
+from sekha_mcp.tools import memory_import
+from sekha_mcp.tools.memory_import import (
+    _save_checkpoint,
+    import_conversations,
+    iter_records,
+    memory_import_tool,
+)
+
+
+def _record(i: int) -> dict:
+    """A conversation in memory_export's JSON format"""
+    return {
+        "conversation_id": f"00000000-0000-0000-0000-{i:012d}",
+        "label": f"Restored {i}",
+        "folder": "/restored",
+        "status": "active",
+        "importance_score": 4.0,
+        "created_at": "2024-01-01T00:00:00Z",
+        "exported_at": "2024-06-01T00:00:00Z",
+        "messages": [
+            {"role": "user", "content": f"question {i}", "timestamp": "2024-01-01T00:00:00Z"},
+            {"role": "assistant", "content": f"answer {i}"},
+        ],
+    }
+
+
+def _write_ndjson(path, records) -> str:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def controller():
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    with (
+        patch.object(memory_import, "sekha_client", client),
+        patch.object(memory_import, "RETRY_BASE_DELAY", 0),
+    ):
+        yield controller
+
+
+def test_iter_records_formats(tmp_path, monkeypatch):
+    """Test NDJSON, chunked JSON arrays and pretty-printed documents all stream"""
+    ndjson = tmp_path / "a.ndjson"
+    ndjson.write_text('{"a": 1}\n\nnot json\n{"a": 2}', encoding="utf-8")
+    numbered = list(iter_records(ndjson))
+    assert [n for n, _ in numbered] == [1, 2, 3]
+    assert isinstance(numbered[1][1], ValueError) and numbered[2][1] == {"a": 2}
+
+    monkeypatch.setattr(memory_import, "READ_CHUNK", 7)
+    array = tmp_path / "b.json"
+    array.write_text(json.dumps([_record(i) for i in range(5)], indent=2), encoding="utf-8")
+    assert [v["label"] for _, v in iter_records(array)] == [f"Restored {i}" for i in range(5)]
+
+    pretty = tmp_path / "c.json"
+    pretty.write_text(json.dumps(_record(1), indent=2), encoding="utf-8")
+    assert [v["label"] for _, v in iter_records(pretty)] == ["Restored 1"]
+
+    stream = tmp_path / "e.json"
+    stream.write_text("\n".join(json.dumps(_record(i), indent=2) for i in range(3)))
+    with patch.object(memory_import, "READ_CHUNK", 64):
+        assert [v["label"] for _, v in iter_records(stream)] == [f"Restored {i}" for i in range(3)]
+
+    broken = tmp_path / "d.json"
+    broken.write_text('[{"a": 1}, {"a": ', encoding="utf-8")
+    with pytest.raises(ValueError, match="Malformed JSON array"):
+        list(iter_records(broken))
+
+
+def test_ndjson_with_long_lines_streams_line_by_line(tmp_path):
+    """Test a first record longer than a read chunk does not change the format"""
+    long = {**_record(0), "messages": [{"role": "user", "content": "x" * 200_000}]}
+    records = [long, _record(1)]
+    unnamed = _write_ndjson(tmp_path / "export.txt", records)
+    assert [v["label"] for _, v in iter_records(unnamed)] == ["Restored 0", "Restored 1"]
+
+    # By extension, even a malformed first line is just one bad record
+    named = tmp_path / "export.jsonl"
+    named.write_text('{"label": \n' + json.dumps(_record(1)) + "\n", encoding="utf-8")
+    values = [v for _, v in iter_records(named)]
+    assert isinstance(values[0], ValueError) and values[1]["label"] == "Restored 1"
+
+
+async def test_import_stores_records_and_resumes(controller, tmp_path):
+    """Test a full import, then a rerun that resumes past every finished record"""
+    records = [_record(i) for i in range(25)]
+    records[3] = {**records[3], "folder": "no-leading-slash"}
+    path = _write_ndjson(tmp_path / "export.ndjson", records)
+    progress = AsyncMock()
+
+    with patch.object(memory_import, "PROGRESS_EVERY", 10):
+        summary = await import_conversations(path, concurrency=4, progress=progress)
+
+    assert (summary.stored, summary.invalid, summary.failed) == (24, 1, 0)
+    assert summary.errors[0].startswith("#4: folder:")
+    assert progress.await_count == 2
+    assert len(controller.conversations) == 24
+    checkpoint = json.loads((tmp_path / "export.ndjson.checkpoint.json").read_text())
+    assert checkpoint["completed"] == 25
+
+    again = await import_conversations(path)
+    assert (again.resumed_from, again.stored) == (25, 0)
+    assert len(controller.conversations) == 24
+
+    fresh = await import_conversations(path, resume=False)
+    assert fresh.stored == 24
+
+
+async def test_import_resumes_from_interrupted_checkpoint(controller, tmp_path):
+    path = _write_ndjson(tmp_path / "export.ndjson", [_record(i) for i in range(10)])
+    checkpoint = tmp_path / "state" / "cp.json"
+    _save_checkpoint(checkpoint, memory_import._fingerprint(tmp_path / "export.ndjson"), 6)
+
+    summary = await import_conversations(path, checkpoint=str(checkpoint))
+    assert (summary.resumed_from, summary.stored) == (6, 4)
+    assert sorted(c["label"] for c in controller.conversations.values()) == [
+        f"Restored {i}" for i in range(6, 10)
+    ]
+
+    # A checkpoint for an older version of the file is ignored
+    os.utime(path, ns=(0, 0))
+    rerun = await import_conversations(path, checkpoint=str(checkpoint))
+    assert (rerun.resumed_from, rerun.stored) == (0, 10)
+
+
+async def test_transient_failures_are_retried(tmp_path):
+    """Test retries on transport errors and 5xx, but not on client errors"""
+    path = _write_ndjson(tmp_path / "export.ndjson", [_record(i) for i in range(3)])
+    request = httpx.Request("POST", "http://controller/store")
+
+    def status(code: int) -> httpx.HTTPStatusError:
+        return httpx.HTTPStatusError("", request=request, response=httpx.Response(code))
+
+    calls = {
+        "Restored 0": [httpx.ConnectError("refused"), status(503), {"success": True}],
+        "Restored 1": [status(400)],
+        "Restored 2": [httpx.ReadTimeout("slow")] * memory_import.MAX_ATTEMPTS,
+    }
+
+    async def store(conversation, idempotency_key=None):
+        assert idempotency_key
+        outcome = calls[conversation["label"]].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with (
+        patch.object(memory_import, "RETRY_BASE_DELAY", 0),
+        patch("sekha_mcp.client.sekha_client.store_conversation", new=store),
+        timed_call("memory_import") as timer,
+    ):
+        summary = await import_conversations(path, concurrency=1)
+
+    assert (summary.stored, summary.failed) == (1, 2)
+    assert timer.retries == 2 + memory_import.MAX_ATTEMPTS - 1
+    assert summary.errors == ["#2: HTTP 400", "#3: ReadTimeout: slow"]
+
+
+async def test_import_tool_outputs(controller, tmp_path):
+    path = _write_ndjson(tmp_path / "export.ndjson", [_record(1), _record(2)])
+
+    text = await memory_import_tool({"path": path})
+    assert "📥 Imported 2 conversations" in text[0].text
+
+    data = json.loads((await memory_import_tool({"path": path, "output_format": "json"}))[0].text)
+    assert (data["resumed_from"], data["stored"]) == (2, 0)
+
+    missing = await memory_import_tool({"path": str(tmp_path / "nope.ndjson")})
+    assert "Validation error: Import file not found" in missing[0].text
+
+
+def test_cli_import(controller, tmp_path, capsys):
+    path = _write_ndjson(tmp_path / "export.ndjson", [_record(1), {"label": "bad"}])
+
+    assert run_import([path, "--concurrency", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "Imported 1 conversation " in output
+    assert "1 invalid records skipped" in output
+
+    assert run_import([str(tmp_path / "missing.ndjson")]) == 2
+
+    with patch.object(memory_import, "_store_with_retries", new=AsyncMock(return_value="HTTP 400")):
+        assert run_import([path, "--no-resume"]) == 1
+
+
+def test_console_script_dispatches_subcommands(controller, tmp_path):
+    """Test the pyproject console script runs imports and otherwise serves"""
+    script = re.search(r'^sekha-mcp = "(.+)"$', Path("pyproject.toml").read_text(), re.M)
+    module, _, attr = script.group(1).partition(":")
+    entry = getattr(importlib.import_module(module), attr)
+    path = _write_ndjson(tmp_path / "export.ndjson", [_record(1)])
+
+    assert entry(["import", path]) == 0
+    assert controller.conversations
+    with patch("sekha_mcp.main.main", new=AsyncMock()) as serve:
+        assert entry([]) == 0
+    serve.assert_awaited_once()
+
+    # A real process, as the installed script would run it
+    process = subprocess.run(
+        [sys.executable, "-m", "sekha_mcp.main", "import", str(tmp_path / "missing.ndjson")],
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 2
+    assert "Import failed: Import file not found" in process.stderr
@@ -0,0 +1,117 @@
+"""Tests for memory_prune pagination and the memory_prune_apply tool"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sekha_mcp.tools.memory_prune import memory_prune_tool
+from sekha_mcp.tools.memory_prune_apply import memory_prune_apply_tool
+
+
+def _suggestion(i: int) -> dict:
+    return {
+        "conversation_id": f"id-{i}",
+        "label": f"Old {i}",
+        "age_days": 90,
+        "importance_score": 1,
+        "reason": "old",
+    }
+
+
+async def test_prune_pages_with_cursor():
+    """Test a cursor returned by memory_prune continues from the next page"""
+    with patch("sekha_mcp.client.sekha_client.prune_memory", new=AsyncMock()) as mock_prune:
+        mock_prune.return_value = {
+            "success": True,
+            "data": {"suggestions": [_suggestion(0), _suggestion(1)], "has_more": True},
+        }
+        first = json.loads(
+            (await memory_prune_tool({"threshold_days": 60, "limit": 2, "output_format": "json"}))[
+                0
+            ].text
+        )
+        assert first["has_more"] and first["cursor"]
+
+        mock_prune.return_value = {"success": True, "data": {"suggestions": [_suggestion(2)]}}
+        second = await memory_prune_tool({"cursor": first["cursor"]})
+
+    assert mock_prune.await_args.kwargs == {
+        "threshold_days": 60,
+        "importance_threshold": None,
+        "offset": 2,
+        "limit": 2,
+    }
+    assert "Old 2" in second[0].text
+
+
+async def test_prune_unknown_cursor():
+    result = await memory_prune_tool({"cursor": "nope"})
+    assert "cursor" in result[0].text.lower()
+
+
+async def test_apply_archives_ids_and_reports_failures():
+    """Test archiving by id dedupes ids and lists failures"""
+
+    async def update(conv_id, **fields):
+        assert fields == {"status": "archived"}
+        if conv_id == "bad":
+            return {"success": False, "error": "Conversation not found"}
+        return {"success": True, "data": {}}
+
+    with (
+        patch(
+            "sekha_mcp.client.sekha_client.update_conversation", new=AsyncMock(side_effect=update)
+        ) as mock_update,
+        patch("sekha_mcp.tools.memory_prune_apply.notify_changed", new=AsyncMock()) as notify,
+    ):
+        result = await memory_prune_apply_tool(
+            {"action": "archive", "conversation_ids": ["a", "b", "a", "bad"]}
+        )
+
+    assert mock_update.await_count == 3
+    assert notify.await_count == 2
+    assert "Archived 2 of 3" in result[0].text
+    assert "❌ bad: Conversation not found" in result[0].text
+
+
+async def test_apply_deletes_by_criteria_json():
+    """Test criteria-based pruning streams suggestions up to max_items"""
+
+    async def pages(threshold_days, importance_threshold):
+        yield [_suggestion(0), _suggestion(1)]
+        yield [_suggestion(2), _suggestion(3)]
+
+    with (
+        patch("sekha_mcp.client.sekha_client.iter_prune_pages", new=pages),
+        patch(
+            "sekha_mcp.client.sekha_client.delete_conversation",
+            new=AsyncMock(side_effect=[{"success": True}, {"success": True}, RuntimeError("x")]),
+        ),
+        patch("sekha_mcp.tools.memory_prune_apply.notify_changed", new=AsyncMock()),
+    ):
+        result = await memory_prune_apply_tool(
+            {"action": "delete", "threshold_days": 30, "max_items": 3, "output_format": "json"}
+        )
+
+    data = json.loads(result[0].text)
+    assert (data["action"], data["succeeded"], data["total"]) == ("delete", 2, 3)
+    assert [r["conversation_id"] for r in data["results"]] == ["id-0", "id-1", "id-2"]
+    assert data["results"][2] == {
+        "conversation_id": "id-2",
+        "success": False,
+        "error": "Error: x",
+    }
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"action": "archive"},
+        {"action": "archive", "conversation_ids": ["a"], "threshold_days": 30},
+        {"action": "shred", "conversation_ids": ["a"]},
+    ],
+)
+async def test_apply_validation_errors(arguments):
+    result = await memory_prune_apply_tool(arguments)
+    assert "Validation error" in result[0].text
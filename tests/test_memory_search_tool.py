@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from sekha_mcp.client import sekha_client
+from sekha_mcp.tools import memory_prune, memory_search
+from sekha_mcp.tools.memory_prune import memory_prune_tool
 from sekha_mcp.tools.memory_search import memory_search_tool
 
 
@@ -26,3 +28,48 @@ async def test_memory_search_tool_renders_results():
         }
         result = await memory_search_tool({"query": "x", "limit": 5})
         assert "found 1 relevant" in result[0].text.lower()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("module", "formatter", "call", "mock_name", "data"),
+    [
+        (
+            memory_search,
+            "_format_hit",
+            lambda: memory_search_tool({"query": "x"}),
+            "search_memory",
+            {"results": [{"conversation_id": f"id-{i}", "similarity": 0.5} for i in range(3)]},
+        ),
+        (
+            memory_prune,
+            "_format_suggestion",
+            lambda: memory_prune_tool({"threshold_days": 30}),
+            "prune_memory",
+            {"suggestions": [{"conversation_id": f"id-{i}"} for i in range(3)]},
+        ),
+    ],
+)
+async def test_progress_is_sent_as_each_block_is_formatted(
+    module, formatter, call, mock_name, data
+):
+    """Test the first item's notification goes out before later items are rendered"""
+    formatted = []
+    original = getattr(module, formatter)
+
+    def tracking(*args):
+        formatted.append(args[0])
+        return original(*args)
+
+    async def progress(done, total, message):
+        assert len(formatted) == done
+
+    with (
+        patch.object(
+            sekha_client, mock_name, new=AsyncMock(return_value={"success": True, "data": data})
+        ),
+        patch.object(module, formatter, side_effect=tracking),
+        patch.object(module, "report_progress", new=AsyncMock(side_effect=progress)) as sent,
+    ):
+        await call()
+    assert sent.await_count == 3
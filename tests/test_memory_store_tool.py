@@ -1,9 +1,12 @@
 # tests/test_memory_store_tool.py
+import json
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from sekha_mcp.client import sekha_client
+from sekha_mcp.client import SekhaClient, sekha_client
+from sekha_mcp.testing import FakeController
 from sekha_mcp.tools.memory_store import memory_store_tool
 
 
@@ -28,3 +31,112 @@ async def test_memory_store_tool_success():
         assert len(result) == 1
         assert "stored successfully" in result[0].text.lower()
         mock_store.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_memory_store_tool_append_mode():
+    with patch.object(sekha_client, "store_incremental", new=AsyncMock()) as mock_store:
+        mock_store.return_value = {
+            "success": True,
+            "data": {"conversation_id": "c1", "message_count": 5, "appended": 2, "mode": "append"},
+        }
+        args = {
+            "label": "Run",
+            "folder": "/agents",
+            "messages": [{"role": "user", "content": "hi"}],
+            "append": True,
+            "session_key": "run-1",
+        }
+        result = await memory_store_tool(args)
+        assert "Appended 2 new messages" in result[0].text
+        assert mock_store.await_args.kwargs == {"session_key": "run-1", "conversation_id": None}
+
+        mock_store.return_value["data"] |= {"mode": "full", "replaced": "c0"}
+        result = await memory_store_tool(args)
+        assert result[0].text.endswith("Messages: 5\nReplaces: c0")
+
+        mock_store.return_value["data"]["mode"] = "unchanged"
+        del mock_store.return_value["data"]["replaced"]
+        result = await memory_store_tool(args)
+        assert "No new messages" in result[0].text
+
+        result = await memory_store_tool({**args, "session_key": None})
+        assert "append requires conversation_id or session_key" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_store_tool_deduplicates_identical_content():
+    args = {
+        "label": "Retry me",
+        "folder": "/tests",
+        "messages": [{"role": "user", "content": "same transcript"}],
+    }
+    with patch.object(sekha_client, "store_conversation", new=AsyncMock()) as mock_store:
+        mock_store.return_value = {
+            "success": True,
+            "data": {"conversation_id": "orig", "message_count": 1},
+        }
+        await memory_store_tool(args)
+        key = mock_store.await_args.kwargs["idempotency_key"]
+
+        retried = {
+            **args,
+            "label": " Retry me ",
+            "folder": "/tests/",
+            "messages": [{"role": "user", "content": "same transcript\n", "metadata": {"x": 1}}],
+        }
+        result = await memory_store_tool({**retried, "output_format": "json"})
+        assert json.loads(result[0].text) == {
+            "conversation_id": "orig",
+            "message_count": 1,
+            "deduplicated": True,
+        }
+        result = await memory_store_tool(retried)
+        assert "already stored" in result[0].text and "orig" in result[0].text
+        mock_store.assert_awaited_once()
+
+        await memory_store_tool({**args, "label": "Different"})
+        assert mock_store.await_count == 2
+        assert mock_store.await_args.kwargs["idempotency_key"] != key
+
+
+@pytest.mark.asyncio
+async def test_dedup_forgets_deleted_conversations_and_tracks_importance():
+    """Test re-storing after a delete reaches the controller instead of the stale id"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    args = {
+        "label": "Keep me",
+        "folder": "/tests",
+        "messages": [{"role": "user", "content": "transcript"}],
+        "output_format": "json",
+    }
+    with patch("sekha_mcp.tools.memory_store.sekha_client", client):
+        first = json.loads((await memory_store_tool(args))[0].text)
+        await client.delete_conversation(first["conversation_id"])
+        second = json.loads((await memory_store_tool(args))[0].text)
+        assert "deduplicated" not in second
+        assert list(controller.conversations) == [second["conversation_id"]]
+
+        # A 404 for the remembered id drops it as well
+        controller.conversations.clear()
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_context(second["conversation_id"])
+        assert "deduplicated" not in json.loads((await memory_store_tool(args))[0].text)
+
+        reweighted = json.loads((await memory_store_tool({**args, "importance_score": 9}))[0].text)
+        assert "deduplicated" not in reweighted
+    assert controller.request_counts["memory_store"] == 4
+
+
+@pytest.mark.asyncio
+async def test_store_conversation_sends_idempotency_header():
+    with patch("httpx.AsyncClient.post", new=AsyncMock()) as mock_post:
+        mock_post.return_value = httpx.Response(
+            200,
+            json={"success": True, "data": {"conversation_id": "c"}},
+            request=httpx.Request("POST", "http://test"),
+        )
+        await sekha_client.store_conversation({"label": "x"}, idempotency_key="abc")
+        assert mock_post.await_args.kwargs["headers"]["Idempotency-Key"] == "abc"
+        assert "Authorization" in mock_post.await_args.kwargs["headers"]
@@ -0,0 +1,87 @@
+"""Tests for token-budgeted packing"""
+
+import pytest
+
+from sekha_mcp.packing import (
+    MIN_PARTIAL_TOKENS,
+    TRUNCATION_MARKER,
+    estimate_tokens,
+    pack,
+    recency_ranks,
+    relevance_score,
+    truncate_to_tokens,
+)
+
+
+def test_estimate_tokens_ascii_and_unicode():
+    """Test token estimate counts UTF-8 bytes for non-ASCII text"""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    assert estimate_tokens("日本語の文章") > estimate_tokens("abcdef")
+
+
+def test_relevance_score_weights_signals():
+    """Test scores combine similarity, importance and recency"""
+    assert relevance_score() == 0.0
+    assert relevance_score(similarity=0.9) > relevance_score(similarity=0.5)
+    assert relevance_score(similarity=0.5, importance=10) > relevance_score(similarity=0.5)
+    assert relevance_score(recency=1.0) > relevance_score(recency=0.0)
+    assert relevance_score(similarity=5.0) == relevance_score(similarity=1.0)
+
+
+def test_recency_ranks():
+    """Test recency ranks run from oldest to newest"""
+    assert recency_ranks(0) == []
+    assert recency_ranks(1) == [1.0]
+    assert recency_ranks(3) == [0.0, 0.5, 1.0]
+
+
+def test_pack_everything_fits():
+    """Test packing keeps all blocks when the budget allows"""
+    blocks = ["first\n", "second\n", "third\n"]
+
+    result = pack(blocks, [0.1, 0.2, 0.3], max_tokens=1000)
+
+    assert result.text == "first\nsecond\nthird\n"
+    assert result.kept == 3
+    assert result.elided == 0
+
+
+def test_pack_elides_lowest_scores_in_order():
+    """Test low-scoring blocks are elided and the rest keep their order"""
+    blocks = [f"{i}: " + "x" * 200 + "\n" for i in range(6)]
+
+    result = pack(blocks, recency_ranks(6), max_tokens=200, noun="message")
+
+    assert result.tokens <= 200
+    assert result.elided > 0
+    assert "omitted to fit token budget" in result.text
+    assert result.text.index("4: ") < result.text.index("5: ")
+    assert "0: " not in result.text
+
+
+def test_pack_truncates_best_block_that_does_not_fit():
+    """Test the top-ranked oversized block is truncated rather than dropped"""
+    blocks = ["small\n", "y" * 4000]
+
+    result = pack(blocks, [0.1, 0.9], max_tokens=100)
+
+    assert result.truncated == 1
+    assert TRUNCATION_MARKER in result.text
+    assert result.tokens <= 100
+
+
+def test_pack_rejects_mismatched_scores():
+    """Test blocks and scores must align"""
+    with pytest.raises(ValueError):
+        pack(["a"], [], max_tokens=100)
+
+
+def test_truncate_to_tokens_keeps_trailing_newline():
+    """Test truncation keeps the block terminator and respects the budget"""
+    cut = truncate_to_tokens("z" * 1000 + "\n", MIN_PARTIAL_TOKENS)
+
+    assert cut.endswith(TRUNCATION_MARKER + "\n")
+    assert estimate_tokens(cut) <= MIN_PARTIAL_TOKENS
+    assert truncate_to_tokens("abc", 1) == ""
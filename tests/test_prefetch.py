@@ -0,0 +1,147 @@
+"""Tests for speculative prefetch of search hit contexts"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.prefetch import Prefetcher
+from sekha_mcp.testing import FakeController
+from sekha_mcp.timing import timed_call
+from sekha_mcp.tools.memory_search import memory_search_tool
+from sekha_mcp.tools.memory_stats import memory_stats_tool
+
+
+def _context(conv_id: str) -> dict:
+    return {"success": True, "data": {"conversation_id": conv_id, "messages": []}}
+
+
+def _prefetcher(fetch, **overrides) -> Prefetcher:
+    options = {"top_n": 2, "min_similarity": 0.5, "max_inflight": 2, "ttl": 60, "maxsize": 8}
+    return Prefetcher(fetch, **(options | overrides))
+
+
+async def test_schedule_respects_top_n_threshold_and_budget():
+    fetch = AsyncMock(side_effect=_context)
+    prefetcher = _prefetcher(fetch, top_n=3, max_inflight=1)
+    hits = [
+        {"conversation_id": "low", "similarity": 0.2},
+        {"conversation_id": "a", "similarity": 0.9},
+        {"conversation_id": "b", "similarity": 0.8},
+    ]
+
+    assert prefetcher.schedule(hits) == ["a"]
+    assert prefetcher.schedule(hits) == []
+    await asyncio.sleep(0.01)
+    assert prefetcher.schedule(hits) == ["b"]
+    await asyncio.sleep(0.01)
+    assert prefetcher.schedule(hits) == []
+    assert fetch.await_count == 2
+    assert not _prefetcher(fetch, top_n=0).schedule(hits)
+
+
+async def test_take_joins_inflight_fetch_and_tracks_hit_rates():
+    """Test a read during a prefetch waits for it instead of fetching again"""
+    gate = asyncio.Event()
+
+    async def slow_fetch(conv_id):
+        await gate.wait()
+        return _context(conv_id)
+
+    fetch = AsyncMock(side_effect=slow_fetch)
+    prefetcher = _prefetcher(fetch)
+    prefetcher.schedule([{"conversation_id": "a", "similarity": 0.9}, {"conversation_id": "b"}])
+    waiter = asyncio.create_task(prefetcher.take("a"))
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert (await waiter)["conversation_id"] == "a"
+    assert (await prefetcher.take("a"))["conversation_id"] == "a"
+    assert await prefetcher.take("other") is None
+    fetch.assert_awaited_once_with("a")
+    assert (prefetcher.issued, prefetcher.used, prefetcher.misses) == (1, 1, 1)
+    assert prefetcher.describe() == (
+        "1 of 1 prefetches used (100%), 1 of 2 context reads served (50%)"
+    )
+
+    prefetcher.reset()
+    assert (prefetcher.precision, prefetcher.coverage) == (0.0, 0.0)
+
+
+async def test_failures_and_writes_are_not_served():
+    fetch = AsyncMock(side_effect=[httpx.ConnectError("down"), {"success": False}])
+    prefetcher = _prefetcher(fetch)
+    prefetcher.schedule([{"conversation_id": "a", "similarity": 1}])
+    prefetcher.schedule([{"conversation_id": "b", "similarity": 1}])
+    assert await prefetcher.take("a") is None
+    assert await prefetcher.take("b") is None
+    assert prefetcher.failed == 2
+
+    gate = asyncio.Event()
+
+    async def slow_fetch(conv_id):
+        await gate.wait()
+        return _context(conv_id)
+
+    prefetcher.fetch = AsyncMock(side_effect=slow_fetch)
+    prefetcher.schedule([{"conversation_id": "c", "similarity": 1}])
+    await asyncio.sleep(0)
+    prefetcher.invalidate("c")
+    gate.set()
+    await asyncio.sleep(0.01)
+    assert "c" not in prefetcher.cache
+
+
+async def test_search_then_get_context_is_served_from_prefetch():
+    """Test the follow-up get_context after a search needs no controller request"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    client.prefetch.top_n = 1
+    client.prefetch.min_similarity = 0.0
+    stored = await client.store_conversation(
+        {
+            "label": "Kafka consumer lag",
+            "folder": "/ops",
+            "messages": [{"role": "user", "content": f"lag question {i}"} for i in range(4)],
+        }
+    )
+    conv_id = stored["data"]["conversation_id"]
+
+    with (
+        patch("sekha_mcp.tools.memory_search.sekha_client", client),
+        timed_call("memory_search") as search_timer,
+    ):
+        await memory_search_tool({"query": "kafka lag"})
+        await asyncio.sleep(0.01)
+    assert controller.request_counts["memory_get_context"] == 1
+    # The background fetch is not part of the search's slow-call record
+    assert [path for path, _ in search_timer.requests] == ["/mcp/tools/memory_search"]
+
+    with timed_call("memory_get_context") as timer:
+        context = await client.get_context(conv_id, tail=2)
+    assert [m["content"] for m in context["data"]["messages"]] == [
+        "lag question 2",
+        "lag question 3",
+    ]
+    assert context["data"]["total_messages"] == 4
+    assert timer.cache == ["prefetch"]
+    assert controller.request_counts["memory_get_context"] == 1
+
+    # A write drops the prefetched copy
+    await client.update_conversation(conv_id, label="Renamed")
+    assert (await client.get_context(conv_id))["data"]["label"] == "Renamed"
+    assert controller.request_counts["memory_get_context"] == 2
+
+
+async def test_stats_report_prefetch_hit_rates():
+    prefetcher = _prefetcher(AsyncMock(side_effect=_context))
+    prefetcher.schedule([{"conversation_id": "a", "similarity": 1}])
+    await prefetcher.take("a")
+    stats = {"success": True, "data": {"total_conversations": 1}}
+    with (
+        patch("sekha_mcp.client.sekha_client.prefetch", prefetcher),
+        patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock(return_value=stats)),
+    ):
+        result = await memory_stats_tool({})
+    assert "⚡ Prefetch: 1 of 1 prefetches used (100%)" in result[0].text
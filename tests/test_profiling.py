@@ -0,0 +1,85 @@
+"""Tests for the sampling profiler"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sekha_mcp.profiling import SamplingProfiler, install_signal_handler
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(100))
+
+
+def test_profiler_writes_collapsed_stacks(tmp_path):
+    """Test sampling the calling thread produces a collapsed-stack file"""
+    profiler = SamplingProfiler(tmp_path, interval=0.001, max_duration=5)
+
+    profiler.start()
+    assert profiler.running
+    _busy(0.1)
+    path = profiler.stop()
+
+    assert not profiler.running
+    assert path is not None and path.parent == tmp_path
+    lines = path.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("test_profiling:_busy" in line for line in lines)
+    assert ";" in stack
+
+
+def test_profiler_stops_after_duration(tmp_path):
+    """Test sampling is time-bounded and capped at max_duration"""
+    profiler = SamplingProfiler(tmp_path, interval=0.001, max_duration=0.05)
+
+    assert profiler.start(duration=10) == 0.05
+    time.sleep(0.2)
+
+    assert not profiler.running
+    assert profiler.last_output is not None and profiler.last_output.exists()
+    assert profiler.stop() == profiler.last_output
+
+
+def test_profiler_rejects_double_start_and_idle_stop(tmp_path):
+    """Test starting twice fails and stopping an idle profiler is a no-op"""
+    profiler = SamplingProfiler(tmp_path, interval=0.01, max_duration=5)
+    assert profiler.stop() is None
+
+    profiler.start(thread_id=threading.get_ident())
+    try:
+        with pytest.raises(RuntimeError):
+            profiler.start()
+    finally:
+        profiler.stop()
+
+
+def test_install_signal_handler_respects_setting():
+    """Test SIGUSR1 is only hooked when profiling is enabled"""
+    loop = MagicMock()
+
+    with patch("sekha_mcp.profiling.settings.profiling_enabled", False):
+        assert install_signal_handler(loop) is False
+    loop.add_signal_handler.assert_not_called()
+
+    with patch("sekha_mcp.profiling.settings.profiling_enabled", True):
+        assert install_signal_handler(loop) is True
+    loop.add_signal_handler.assert_called_once()
+
+
+def test_toggle_starts_and_stops(tmp_path):
+    """Test the signal handler alternates between starting and stopping"""
+    from sekha_mcp import profiling
+
+    profiler = SamplingProfiler(tmp_path, interval=0.001, max_duration=5)
+    with patch.object(profiling, "profiler", profiler):
+        profiling.toggle()
+        assert profiler.running
+        profiling.toggle()
+        assert not profiler.running
+        assert profiler.last_output is not None
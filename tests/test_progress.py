@@ -0,0 +1,54 @@
+"""Tests for MCP progress notifications"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from sekha_mcp.progress import report_progress
+
+
+def _set_request(progress_token):
+    session = SimpleNamespace(send_progress_notification=AsyncMock())
+    meta = SimpleNamespace(progressToken=progress_token)
+    ctx = SimpleNamespace(request_id=7, meta=meta, session=session)
+    return session, request_ctx.set(ctx)
+
+
+@pytest.mark.asyncio
+async def test_report_progress_outside_request_is_noop():
+    """Test progress reporting does nothing without a request context"""
+    await report_progress(1, 2, "ignored")
+
+
+@pytest.mark.asyncio
+async def test_report_progress_sends_notification():
+    """Test progress is sent with the client's progress token"""
+    session, token = _set_request("tok-1")
+    try:
+        await report_progress(1, 3, "first")
+    finally:
+        request_ctx.reset(token)
+
+    session.send_progress_notification.assert_awaited_once_with(
+        "tok-1", 1, total=3, message="first", related_request_id=7
+    )
+
+
+@pytest.mark.asyncio
+async def test_report_progress_without_token_or_with_failure():
+    """Test no token means no notification and send failures are swallowed"""
+    session, token = _set_request(None)
+    try:
+        await report_progress(1)
+    finally:
+        request_ctx.reset(token)
+    session.send_progress_notification.assert_not_awaited()
+
+    session, token = _set_request("tok-2")
+    session.send_progress_notification.side_effect = RuntimeError("closed")
+    try:
+        await report_progress(1)
+    finally:
+        request_ctx.reset(token)
@@ -0,0 +1,169 @@
+"""Tests for MCP conversation/folder resources and subscriptions"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from sekha_mcp import resources
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.resources import (
+    Subscriptions,
+    conversation_uri,
+    folder_uri,
+    notify_changed,
+    parse_uri,
+)
+from sekha_mcp.server import initialization_options, subscribe_resource, unsubscribe_resource
+from sekha_mcp.testing import FakeController
+from sekha_mcp.tools.memory_update import memory_update_tool
+from sekha_mcp.tools.memory_update_batch import memory_update_batch_tool
+
+CONV_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False) -> None:
+        self.send_resource_updated = AsyncMock(side_effect=Exception("closed") if fail else None)
+
+
+def test_uri_round_trip():
+    """Test conversation and folder URIs parse back to their keys"""
+    assert conversation_uri(CONV_ID) == f"sekha://conversation/{CONV_ID}"
+    assert folder_uri("/work/ai projects") == "sekha://folder/work/ai%20projects"
+    assert parse_uri(conversation_uri(CONV_ID)) == ("conversation", CONV_ID)
+    assert parse_uri(folder_uri("/work/ai projects")) == ("folder", "/work/ai projects")
+    assert parse_uri("sekha://folder/") == ("folder", "/")
+
+    for bad in ["sekha://conversation/", "https://example.com/x", "sekha://other/1"]:
+        with pytest.raises(ValueError):
+            parse_uri(bad)
+
+
+@pytest.mark.asyncio
+async def test_list_resources_from_folders():
+    """Test one resource is listed per controller folder"""
+    with patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock()) as mock_stats:
+        mock_stats.return_value = {"success": True, "data": {"folders": ["/work", "/personal"]}}
+        listed = await resources.list_resources()
+
+        mock_stats.return_value = {"success": False, "error": "Down"}
+        with pytest.raises(ValueError, match="Down"):
+            await resources.list_resources()
+
+    assert [str(r.uri) for r in listed] == ["sekha://folder/work", "sekha://folder/personal"]
+    assert listed[0].mimeType == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_read_resource_conversation_and_folder():
+    """Test reads are served from the controller as JSON"""
+    with (
+        patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get,
+        patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock()) as mock_stats,
+    ):
+        mock_get.return_value = {"success": True, "data": {"label": "Test", "messages": []}}
+        mock_stats.return_value = {"success": True, "data": {"total_conversations": 2}}
+
+        conversation = await resources.read_resource(conversation_uri(CONV_ID))
+        folder = await resources.read_resource(folder_uri("/work"))
+
+        mock_get.return_value = {"success": False, "error": "Not found"}
+        with pytest.raises(ValueError, match="Not found"):
+            await resources.read_resource(conversation_uri(CONV_ID))
+
+    mock_get.assert_any_call(CONV_ID)
+    mock_stats.assert_called_once_with(folder="/work")
+    assert json.loads(conversation[0].content)["label"] == "Test"
+    assert conversation[0].mime_type == "application/json"
+    assert json.loads(folder[0].content) == {"total_conversations": 2}
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_notify_and_drop_failed_sessions():
+    """Test subscribers are notified and failing sessions are dropped"""
+    subs = Subscriptions()
+    good, bad = FakeSession(), FakeSession(fail=True)
+    uri = conversation_uri(CONV_ID)
+
+    subs.subscribe(uri, good)
+    subs.subscribe(uri, bad)
+    assert await subs.notify([uri, folder_uri("/other")]) == 1
+
+    good.send_resource_updated.assert_awaited_once()
+    assert str(good.send_resource_updated.await_args.args[0]) == uri
+    assert uri in subs
+
+    subs.unsubscribe(uri, good)
+    subs.unsubscribe(uri, good)
+    assert uri not in subs
+    assert await subs.notify([uri]) == 0
+
+
+@pytest.mark.asyncio
+async def test_server_subscribe_handlers_and_capabilities():
+    """Test the server advertises subscriptions and tracks the calling session"""
+    assert initialization_options().capabilities.resources.subscribe is True
+
+    session = FakeSession()
+    token = request_ctx.set(SimpleNamespace(session=session))
+    try:
+        await subscribe_resource(conversation_uri(CONV_ID))
+        assert conversation_uri(CONV_ID) in resources.subscriptions
+        await unsubscribe_resource(conversation_uri(CONV_ID))
+        assert conversation_uri(CONV_ID) not in resources.subscriptions
+    finally:
+        request_ctx.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_update_notifies_conversation_and_folder_subscribers():
+    """Test a successful memory_update notifies the touched resources"""
+    session = FakeSession()
+    subs = Subscriptions()
+    subs.subscribe(conversation_uri(CONV_ID), session)
+    subs.subscribe(folder_uri("/inbox"), session)
+    subs.subscribe(folder_uri("/archive"), session)
+
+    with (
+        patch.object(resources, "subscriptions", subs),
+        patch("sekha_mcp.client.sekha_client.folder_of", return_value="/inbox"),
+        patch("sekha_mcp.client.sekha_client.update_conversation", new=AsyncMock()) as mock_upd,
+    ):
+        mock_upd.return_value = {"success": True, "data": {"updated_fields": ["folder"]}}
+        await memory_update_tool({"conversation_id": CONV_ID, "folder": "/archive"})
+
+        assert await notify_changed(None, [None]) == 0
+
+    notified = [str(call.args[0]) for call in session.send_resource_updated.await_args_list]
+    assert notified == [conversation_uri(CONV_ID), folder_uri("/inbox"), folder_uri("/archive")]
+
+
+@pytest.mark.asyncio
+async def test_updates_notify_the_folder_a_conversation_leaves():
+    """Test label-only and folder-moving updates reach the previous folder's subscribers"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    conv_id = controller.generate_dataset(1, messages_per_conversation=1)[0]
+    folder = controller.conversations[conv_id]["folder"]
+    session = FakeSession()
+    subs = Subscriptions()
+    subs.subscribe(folder_uri(folder), session)
+
+    with (
+        patch.object(resources, "subscriptions", subs),
+        patch.object(resources, "sekha_client", client),
+        patch("sekha_mcp.tools.memory_update.sekha_client", client),
+        patch("sekha_mcp.tools.memory_update_batch.sekha_client", client),
+    ):
+        await memory_update_tool({"conversation_id": conv_id, "label": "Renamed"})
+        await memory_update_batch_tool({"updates": [{"conversation_id": conv_id, "folder": "/x"}]})
+        await memory_update_tool({"conversation_id": conv_id, "importance_score": 9})
+
+    # The folder is looked up upstream because nothing local knows it
+    assert controller.request_counts["memory_get_context"] == 3
+    notified = [str(call.args[0]) for call in session.send_resource_updated.await_args_list]
+    assert notified == [folder_uri(folder), folder_uri(folder)]
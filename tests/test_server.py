@@ -12,7 +12,7 @@ async def test_list_tools_returns_all_tools():
     """Test that list_tools returns all 5 tools"""
     tools = await list_tools()
 
-    assert len(tools) == 7
+    assert len(tools) == 11
     tool_names = [tool.name for tool in tools]
     assert "memory_store" in tool_names
     assert "memory_search" in tool_names
@@ -21,6 +21,10 @@ async def test_list_tools_returns_all_tools():
     assert "memory_prune" in tool_names
     assert "memory_export" in tool_names
     assert "memory_stats" in tool_names
+    assert "memory_recall" in tool_names
+    assert "memory_update_batch" in tool_names
+    assert "memory_get_context_batch" in tool_names
+    assert "memory_prune_apply" in tool_names
 
 
 @pytest.mark.asyncio
@@ -46,7 +50,7 @@ async def test_call_tool_unknown_tool():
 
 @pytest.mark.asyncio
 async def test_call_tool_all_tools_routing():
-    """Test that all 7 tools are properly routed"""
+    """Test that all tools are properly routed"""
     test_cases = [
         (
             "memory_store",
@@ -62,6 +66,9 @@ async def test_call_tool_all_tools_routing():
         ("memory_prune", {"threshold_days": 30}),
         ("memory_export", {"conversation_id": "test-uuid", "format": "json"}),
         ("memory_stats", {"folder": "/work"}),
+        ("memory_recall", {"query": "test query", "top_k": 2}),
+        ("memory_update_batch", {"conversation_ids": ["test-uuid"], "folder": "/archive"}),
+        ("memory_get_context_batch", {"conversation_ids": ["test-uuid"], "tail": 5}),
     ]
 
     for tool_name, arguments in test_cases:
@@ -73,3 +80,24 @@ async def test_call_tool_all_tools_routing():
 
             assert len(result) == 1
             mock_tool.assert_called_once_with(arguments)
+
+
+@pytest.mark.asyncio
+async def test_admin_tools_only_when_enabled():
+    """Test memory_profile and memory_import are hidden and unroutable unless enabled"""
+    tools = await list_tools()
+    for name in ("memory_profile", "memory_import"):
+        assert name not in [tool.name for tool in tools]
+        with pytest.raises(ValueError):
+            await call_tool(name, {"path": "/etc/passwd"})
+
+    with (
+        patch("sekha_mcp.server.settings.admin_tools_enabled", True),
+        patch("sekha_mcp.server.memory_profile_tool", new_callable=AsyncMock) as mock_tool,
+    ):
+        mock_tool.return_value = [{"type": "text", "text": "ok"}]
+        tools = await list_tools()
+        result = await call_tool("memory_profile", {"action": "status"})
+
+    assert {"memory_profile", "memory_import"} <= {tool.name for tool in tools}
+    assert len(result) == 1
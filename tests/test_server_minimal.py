@@ -26,7 +26,7 @@ def test_app_is_mcp_server():
 
 
 def test_list_tools_registered():
-    """Test that list_tools returns all 7 tools"""
+    """Test that list_tools returns all tools"""
     # Get tools
     import asyncio
 
@@ -34,7 +34,7 @@ def test_list_tools_registered():
 
     tools = asyncio.run(list_tools())
 
-    assert len(tools) == 7
+    assert len(tools) == 11
     tool_names = {tool.name for tool in tools}
     assert tool_names == {
         "memory_store",
@@ -44,6 +44,10 @@ def test_list_tools_registered():
         "memory_prune",
         "memory_export",
         "memory_stats",
+        "memory_recall",
+        "memory_update_batch",
+        "memory_get_context_batch",
+        "memory_prune_apply",
     }
 
 
@@ -93,6 +97,9 @@ def test_server_tools_are_accessible():
     assert hasattr(tools, "memory_prune_tool")
     assert hasattr(tools, "memory_export_tool")
     assert hasattr(tools, "memory_stats_tool")
+    assert hasattr(tools, "memory_recall_tool")
+    assert hasattr(tools, "memory_update_batch_tool")
+    assert hasattr(tools, "memory_get_context_batch_tool")
 
     # Verify tool definitions exist
     assert hasattr(tools, "MEMORY_STORE_TOOL")
@@ -102,3 +109,6 @@ def test_server_tools_are_accessible():
     assert hasattr(tools, "MEMORY_PRUNE_TOOL")
     assert hasattr(tools, "MEMORY_EXPORT_TOOL")
     assert hasattr(tools, "MEMORY_STATS_TOOL")
+    assert hasattr(tools, "MEMORY_RECALL_TOOL")
+    assert hasattr(tools, "MEMORY_UPDATE_BATCH_TOOL")
+    assert hasattr(tools, "MEMORY_GET_CONTEXT_BATCH_TOOL")
@@ -0,0 +1,167 @@
+"""Tests for the stale-while-revalidate stats cache"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.stats_cache import StatsCache
+from sekha_mcp.testing import FakeController
+from sekha_mcp.timing import timed_call
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stats(total: int, folders: list[str] | None = None) -> dict:
+    return {"success": True, "data": {"total_conversations": total, "folders": folders or []}}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+async def test_fresh_stale_and_expired_reads(clock):
+    """Test fresh hits skip the controller, stale hits refresh in the background"""
+    fetch = AsyncMock(side_effect=[_stats(1), _stats(2), _stats(3)])
+    cache = StatsCache(fetch, ttl=10, max_stale=60, clock=clock)
+
+    with timed_call("memory_stats") as timer:
+        assert (await cache.get())["data"]["total_conversations"] == 1
+        clock.now = 5
+        assert (await cache.get())["data"]["total_conversations"] == 1
+
+        clock.now = 20
+        assert (await cache.get())["data"]["total_conversations"] == 1
+        await asyncio.sleep(0)
+        assert (await cache.get())["data"]["total_conversations"] == 2
+
+        clock.now = 100
+        assert (await cache.get())["data"]["total_conversations"] == 3
+    assert timer.cache == ["miss", "hit", "stale", "hit", "miss"]
+    assert fetch.await_count == 3
+
+
+async def test_concurrent_misses_share_one_fetch(clock):
+    gate = asyncio.Event()
+
+    async def slow_fetch(folder):
+        await gate.wait()
+        return _stats(7)
+
+    fetch = AsyncMock(side_effect=slow_fetch)
+    cache = StatsCache(fetch, ttl=10, max_stale=60, clock=clock)
+    waiters = [asyncio.create_task(cache.get("/work")) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    results = await asyncio.gather(*waiters)
+    assert {r["data"]["total_conversations"] for r in results} == {7}
+    fetch.assert_awaited_once_with("/work")
+
+
+async def test_failures_are_not_cached_and_background_errors_keep_old_value(clock):
+    fetch = AsyncMock(return_value={"success": False, "error": "boom"})
+    cache = StatsCache(fetch, ttl=10, max_stale=60, clock=clock)
+    assert not (await cache.get())["success"]
+    assert not (await cache.get())["success"]
+    assert fetch.await_count == 2
+
+    fetch.return_value = _stats(1)
+    await cache.get()
+    clock.now = 30
+    fetch.side_effect = httpx.ConnectError("down")
+    assert (await cache.get())["data"]["total_conversations"] == 1
+    await asyncio.sleep(0)
+    assert (await cache.get())["data"]["total_conversations"] == 1
+
+    clock.now = 100
+    with pytest.raises(httpx.ConnectError):
+        await cache.get()
+
+
+async def test_local_writes_adjust_and_mark_stale(clock):
+    fetch = AsyncMock(side_effect=[_stats(4, ["/a"]), _stats(2)])
+    cache = StatsCache(fetch, ttl=10, max_stale=60, clock=clock)
+    await cache.get()
+    await cache.get("/a")
+
+    cache.record_store("/b")
+    fetch.side_effect = None
+    fetch.return_value = _stats(99)
+    adjusted = await cache.get()
+    assert adjusted["data"] == {"total_conversations": 5, "folders": ["/a", "/b"]}
+    assert (await cache.get("/a"))["data"]["total_conversations"] == 2
+
+    # Any other write drops entries, so the very next read fetches
+    cache.invalidate()
+    with timed_call("memory_stats") as timer:
+        assert (await cache.get("/a"))["data"]["total_conversations"] == 99
+    assert timer.cache == ["miss"]
+
+
+async def test_fetch_begun_before_a_write_is_not_cached(clock):
+    gate = asyncio.Event()
+    totals = iter([1, 2])
+
+    async def slow_fetch(folder):
+        total = next(totals)
+        if total == 1:
+            await gate.wait()
+        return _stats(total)
+
+    cache = StatsCache(slow_fetch, ttl=10, max_stale=60, clock=clock)
+    before = asyncio.create_task(cache.get())
+    await asyncio.sleep(0.01)
+    cache.invalidate()
+    # Joining the pre-write fetch would wait on the gate forever
+    assert (await asyncio.wait_for(cache.get(), 1))["data"]["total_conversations"] == 2
+    gate.set()
+    assert (await before)["data"]["total_conversations"] == 1
+    assert (await cache.get())["data"]["total_conversations"] == 2
+
+
+async def test_zero_ttl_disables_caching():
+    fetch = AsyncMock(return_value=_stats(1))
+    cache = StatsCache(fetch, ttl=0, max_stale=0)
+    await cache.get()
+    await cache.get()
+    assert fetch.await_count == 2
+
+
+async def test_client_serves_stats_from_cache_until_a_write():
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+
+    assert (await client.get_stats())["data"]["total_conversations"] == 0
+    assert (await client.get_stats())["data"]["total_conversations"] == 0
+    assert controller.request_counts["stats"] == 1
+
+    await client.store_conversation(
+        {"label": "x", "folder": "/new", "messages": [{"role": "user", "content": "hi"}]}
+    )
+    stats = await client.get_stats()
+    assert stats["data"]["total_conversations"] == 1
+    assert "/new" in stats["data"]["folders"]
+
+    await asyncio.sleep(0.01)
+    assert controller.request_counts["stats"] == 2
+
+
+async def test_stats_read_after_update_sees_the_write():
+    """Test a folder move is visible to the first stats read after it"""
+    controller = FakeController()
+    client = SekhaClient(transport=httpx.ASGITransport(app=controller))
+    conv_id = controller.generate_dataset(1, messages_per_conversation=1)[0]
+
+    assert (await client.get_stats(folder="/moved"))["data"]["total_conversations"] == 0
+    await client.update_conversation(conv_id, folder="/moved")
+    assert (await client.get_stats(folder="/moved"))["data"]["total_conversations"] == 1
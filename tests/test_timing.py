@@ -0,0 +1,100 @@
+"""Tests for per-call phase timing and the slow-call log"""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.types import TextContent
+
+from sekha_mcp.client import SekhaClient
+from sekha_mcp.server import call_tool
+from sekha_mcp.timing import (
+    PhaseTimer,
+    log_if_slow,
+    phase,
+    record_cache,
+    record_request,
+    record_retry,
+    timed_call,
+)
+
+
+def test_helpers_are_noops_without_timer():
+    """Test recording outside a tool call does nothing"""
+    with phase("validate"):
+        pass
+    record_request("/x", 0.1)
+    record_cache("hit")
+    record_retry()
+
+
+def test_timed_call_collects_phases():
+    """Test phases, requests, cache outcomes and retries land on the current timer"""
+    with timed_call("memory_search") as timer:
+        with phase("validate"):
+            pass
+        with phase("render"):
+            pass
+        with phase("render"):
+            pass
+        record_request("/mcp/tools/memory_search", 0.25)
+        record_cache("miss")
+        record_retry()
+
+    record = timer.record(argument_bytes=10, response_bytes=20)
+
+    assert record["tool"] == "memory_search"
+    assert record["controller_ms"] == 250.0
+    assert record["controller_requests"] == [{"path": "/mcp/tools/memory_search", "ms": 250.0}]
+    assert record["cache"] == "miss"
+    assert record["retries"] == 1
+    assert record["validation_ms"] >= 0 and record["render_ms"] >= 0
+
+
+def test_log_if_slow_threshold(caplog):
+    """Test only calls over the threshold are logged, and 0 disables logging"""
+    timer = PhaseTimer("memory_stats", started=0.0)
+    result = [TextContent(type="text", text="héllo")]
+
+    with caplog.at_level(logging.WARNING, logger="sekha_mcp.slow_calls"):
+        assert log_if_slow(timer, 0, {}, result) is None
+        assert log_if_slow(PhaseTimer("fast"), 60_000, {}, result) is None
+        record = log_if_slow(timer, 1, {"folder": "/work"}, result)
+
+    assert record is not None
+    assert record["response_bytes"] == 6
+    assert record["argument_bytes"] == len('{"folder": "/work"}')
+    assert len(caplog.records) == 1
+    assert caplog.records[0].slow_call == record
+    assert "Slow tool call" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_client_records_controller_requests():
+    """Test client requests are timed on the current tool call"""
+    response = MagicMock()
+    response.json.return_value = {"success": True}
+    response.raise_for_status = lambda: None
+
+    with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=response)):
+        with timed_call("memory_stats") as timer:
+            await SekhaClient().get_stats()
+
+    assert [path for path, _ in timer.requests] == ["/api/v1/stats"]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_logs_slow_calls(caplog):
+    """Test the server emits one slow-call record with the tool's phase breakdown"""
+    with (
+        patch("sekha_mcp.server.settings.slow_call_threshold_ms", 0.001),
+        patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock()) as mock_stats,
+        caplog.at_level(logging.WARNING, logger="sekha_mcp.slow_calls"),
+    ):
+        mock_stats.return_value = {"success": True, "data": {"total_conversations": 1}}
+        await call_tool("memory_stats", {})
+
+    records = [r.slow_call for r in caplog.records if hasattr(r, "slow_call")]
+    assert len(records) == 1
+    assert records[0]["tool"] == "memory_stats"
+    assert records[0]["response_bytes"] > 0
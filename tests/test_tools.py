@@ -1,16 +1,22 @@
 """Unit tests for MCP tools"""
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from sekha_mcp.profiling import SamplingProfiler
 from sekha_mcp.tools.memory_export import memory_export_tool
 from sekha_mcp.tools.memory_get_context import memory_get_context_tool
+from sekha_mcp.tools.memory_get_context_batch import memory_get_context_batch_tool
+from sekha_mcp.tools.memory_profile import memory_profile_tool
 from sekha_mcp.tools.memory_prune import memory_prune_tool
+from sekha_mcp.tools.memory_recall import memory_recall_tool
 from sekha_mcp.tools.memory_search import memory_search_tool
 from sekha_mcp.tools.memory_stats import memory_stats_tool
 from sekha_mcp.tools.memory_store import memory_store_tool
 from sekha_mcp.tools.memory_update import memory_update_tool
+from sekha_mcp.tools.memory_update_batch import memory_update_batch_tool
 
 # ============================================
 # Memory Store Tests
@@ -102,6 +108,89 @@ async def test_memory_search_with_results():
         assert "0.95" in result[0].text
 
 
+@pytest.mark.asyncio
+async def test_memory_search_token_budget():
+    """Test a token budget replaces fixed excerpts with relevance-ranked packing"""
+    with patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search:
+        mock_search.return_value = {
+            "success": True,
+            "data": {
+                "results": [
+                    {
+                        "conversation_id": f"conv-{i}",
+                        "label": f"Result {i}",
+                        "folder": "/tests",
+                        "content": f"content {i} " + "w" * 400,
+                        "similarity": 0.9 - i * 0.1,
+                        "importance_score": 5,
+                        "created_at": f"2024-01-0{5 - i}T00:00:00Z",
+                    }
+                    for i in range(5)
+                ]
+            },
+        }
+
+        unbudgeted = await memory_search_tool({"query": "test"})
+        budgeted = await memory_search_tool({"query": "test", "max_tokens": 300})
+
+        assert "w" * 250 not in unbudgeted[0].text
+        assert "w" * 250 in budgeted[0].text
+        assert "Result 0" in budgeted[0].text
+        assert "Result 4" not in budgeted[0].text
+        assert "omitted to fit token budget" in budgeted[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_search_cursor_pagination_and_progress():
+    """Test full pages return a cursor that continues the same search"""
+    page = {
+        "success": True,
+        "data": {
+            "results": [
+                {"conversation_id": f"conv-{i}", "label": f"Hit {i}", "similarity": 0.5}
+                for i in range(2)
+            ]
+        },
+    }
+    with (
+        patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search,
+        patch("sekha_mcp.tools.memory_search.report_progress", new=AsyncMock()) as mock_progress,
+    ):
+        mock_search.return_value = page
+        first = await memory_search_tool({"query": "test", "limit": 2, "filter_labels": ["a"]})
+
+        assert mock_progress.await_count == 2
+        assert "1. **Hit 0**" in mock_progress.await_args_list[0].args[2]
+        cursor = first[0].text.rsplit("cursor: ", 1)[1].strip()
+
+        mock_search.return_value = {
+            "success": True,
+            "data": {"results": page["data"]["results"][:1], "has_more": False},
+        }
+        second = await memory_search_tool({"query": "test", "cursor": cursor})
+
+        mock_search.assert_called_with(query="test", limit=2, filter_labels=["a"], offset=2)
+        assert "3. **Hit 0**" in second[0].text
+        assert "cursor" not in second[0].text
+
+        wrong_query = await memory_search_tool({"query": "other", "cursor": cursor})
+        unknown = await memory_search_tool({"query": "test", "cursor": "expired"})
+
+        assert "Cursor does not belong to this query" in wrong_query[0].text
+        assert "Unknown or expired cursor" in unknown[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_search_limit_matches_schema():
+    """Test the model limit agrees with the advertised schema maximum"""
+    from sekha_mcp.tools.memory_search import MEMORY_SEARCH_TOOL
+
+    maximum = MEMORY_SEARCH_TOOL.inputSchema["properties"]["limit"]["maximum"]
+    result = await memory_search_tool({"query": "test", "limit": maximum + 1})
+
+    assert "Validation error" in result[0].text
+
+
 @pytest.mark.asyncio
 async def test_memory_search_no_results():
     """Test memory search with no results"""
@@ -226,6 +315,143 @@ async def test_memory_get_context_not_found():
         assert "not found" in result[0].text
 
 
+def _long_conversation(count: int) -> dict:
+    """Controller response with a full (unwindowed) message history"""
+    return {
+        "success": True,
+        "data": {
+            "label": "Long Conversation",
+            "folder": "/tests",
+            "status": "active",
+            "messages": [
+                {
+                    "role": "user" if i % 2 == 0 else "assistant",
+                    "content": f"message {i}",
+                    "timestamp": f"2024-01-01T00:{i:02d}:00Z",
+                }
+                for i in range(count)
+            ],
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_window_pushed_down():
+    """Test window parameters are forwarded to the controller"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(10)
+
+        arguments = {
+            "conversation_id": "test-uuid",
+            "offset": 2,
+            "limit": 3,
+            "since": "2024-01-01T00:00:00Z",
+        }
+        await memory_get_context_tool(arguments)
+
+        mock_get.assert_called_once_with(
+            "test-uuid", offset=2, limit=3, since="2024-01-01T00:00:00+00:00"
+        )
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_window_applied_locally_with_cursor():
+    """Test windowing falls back locally and the cursor continues the window"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(5)
+
+        first = await memory_get_context_tool({"conversation_id": "test-uuid", "limit": 2})
+        text = first[0].text
+        assert "2 of 5" in text
+        assert "1. **USER**: message 0" in text
+        assert "message 2" not in text
+        assert "3 more messages" in text
+
+        cursor = text.rsplit("cursor: ", 1)[1].strip()
+        second = await memory_get_context_tool({"conversation_id": "test-uuid", "cursor": cursor})
+
+        assert "3. **USER**: message 2" in second[0].text
+        assert "message 4" not in second[0].text
+        assert mock_get.call_args.kwargs == {"offset": 2, "limit": 2}
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_tail_and_time_range():
+    """Test tail and time range windows on a full history"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(6)
+
+        tail = await memory_get_context_tool({"conversation_id": "test-uuid", "tail": 2})
+        assert "5. **USER**: message 4" in tail[0].text
+        assert "message 3" not in tail[0].text
+        assert "cursor" not in tail[0].text
+
+        ranged = await memory_get_context_tool(
+            {
+                "conversation_id": "test-uuid",
+                "since": "2024-01-01T00:01:00",
+                "until": "2024-01-01T00:02:00Z",
+            }
+        )
+        assert "2 of 2" in ranged[0].text
+        assert "message 0" not in ranged[0].text
+        assert "message 3" not in ranged[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_controller_window():
+    """Test a controller-windowed slice is numbered from its offset"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = {
+            "success": True,
+            "data": {
+                "label": "Windowed",
+                "folder": "/tests",
+                "status": "active",
+                "total_messages": 100,
+                "offset": 40,
+                "messages": [{"role": "user", "content": "forty"}],
+            },
+        }
+
+        result = await memory_get_context_tool(
+            {"conversation_id": "test-uuid", "offset": 40, "limit": 1}
+        )
+
+        assert "41. **USER**: forty" in result[0].text
+        assert "59 more messages" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_token_budget():
+    """Test a token budget keeps the most recent messages and marks elisions"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(50)
+
+        result = await memory_get_context_tool({"conversation_id": "test-uuid", "max_tokens": 150})
+
+        text = result[0].text
+        assert "message 49" in text
+        assert "message 0\n" not in text
+        assert "messages omitted to fit token budget" in text
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_invalid_window():
+    """Test contradictory or foreign window parameters are rejected"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        combined = await memory_get_context_tool(
+            {"conversation_id": "test-uuid", "tail": 2, "offset": 1}
+        )
+        bad_cursor = await memory_get_context_tool(
+            {"conversation_id": "test-uuid", "cursor": "not-a-cursor"}
+        )
+
+        mock_get.assert_not_called()
+        assert "Validation error" in combined[0].text
+        assert "Invalid cursor" in bad_cursor[0].text
+
+
 # ============================================
 # Memory Prune Tests
 # ============================================
@@ -530,3 +756,420 @@ async def test_memory_stats_api_failure():
 
         assert len(result) == 1
         assert "❌" in result[0].text
+
+
+# ============================================
+# Memory Recall Tests
+# ============================================
+
+
+def _search_hits(count: int) -> dict:
+    return {
+        "success": True,
+        "data": {
+            "results": [
+                {
+                    "conversation_id": f"conv-{i}",
+                    "label": f"Hit {i}",
+                    "folder": "/tests",
+                    "content": "excerpt",
+                    "similarity": 0.9 - i * 0.1,
+                }
+                for i in range(count)
+            ]
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_memory_recall_fetches_top_contexts():
+    """Test recall searches once and fetches each top hit's context"""
+    with (
+        patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search,
+        patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get,
+    ):
+        mock_search.return_value = _search_hits(3)
+        mock_get.side_effect = lambda conv_id, **window: {
+            "success": True,
+            "data": {"messages": [{"role": "user", "content": f"body of {conv_id}"}]},
+        }
+
+        result = await memory_recall_tool({"query": "test", "top_k": 2, "tail": 5})
+
+        mock_search.assert_called_once_with(query="test", limit=2, filter_labels=None)
+        assert mock_get.call_count == 2
+        mock_get.assert_any_call("conv-1", tail=5)
+        text = result[0].text
+        assert "Recalled 2 conversations" in text
+        assert "body of conv-0" in text
+        assert "body of conv-1" in text
+        assert "conv-2" not in text
+
+
+@pytest.mark.asyncio
+async def test_memory_recall_partial_failure_and_budget():
+    """Test a failed fetch is reported inline and packing elides messages only"""
+    with (
+        patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search,
+        patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get,
+    ):
+        mock_search.return_value = _search_hits(3)
+
+        async def get_context(conv_id, **window):
+            if conv_id == "conv-1":
+                raise RuntimeError("controller timeout")
+            if conv_id == "conv-2":
+                return {"success": False, "error": "Not found"}
+            return {
+                "success": True,
+                "data": {
+                    "importance_score": 5,
+                    "messages": [
+                        {"role": "user", "content": f"message {i} " + "x" * 100} for i in range(20)
+                    ],
+                },
+            }
+
+        mock_get.side_effect = get_context
+
+        result = await memory_recall_tool({"query": "test", "max_tokens": 300})
+
+        text = result[0].text
+        assert "Context unavailable: controller timeout" in text
+        assert "Context unavailable: Not found" in text
+        assert "Hit 0" in text
+        assert "message 19" in text
+        assert "omitted to fit token budget" in text
+
+
+@pytest.mark.asyncio
+async def test_memory_recall_no_results_and_errors():
+    """Test recall handles empty search results, search failures and bad input"""
+    with patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search:
+        mock_search.return_value = {"success": True, "data": {"results": []}}
+        empty = await memory_recall_tool({"query": "test"})
+
+        mock_search.return_value = {"success": False, "error": "Index offline"}
+        failed = await memory_recall_tool({"query": "test"})
+
+        mock_search.side_effect = Exception("Connection refused")
+        errored = await memory_recall_tool({"query": "test"})
+
+    invalid = await memory_recall_tool({"query": "   "})
+
+    assert "No matching conversations" in empty[0].text
+    assert "Index offline" in failed[0].text
+    assert "❌ Error" in errored[0].text
+    assert "Validation error" in invalid[0].text
+
+
+# ============================================
+# Batch Tool Tests
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_memory_update_batch_per_item_results():
+    """Test batch update reports each item, including validation and API failures"""
+    with patch("sekha_mcp.client.sekha_client.update_conversation", new=AsyncMock()) as mock_update:
+
+        async def update(conversation_id, **fields):
+            if conversation_id == "missing":
+                return {"success": False, "error": "Not found"}
+            if conversation_id == "same":
+                return {"success": True, "data": {"updated_fields": []}}
+            if conversation_id == "broken":
+                raise Exception("Connection reset")
+            return {"success": True, "data": {"updated_fields": ["folder"]}}
+
+        mock_update.side_effect = update
+
+        result = await memory_update_batch_tool(
+            {
+                "conversation_ids": ["conv-1", "missing", "same", "broken"],
+                "folder": "/archive",
+                "updates": [{"conversation_id": "conv-2"}],
+            }
+        )
+
+        text = result[0].text
+        assert "Updated 2 of 5 conversations" in text
+        assert "✅ conv-1: folder" in text
+        assert "❌ missing: Not found" in text
+        assert "⚠️ same" in text
+        assert "❌ broken: Error: Connection reset" in text
+        assert "❌ conv-2: Validation error" in text
+        assert mock_update.call_count == 4
+        mock_update.assert_any_call(
+            conversation_id="conv-1", label=None, folder="/archive", importance_score=None
+        )
+
+
+@pytest.mark.asyncio
+async def test_memory_update_batch_rejects_empty_batch():
+    """Test an empty batch is a validation error"""
+    result = await memory_update_batch_tool({"folder": "/archive"})
+
+    assert "Validation error" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_batch_renders_each_conversation():
+    """Test batch context retrieval renders each item in request order"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+
+        async def get_context(conversation_id, **window):
+            if conversation_id == "missing":
+                return {"success": False, "error": "Not found"}
+            if conversation_id == "broken":
+                raise Exception("Timeout")
+            if conversation_id == "partial":
+                return {"success": True, "data": {"label": "No messages key"}}
+            conversation = _long_conversation(4)
+            conversation["data"]["label"] = f"Label {conversation_id}"
+            return conversation
+
+        mock_get.side_effect = get_context
+
+        result = await memory_get_context_batch_tool(
+            {"conversation_ids": ["conv-1", "missing", "conv-2", "broken", "partial"], "tail": 1}
+        )
+
+        text = result[0].text
+        assert "Retrieved 2 of 5 conversations" in text
+        assert "❌ Invalid conversation data: Missing required fields" in text
+        assert text.index("Label conv-1") < text.index("Label conv-2")
+        assert "4. **ASSISTANT**: message 3" in text
+        assert "message 2" not in text
+        assert "Conversation not found: Not found" in text
+        assert "❌ Error: Timeout" in text
+        mock_get.assert_any_call("conv-1", tail=1)
+
+
+@pytest.mark.asyncio
+async def test_memory_get_context_batch_invalid_window():
+    """Test invalid windows are reported per item without calling the controller"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        result = await memory_get_context_batch_tool(
+            {"conversation_ids": ["conv-1"], "tail": 2, "offset": 1}
+        )
+        empty = await memory_get_context_batch_tool({"conversation_ids": []})
+
+        mock_get.assert_not_called()
+        assert "Retrieved 0 of 1" in result[0].text
+        assert "Validation error" in result[0].text
+        assert "Validation error" in empty[0].text
+
+
+# ============================================
+# Memory Profile Tests
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_memory_profile_disabled():
+    """Test the profile tool refuses to run unless profiling is enabled"""
+    with patch("sekha_mcp.tools.memory_profile.settings.profiling_enabled", False):
+        result = await memory_profile_tool({"action": "start"})
+
+    assert "Profiling is disabled" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_memory_profile_start_status_stop(tmp_path):
+    """Test a profile can be started, inspected and stopped through the tool"""
+    profiler = SamplingProfiler(tmp_path, interval=0.001, max_duration=30)
+
+    with (
+        patch("sekha_mcp.tools.memory_profile.settings.profiling_enabled", True),
+        patch("sekha_mcp.tools.memory_profile.profiler", profiler),
+    ):
+        idle = await memory_profile_tool({})
+        started = await memory_profile_tool({"action": "start", "duration_seconds": 120})
+        again = await memory_profile_tool({"action": "start"})
+        status = await memory_profile_tool({"action": "status"})
+        stopped = await memory_profile_tool({"action": "stop"})
+        stopped_again = await memory_profile_tool({"action": "stop"})
+        invalid = await memory_profile_tool({"action": "restart"})
+
+    assert "Profiler idle" in idle[0].text
+    assert "Profiling started for 30s" in started[0].text
+    assert "already running" in again[0].text
+    assert "Profiling:" in status[0].text
+    assert "Profile written to" in stopped[0].text
+    assert str(tmp_path) in stopped[0].text
+    assert "not running" in stopped_again[0].text
+    assert "Last profile" in stopped_again[0].text
+    assert "Validation error" in invalid[0].text
+
+
+# ============================================
+# JSON Output Tests
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_json_output_returns_controller_data():
+    """Test output_format=json returns the controller data as compact JSON"""
+    with (
+        patch("sekha_mcp.client.sekha_client.store_conversation", new=AsyncMock()) as mock_store,
+        patch("sekha_mcp.client.sekha_client.update_conversation", new=AsyncMock()) as mock_upd,
+        patch("sekha_mcp.client.sekha_client.get_stats", new=AsyncMock()) as mock_stats,
+        patch("sekha_mcp.client.sekha_client.prune_memory", new=AsyncMock()) as mock_prune,
+    ):
+        mock_store.return_value = {"success": True, "data": {"conversation_id": "abc"}}
+        mock_upd.return_value = {"success": True, "data": {"updated_fields": ["label"]}}
+        mock_stats.return_value = {"success": True, "data": {"total_conversations": 3}}
+        mock_prune.return_value = {"success": True, "data": {"suggestions": []}}
+
+        stored = await memory_store_tool(
+            {
+                "label": "Test",
+                "folder": "/tests",
+                "messages": [{"role": "user", "content": "Hi"}],
+                "output_format": "json",
+            }
+        )
+        updated = await memory_update_tool(
+            {
+                "conversation_id": "123e4567-e89b-12d3-a456-426614174000",
+                "label": "New",
+                "output_format": "json",
+            }
+        )
+        stats = await memory_stats_tool({"output_format": "json"})
+        pruned = await memory_prune_tool({"output_format": "json"})
+
+    assert json.loads(stored[0].text) == {"conversation_id": "abc"}
+    assert json.loads(updated[0].text) == {"updated_fields": ["label"]}
+    assert json.loads(stats[0].text) == {"total_conversations": 3}
+    assert json.loads(pruned[0].text) == {
+        "suggestions": [],
+        "offset": 0,
+        "has_more": False,
+        "cursor": None,
+    }
+    assert " " not in stored[0].text
+
+
+@pytest.mark.asyncio
+async def test_json_output_errors():
+    """Test errors are returned as {"success": false, "error": ...} in JSON mode"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = {"success": False, "error": "Not found"}
+        missing = await memory_get_context_tool(
+            {"conversation_id": "conv-1", "output_format": "json"}
+        )
+    invalid = await memory_search_tool({"query": "   ", "output_format": "json"})
+
+    assert json.loads(missing[0].text) == {
+        "success": False,
+        "error": "Conversation not found: Not found",
+    }
+    assert json.loads(invalid[0].text)["error"].startswith("Validation error")
+
+
+@pytest.mark.asyncio
+async def test_json_output_get_context_window():
+    """Test JSON context output carries the window and a continuation cursor"""
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(10)
+        result = await memory_get_context_tool(
+            {"conversation_id": "conv-1", "offset": 2, "limit": 3, "output_format": "json"}
+        )
+
+    data = json.loads(result[0].text)
+    assert [m["content"] for m in data["messages"]] == ["message 2", "message 3", "message 4"]
+    assert data["offset"] == 2
+    assert data["total_messages"] == 10
+    assert data["label"] == "Long Conversation"
+    assert data["cursor"]
+
+
+@pytest.mark.asyncio
+async def test_json_output_search_and_recall():
+    """Test JSON search returns raw hits with paging state, recall adds context data"""
+    with (
+        patch("sekha_mcp.client.sekha_client.search_memory", new=AsyncMock()) as mock_search,
+        patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get,
+    ):
+        mock_search.return_value = _search_hits(2)
+        mock_get.side_effect = [_long_conversation(2), Exception("Timeout")]
+
+        search = await memory_search_tool({"query": "q", "limit": 2, "output_format": "json"})
+        recall = await memory_recall_tool({"query": "q", "top_k": 2, "output_format": "json"})
+
+    search_data = json.loads(search[0].text)
+    assert [r["conversation_id"] for r in search_data["results"]] == ["conv-0", "conv-1"]
+    assert search_data["has_more"] is True
+    assert search_data["cursor"]
+
+    recall_data = json.loads(recall[0].text)
+    assert recall_data["query"] == "q"
+    assert recall_data["results"][0]["context"]["label"] == "Long Conversation"
+    assert recall_data["results"][1]["context"] is None
+    assert recall_data["results"][1]["error"] == "Timeout"
+
+
+@pytest.mark.asyncio
+async def test_json_output_batches():
+    """Test batch tools return one record per item in JSON mode"""
+    with (
+        patch("sekha_mcp.client.sekha_client.update_conversation", new=AsyncMock()) as mock_upd,
+        patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get,
+    ):
+        mock_upd.side_effect = [
+            {"success": True, "data": {"updated_fields": ["folder"]}},
+            {"success": False, "error": "Not found"},
+        ]
+        mock_get.side_effect = [_long_conversation(3), {"success": False, "error": "Gone"}]
+
+        updates = await memory_update_batch_tool(
+            {"conversation_ids": ["a", "b"], "folder": "/archive", "output_format": "json"}
+        )
+        contexts = await memory_get_context_batch_tool(
+            {"conversation_ids": ["a", "b"], "tail": 1, "output_format": "json"}
+        )
+
+    update_data = json.loads(updates[0].text)
+    assert update_data["updated"] == 1 and update_data["total"] == 2
+    assert update_data["results"][0]["updated_fields"] == ["folder"]
+    assert update_data["results"][1] == {
+        "conversation_id": "b",
+        "success": False,
+        "error": "Not found",
+    }
+
+    context_data = json.loads(contexts[0].text)
+    assert context_data["retrieved"] == 1
+    assert [m["content"] for m in context_data["results"][0]["messages"]] == ["message 2"]
+    assert context_data["results"][1]["error"] == "Conversation not found: Gone"
+
+
+@pytest.mark.asyncio
+async def test_json_output_export():
+    """Test JSON mode returns compact export records and wraps Markdown"""
+    conv_id = "123e4567-e89b-12d3-a456-426614174000"
+    with patch("sekha_mcp.client.sekha_client.get_context", new=AsyncMock()) as mock_get:
+        mock_get.return_value = _long_conversation(2)
+        as_json = await memory_export_tool({"conversation_id": conv_id, "output_format": "json"})
+        as_markdown = await memory_export_tool(
+            {"conversation_id": conv_id, "format": "markdown", "output_format": "json"}
+        )
+
+    record = json.loads(as_json[0].text)
+    assert record["label"] == "Long Conversation"
+    assert len(record["messages"]) == 2
+    wrapped = json.loads(as_markdown[0].text)
+    assert wrapped["format"] == "markdown"
+    assert wrapped["content"].startswith("# Long Conversation")
+
+
+@pytest.mark.asyncio
+async def test_every_tool_schema_accepts_output_format():
+    """Test each tool advertises the output_format option"""
+    from sekha_mcp.server import list_tools
+    from sekha_mcp.tools import MEMORY_PROFILE_TOOL
+
+    for tool in [*await list_tools(), MEMORY_PROFILE_TOOL]:
+        assert tool.inputSchema["properties"]["output_format"]["enum"] == ["text", "json"]